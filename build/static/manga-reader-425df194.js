@@ -0,0 +1,118 @@
+const mangaData=chapterConfig.manga;let currentPage=1;let viewMode=mangaData.config.view_mode;let imageScaling=mangaData.config.image_scaling;let zoomLevel=mangaData.config.zoom_level;let readingDirection=chapterConfig.readingDirection||mangaData.config.reading_direction;let preloadImages=3;let isFullscreen=false;let originalViewMode=null;let isScrolling=false;let mouseTimer=null;const preloadedImages=new Map();let pageManifest=null;const seamlessConfig=chapterConfig.seamlessTransitions;if(seamlessConfig.enabled){document.documentElement.style.setProperty('--manga-transition-duration',seamlessConfig.duration+'s');}else{document.documentElement.style.setProperty('--manga-transition-duration','0s');}
+document.addEventListener('DOMContentLoaded',function(){handleUrlParameters();initMangaReader();loadPageManifest();setupMangaKeyboardControls();loadMangaSettings();applyMangaSettings();setupFullscreenMode();setupPageCompletionTracking();});function handleUrlParameters(){const urlParams=new URLSearchParams(window.location.search);const pageParam=urlParams.get('page');if(pageParam==='last'){currentPage=mangaData.page_count;}else if(pageParam&&!isNaN(parseInt(pageParam))){currentPage=Math.max(1,Math.min(parseInt(pageParam),mangaData.page_count));}
+if(urlParams.get('fullscreen')==='true'){setTimeout(()=>{toggleFullscreen();},100);}
+if(urlParams.get('fitviewport')==='true'){setTimeout(()=>{const mangaViewer=document.getElementById('manga-viewer');if(mangaViewer){mangaViewer.scrollIntoView({behavior:'smooth',block:'start'});}},100);}
+if(urlParams.get('page')||urlParams.get('fullscreen')||urlParams.get('fitviewport')){showChapterToast(chapterConfig.chapterTitle);}}
+function showChapterToast(chapterTitle){const toast=document.createElement('div');toast.className='chapter-toast';toast.innerHTML=`
+        <div class="toast-content">
+            <span class="toast-icon">📖</span>
+            <span class="toast-text">${chapterTitle}</span>
+        </div>
+    `;document.body.appendChild(toast);setTimeout(()=>{toast.classList.add('show');},10);setTimeout(()=>{toast.classList.remove('show');setTimeout(()=>{document.body.removeChild(toast);},300);},3000);}
+function loadPageManifest(){fetch(mangaData.manifest_url).then(response=>response.ok?response.json():null).then(manifest=>{if(!manifest)return;pageManifest=manifest;applyPagePlaceholders();preloadUpcomingImages();}).catch(error=>console.warn('Failed to load page manifest:',error));}
+function applyPagePlaceholders(){pageManifest.pages.forEach(pageData=>{document.querySelectorAll(`.manga-page[data-page="${pageData.number}"] .manga-image`).forEach(imgElement=>{if(pageData.width&&pageData.height){imgElement.style.aspectRatio=`${pageData.width} / ${pageData.height}`;}
+if(!pageData.placeholder||(imgElement.complete&&imgElement.naturalHeight!==0))return;imgElement.style.backgroundImage=`url("${pageData.placeholder}")`;imgElement.style.backgroundSize='cover';imgElement.addEventListener('load',()=>{imgElement.style.backgroundImage='';},{once:true});});});}
+function preloadUpcomingImages(){if(preloadImages===0)return;const totalPages=mangaData.page_count;preloadImage(currentPage);for(let i=1;i<=preloadImages;i++){const nextPage=currentPage+i;if(nextPage<=totalPages){preloadImage(nextPage);}
+const prevPage=currentPage-i;if(prevPage>=1){setTimeout(()=>preloadImage(prevPage),i*100);}}
+if(preloadImages>=3){setTimeout(()=>{for(let i=preloadImages+1;i<=preloadImages+2;i++){const nextPage=currentPage+i;if(nextPage<=totalPages){preloadImage(nextPage);}}},500);}}
+function preloadImage(pageNumber){const pageKey=`page${pageNumber}`;if(preloadedImages.has(pageKey))return;if(!pageManifest)return;const pageData=pageManifest.pages.find(p=>p.number===pageNumber);if(!pageData)return;preloadedImages.set(pageKey,'loading');const img=new Image();img.onload=()=>{preloadedImages.set(pageKey,img);console.log(`Preloaded page ${pageNumber}`);const imgElement=document.querySelector(`.manga-page[data-page="${pageNumber}"] .manga-image`);if(imgElement){imgElement.classList.remove('loading');imgElement.style.opacity='1';if(imgElement.getAttribute('src')!==pageData.url){imgElement.src=pageData.url;}}};img.onerror=()=>{console.warn(`Failed to preload page ${pageNumber}`);preloadedImages.delete(pageKey);};const isExternal=pageData.url.startsWith('http://')||pageData.url.startsWith('https://');if(isExternal){img.crossOrigin='anonymous';}
+img.decoding='async';img.loading='eager';if(pageData.srcset){img.sizes=pageData.sizes;img.srcset=pageData.srcset;}
+img.src=pageData.url;}
+function initMangaReader(){updatePageIndicator();const allImages=document.querySelectorAll('.manga-image');allImages.forEach(img=>{img.style.opacity='1';img.classList.remove('loading');if(!img.complete||img.naturalHeight===0){img.classList.add('loading');img.onload=function(){this.classList.remove('loading');this.style.opacity='1';};img.onerror=function(){this.classList.remove('loading');this.style.opacity='1';};}});preloadUpcomingImages();document.getElementById('prev-page').addEventListener('click',()=>{if(currentPage<=1){navigateToPreviousChapter();}else{changePage(-1);}});document.getElementById('next-page').addEventListener('click',()=>{if(currentPage>=mangaData.page_count){navigateToNextChapter();}else{changePage(1);}});document.getElementById('fullscreen-btn').addEventListener('click',toggleFullscreen);document.getElementById('manga-settings-btn').addEventListener('click',toggleSettings);document.getElementById('close-settings').addEventListener('click',toggleSettings);document.getElementById('view-mode').addEventListener('change',(e)=>{const oldViewMode=viewMode;viewMode=e.target.value;if((oldViewMode==='scroll'||oldViewMode==='scroll_double')&&(viewMode==='single'||viewMode==='double')){if(viewMode==='double'){currentPage=mangaData.page_count>=2?2:1;}else{currentPage=1;}
+saveMangaSettings();applyMangaSettings();updateFullscreenButtonState();showPage(currentPage);}else{saveMangaSettings();applyMangaSettings();updateFullscreenButtonState();}});document.getElementById('reading-direction').addEventListener('change',(e)=>{readingDirection=e.target.value;saveMangaSettings();applyMangaSettings();});document.getElementById('image-scaling').addEventListener('change',(e)=>{imageScaling=e.target.value;saveMangaSettings();applyMangaSettings();});document.getElementById('preload-images').addEventListener('change',(e)=>{preloadImages=parseInt(e.target.value);saveMangaSettings();preloadedImages.clear();preloadUpcomingImages();});document.getElementById('reset-settings').addEventListener('click',resetMangaSettings);const viewer=document.getElementById('manga-viewer');viewer.addEventListener('click',handleViewerClick);updateFullscreenButtonState();}
+function isPageProperlyPositioned(){if(isFullscreen){return true;}
+const mangaReader=document.getElementById('manga-reader');const controls=document.querySelector('.manga-controls');const controlsHeight=controls?controls.offsetHeight:0;const readerTop=mangaReader.offsetTop;const targetScroll=readerTop+controlsHeight+10;const currentScroll=window.pageYOffset||document.documentElement.scrollTop;return Math.abs(currentScroll-targetScroll)<=100;}
+function scrollToCurrentPage(){const mangaReader=document.getElementById('manga-reader');const controls=document.querySelector('.manga-controls');const controlsHeight=controls?controls.offsetHeight:0;const readerTop=mangaReader.offsetTop;const targetScroll=readerTop+controlsHeight+10;isScrolling=true;window.scrollTo({top:targetScroll,behavior:'smooth'});setTimeout(()=>{isScrolling=false;},500);}
+function changePage(direction){if(viewMode==='scroll'||viewMode==='scroll_double'){handleScrollModeNavigation(direction);return;}
+if(direction===1&&currentPage>=mangaData.page_count){if(!isPageProperlyPositioned()){scrollToCurrentPage();return;}else{navigateToNextChapter();return;}}else if(direction===-1&&currentPage<=1){if(!isPageProperlyPositioned()){scrollToCurrentPage();return;}else{navigateToPreviousChapter();return;}}
+if(!isPageProperlyPositioned()){scrollToCurrentPage();return;}
+let pageStep=1;if(viewMode==='double'){if(direction===1){const pagesRemaining=mangaData.page_count-currentPage;if(pagesRemaining===1){pageStep=1;}else{pageStep=2;}}else{const currentlyShowingTwo=currentPage%2===0||currentPage<mangaData.page_count;pageStep=currentlyShowingTwo?2:1;}}
+const newPage=currentPage+(direction*pageStep);if(newPage>=1&&newPage<=mangaData.page_count){showPage(newPage);}else if(direction===1&&currentPage<mangaData.page_count){showPage(mangaData.page_count);}}
+function handleScrollModeNavigation(direction){const currentPageInView=getCurrentPageInScrollView();if(direction===1){if(currentPageInView>=mangaData.page_count){if(isScrollPageProperlyPositioned(currentPageInView)){navigateToNextChapter();}else{scrollToPage(currentPageInView);}
+return;}
+if(viewMode==='scroll_double'){const nextPagePair=getNextPagePairNumber(currentPageInView);scrollToPage(nextPagePair);}else{scrollToPage(currentPageInView+1);}}else{if(currentPageInView<=1){if(isScrollPageProperlyPositioned(currentPageInView)){navigateToPreviousChapter();}else{scrollToPage(currentPageInView);}
+return;}
+if(viewMode==='scroll_double'){const prevPagePair=getPreviousPagePairNumber(currentPageInView);scrollToPage(prevPagePair);}else{scrollToPage(currentPageInView-1);}}}
+function getPreviousPagePairNumber(currentPageNum){if(viewMode!=='scroll_double'){return currentPageNum-1;}
+const pagePairs=document.querySelectorAll('.page-pair');let pageNumber=1;for(let pair of pagePairs){const pagesInPair=pair.querySelectorAll('.manga-page').length;const pairStart=pageNumber;const pairEnd=pageNumber+pagesInPair-1;if(currentPageNum>=pairStart&&currentPageNum<=pairEnd){return Math.max(1,pairStart-pagesInPair);}
+pageNumber+=pagesInPair;}
+return Math.max(1,currentPageNum-2);}
+function navigateToPreviousChapter(){const prevLink=document.querySelector(`nav.chapter-nav a[href*="../${chapterConfig.prevChapterId || ''}"]`);const tocLink=document.querySelector('nav.chapter-nav a[href*="toc"]');if(prevLink&&chapterConfig.prevChapterId){const url=new URL(prevLink.href,window.location.href);url.searchParams.set('page','last');if(isFullscreen){url.searchParams.set('fullscreen','true');}else{url.searchParams.set('fitviewport','true');}
+window.location.href=url.toString();}else if(tocLink){window.location.href=tocLink.href;}}
+function navigateToNextChapter(){const nextLink=document.querySelector(`nav.chapter-nav a[href*="../${chapterConfig.nextChapterId || ''}"]`);const tocLink=document.querySelector('nav.chapter-nav a[href*="toc"]');if(nextLink&&chapterConfig.nextChapterId){const url=new URL(nextLink.href,window.location.href);url.searchParams.set('page','1');if(isFullscreen){url.searchParams.set('fullscreen','true');}else{url.searchParams.set('fitviewport','true');}
+window.location.href=url.toString();}else if(tocLink){window.location.href=tocLink.href;}}
+function showPage(pageNum){const currentScrollTop=window.pageYOffset||document.documentElement.scrollTop;const mangaReader=document.getElementById('manga-reader');const readerTop=mangaReader.offsetTop;const relativeScroll=currentScrollTop-readerTop;currentPage=pageNum;updatePageIndicator();const viewer=document.getElementById('manga-viewer');if(viewMode==='single'&&seamlessConfig.enabled&&viewer.classList.contains('seamless-mode')){showPageSeamless(pageNum);return;}
+const newPageEl=document.querySelector(`.manga-page[data-page="${pageNum}"]`);if(newPageEl){const imgElement=newPageEl.querySelector('.manga-image');const pageKey=`page${pageNum}`;const preloadedImg=preloadedImages.get(pageKey);if(imgElement){if(preloadedImg&&preloadedImg!=='loading'){imgElement.src=preloadedImg.src;imgElement.classList.remove('loading');if(imgElement.complete){imgElement.style.opacity='1';}}else{imgElement.classList.remove('loading');imgElement.style.opacity='1';if(!imgElement.complete||imgElement.naturalHeight===0){imgElement.classList.add('loading');imgElement.onload=function(){this.classList.remove('loading');this.style.opacity='1';};}}}}
+applyViewMode();setTimeout(()=>{const controls=document.querySelector('.manga-controls');const controlsHeight=controls?controls.offsetHeight:0;const targetScroll=readerTop+controlsHeight+10;window.scrollTo({top:targetScroll,behavior:'smooth'});},50);preloadUpcomingImages();if(window.mangaCompletionCheck){window.mangaCompletionCheck(pageNum);}}
+function showPageSeamless(pageNum){const pages=document.querySelectorAll('.manga-page');const totalPages=mangaData.page_count;pages.forEach(page=>{page.classList.remove('current','next','prev');});pages.forEach((page,index)=>{const thisPageNum=index+1;if(thisPageNum===pageNum){page.classList.add('current');const imgElement=page.querySelector('.manga-image');const pageKey=`page${pageNum}`;const preloadedImg=preloadedImages.get(pageKey);if(imgElement&&preloadedImg&&preloadedImg!=='loading'){imgElement.src=preloadedImg.src;imgElement.classList.remove('loading');imgElement.style.opacity='1';}}else if(thisPageNum===pageNum+1&&pageNum<totalPages){page.classList.add('next');const nextImgElement=page.querySelector('.manga-image');const nextPageKey=`page${thisPageNum}`;const nextPreloadedImg=preloadedImages.get(nextPageKey);if(nextImgElement&&nextPreloadedImg&&nextPreloadedImg!=='loading'){nextImgElement.src=nextPreloadedImg.src;nextImgElement.classList.remove('loading');nextImgElement.style.opacity='1';}else{preloadImage(thisPageNum);}}else if(thisPageNum===pageNum-1&&pageNum>1){page.classList.add('prev');const prevImgElement=page.querySelector('.manga-image');const prevPageKey=`page${thisPageNum}`;const prevPreloadedImg=preloadedImages.get(prevPageKey);if(prevImgElement&&prevPreloadedImg&&prevPreloadedImg!=='loading'){prevImgElement.src=prevPreloadedImg.src;prevImgElement.classList.remove('loading');prevImgElement.style.opacity='1';}else{preloadImage(thisPageNum);}}});if(pageNum+2<=totalPages){preloadImage(pageNum+2);}
+if(pageNum-2>=1){preloadImage(pageNum-2);}
+setTimeout(()=>{const mangaReader=document.getElementById('manga-reader');const controls=document.querySelector('.manga-controls');const controlsHeight=controls?controls.offsetHeight:0;const readerTop=mangaReader.offsetTop;const targetScroll=readerTop+controlsHeight+10;window.scrollTo({top:targetScroll,behavior:'smooth'});},50);if(window.mangaCompletionCheck){window.mangaCompletionCheck(pageNum);}}
+function updatePageIndicator(){document.getElementById('current-page').textContent=currentPage;document.getElementById('total-pages').textContent=mangaData.page_count;document.getElementById('prev-page').disabled=currentPage===1;document.getElementById('next-page').disabled=currentPage===mangaData.page_count;}
+function toggleSettings(){const modal=document.getElementById('manga-settings-modal');const controls=document.querySelector('.manga-controls');const shortcuts=document.querySelector('.manga-shortcuts');const isVisible=modal.style.display!=='none'&&modal.style.display!=='';modal.style.display=isVisible?'none':'flex';if(controls){controls.style.pointerEvents=isVisible?'auto':'none';}
+if(shortcuts){shortcuts.style.pointerEvents=isVisible?'auto':'none';}
+if(!isVisible){if(isFullscreen&&controls){controls.classList.remove('show');}
+document.getElementById('view-mode').value=viewMode;document.getElementById('reading-direction').value=readingDirection;document.getElementById('image-scaling').value=imageScaling;document.getElementById('preload-images').value=preloadImages;}}
+function handleViewerClick(e){const viewer=document.getElementById('manga-viewer');if(viewer.classList.contains('scroll-mode')){handleScrollModeClick(e);return;}
+if(viewer.classList.contains('scroll-double-mode')){handleScrollModeClick(e);return;}
+if(viewMode==='double'){const clickedPage=e.target.closest('.manga-page');if(clickedPage){const pageNum=parseInt(clickedPage.getAttribute('data-page'));const visiblePages=document.querySelectorAll('.manga-page.active');if(visiblePages.length===2){const firstPageNum=parseInt(visiblePages[0].getAttribute('data-page'));const secondPageNum=parseInt(visiblePages[1].getAttribute('data-page'));if(pageNum===firstPageNum){if(readingDirection==='rtl'){if(currentPage>=mangaData.page_count){navigateToNextChapter();}else{changePage(1);}}else{if(currentPage<=1){navigateToPreviousChapter();}else{changePage(-1);}}
+return;}else if(pageNum===secondPageNum){if(readingDirection==='rtl'){if(currentPage<=1){navigateToPreviousChapter();}else{changePage(-1);}}else{if(currentPage>=mangaData.page_count){navigateToNextChapter();}else{changePage(1);}}
+return;}}}}
+const rect=e.currentTarget.getBoundingClientRect();const clickX=e.clientX-rect.left;const width=rect.width;const isLeftHalf=clickX<width*0.5;const isRightHalf=clickX>=width*0.5;const isRTL=readingDirection==='rtl';if(isLeftHalf){if(isRTL){if(currentPage>=mangaData.page_count){navigateToNextChapter();}else{changePage(1);}}else{if(currentPage<=1){navigateToPreviousChapter();}else{changePage(-1);}}}else if(isRightHalf){if(isRTL){if(currentPage<=1){navigateToPreviousChapter();}else{changePage(-1);}}else{if(currentPage>=mangaData.page_count){navigateToNextChapter();}else{changePage(1);}}}}
+function handleScrollModeClick(e){const clickedPage=e.target.closest('.manga-page');let targetPageNum=null;if(clickedPage){targetPageNum=parseInt(clickedPage.getAttribute('data-page'));}else{targetPageNum=getCurrentPageInScrollView();}
+const totalPages=mangaData.page_count;if(!isScrollPageProperlyPositioned(targetPageNum)){scrollToPage(targetPageNum);return;}
+if(targetPageNum>=totalPages){navigateToNextChapter();}else{const viewer=document.getElementById('manga-viewer');if(viewer.classList.contains('scroll-double-mode')){const nextPagePair=getNextPagePairNumber(targetPageNum);scrollToPage(nextPagePair);}else{scrollToPage(targetPageNum+1);}}}
+function getNextPagePairNumber(currentPageNum){const viewer=document.getElementById('manga-viewer');if(!viewer.classList.contains('scroll-double-mode')){return currentPageNum+1;}
+const pagePairs=document.querySelectorAll('.page-pair');let pageNumber=1;for(let pair of pagePairs){const pagesInPair=pair.querySelectorAll('.manga-page').length;if(currentPageNum>=pageNumber&&currentPageNum<pageNumber+pagesInPair){return pageNumber+pagesInPair;}
+pageNumber+=pagesInPair;}
+return currentPageNum+1;}
+function isScrollPageProperlyPositioned(pageNum){if(isFullscreen){return true;}
+const viewer=document.getElementById('manga-viewer');const viewportTop=window.pageYOffset;const viewportHeight=window.innerHeight;if(viewer.classList.contains('scroll-double-mode')){const pagePairs=document.querySelectorAll('.page-pair');let currentPageNumber=1;for(let pair of pagePairs){const pagesInPair=pair.querySelectorAll('.manga-page').length;if(pageNum>=currentPageNumber&&pageNum<currentPageNumber+pagesInPair){const pairTop=pair.getBoundingClientRect().top+viewportTop;const targetScroll=pairTop-10;return Math.abs(viewportTop-targetScroll)<=50;}
+currentPageNumber+=pagesInPair;}}else{const targetPage=document.querySelector(`.manga-page[data-page="${pageNum}"]`);if(targetPage){const pageTop=targetPage.getBoundingClientRect().top+viewportTop;const targetScroll=pageTop-10;return Math.abs(viewportTop-targetScroll)<=50;}}
+return false;}
+function getCurrentPageInScrollView(){const viewer=document.getElementById('manga-viewer');const viewportTop=window.pageYOffset;const viewportMiddle=viewportTop+(window.innerHeight/2);if(viewer.classList.contains('scroll-double-mode')){const pagePairs=document.querySelectorAll('.page-pair');let currentPageNumber=1;for(let i=0;i<pagePairs.length;i++){const pair=pagePairs[i];const pairTop=pair.getBoundingClientRect().top+viewportTop;const pairBottom=pairTop+pair.offsetHeight;if(viewportMiddle>=pairTop&&viewportMiddle<=pairBottom){const pagesInPair=pair.querySelectorAll('.manga-page');return currentPageNumber+pagesInPair.length-1;}
+currentPageNumber+=pair.querySelectorAll('.manga-page').length;}
+return mangaData.page_count;}else{const pages=document.querySelectorAll('.manga-page');for(let i=0;i<pages.length;i++){const page=pages[i];const pageTop=page.getBoundingClientRect().top+viewportTop;const pageBottom=pageTop+page.offsetHeight;if(viewportMiddle>=pageTop&&viewportMiddle<=pageBottom){return i+1;}}
+for(let i=pages.length-1;i>=0;i--){const page=pages[i];const pageTop=page.getBoundingClientRect().top+viewportTop;if(pageTop<=viewportMiddle){return i+1;}}
+return 1;}}
+function scrollToPage(pageNumber){const viewer=document.getElementById('manga-viewer');if(viewer.classList.contains('scroll-double-mode')){const pagePairs=document.querySelectorAll('.page-pair');let currentPageNum=1;for(let i=0;i<pagePairs.length;i++){const pair=pagePairs[i];const pagesInPair=pair.querySelectorAll('.manga-page');const pairStartPage=currentPageNum;const pairEndPage=currentPageNum+pagesInPair.length-1;if(pageNumber>=pairStartPage&&pageNumber<=pairEndPage){pair.scrollIntoView({behavior:'smooth',block:'start'});currentPage=pageNumber;updatePageIndicator();return;}
+currentPageNum+=pagesInPair.length;}}else{const targetPage=document.querySelector(`.manga-page[data-page="${pageNumber}"]`);if(targetPage){targetPage.scrollIntoView({behavior:'smooth',block:'start'});currentPage=pageNumber;updatePageIndicator();}}}
+function setupMangaKeyboardControls(){document.addEventListener('keydown',function(e){if(e.target.tagName==='INPUT'||e.target.tagName==='SELECT'){return;}
+switch(e.key){case'ArrowLeft':case'a':case'A':e.preventDefault();if(isScrolling)return;changePage(-1);break;case'ArrowRight':case'd':case'D':e.preventDefault();if(isScrolling)return;changePage(1);break;case'Home':e.preventDefault();showPage(1);break;case'End':e.preventDefault();showPage(mangaData.page_count);break;case'Escape':const modal=document.getElementById('manga-settings-modal');if(modal.style.display!=='none'&&modal.style.display!==''){modal.style.display='none';const controls=document.querySelector('.manga-controls');const shortcuts=document.querySelector('.manga-shortcuts');if(controls)controls.style.pointerEvents='auto';if(shortcuts)shortcuts.style.pointerEvents='auto';}
+break;}});}
+function loadMangaSettings(){const saved=localStorage.getItem('manga-reader-settings');if(saved){const settings=JSON.parse(saved);viewMode=settings.viewMode||viewMode;imageScaling=settings.imageScaling||imageScaling;zoomLevel=settings.zoomLevel||zoomLevel;preloadImages=settings.preloadImages!==undefined?settings.preloadImages:preloadImages;if(settings.readingDirection){readingDirection=settings.readingDirection;}}}
+function saveMangaSettings(){const settings={viewMode,imageScaling,zoomLevel,preloadImages,readingDirection};localStorage.setItem('manga-reader-settings',JSON.stringify(settings));}
+function applyImageScaling(){const viewer=document.getElementById('manga-viewer');const images=viewer.querySelectorAll('.manga-image');images.forEach((img,index)=>{const page=img.closest('.manga-page');const zoomFactor=zoomLevel/100;img.style.transform='none';switch(imageScaling){case'fit_screen':const maxWidth=Math.min(100,100/zoomFactor);const maxHeight=Math.min(100,100/zoomFactor);img.style.maxWidth=`${maxWidth}vw`;img.style.maxHeight=`${maxHeight}vh`;img.style.width=`${100 * zoomFactor}%`;img.style.height='auto';break;case'fit_width':const effectiveWidth=Math.min(100,100/zoomFactor);img.style.maxWidth=`${effectiveWidth}vw`;img.style.maxHeight='none';img.style.width=`${100 * zoomFactor}%`;img.style.height='auto';break;case'original':img.style.maxWidth=`${100 / zoomFactor}vw`;img.style.maxHeight='none';img.style.width=`${100 * zoomFactor}%`;img.style.height='auto';break;}
+if(page){page.style.overflow='visible';if(viewMode==='scroll'){page.style.maxWidth='100vw';page.style.overflowX='hidden';}}});}
+function applyMangaSettings(){const viewer=document.getElementById('manga-viewer');viewer.setAttribute('data-reading-direction',readingDirection);applyViewMode();applyImageScaling();updateFullscreenButtonState();}
+function updateFullscreenButtonState(){const fullscreenBtn=document.getElementById('fullscreen-btn');if(fullscreenBtn){const isScrollMode=viewMode==='scroll'||viewMode==='scroll_double';if(isScrollMode){fullscreenBtn.disabled=true;fullscreenBtn.title='Fullscreen is not available in vertical scroll modes';fullscreenBtn.setAttribute('aria-label','Fullscreen disabled in scroll modes');}else{fullscreenBtn.disabled=false;fullscreenBtn.title='Toggle fullscreen (F)';fullscreenBtn.setAttribute('aria-label','Toggle fullscreen');}}}
+function resetMangaSettings(){viewMode=mangaData.config.view_mode;imageScaling=mangaData.config.image_scaling;zoomLevel=mangaData.config.zoom_level;preloadImages=3;saveMangaSettings();applyMangaSettings();preloadedImages.clear();preloadUpcomingImages();document.getElementById('view-mode').value=viewMode;document.getElementById('image-scaling').value=imageScaling;document.getElementById('preload-images').value=preloadImages;}
+function toggleFullscreen(){const reader=document.getElementById('manga-reader');if(!isFullscreen){if(reader.requestFullscreen){reader.requestFullscreen();}else if(reader.webkitRequestFullscreen){reader.webkitRequestFullscreen();}else if(reader.msRequestFullscreen){reader.msRequestFullscreen();}else if(reader.mozRequestFullScreen){reader.mozRequestFullScreen();}}else{if(document.exitFullscreen){document.exitFullscreen();}else if(document.webkitExitFullscreen){document.webkitExitFullscreen();}else if(document.msExitFullscreen){document.msExitFullscreen();}else if(document.mozCancelFullScreen){document.mozCancelFullScreen();}}}
+function setupFullscreenMode(){document.addEventListener('fullscreenchange',handleFullscreenChange);document.addEventListener('webkitfullscreenchange',handleFullscreenChange);document.addEventListener('mozfullscreenchange',handleFullscreenChange);document.addEventListener('MSFullscreenChange',handleFullscreenChange);document.addEventListener('keydown',function(e){if(e.key==='Escape'&&isFullscreen){toggleFullscreen();}});}
+function handleFullscreenChange(){const reader=document.getElementById('manga-reader');const isCurrentlyFullscreen=!!(document.fullscreenElement||document.webkitFullscreenElement||document.mozFullScreenElement||document.msFullscreenElement);isFullscreen=isCurrentlyFullscreen;if(isFullscreen){reader.classList.add('fullscreen');document.body.style.overflow='hidden';if(!CSS.supports('selector(:has(*))')){document.body.classList.add('manga-fullscreen-active');}
+originalViewMode=viewMode;if(viewMode==='scroll'){viewMode='single';applyMangaSettings();}else if(viewMode==='scroll_double'){viewMode='double';applyMangaSettings();}
+if(window.matchMedia('(max-width: 768px) and (pointer: coarse)').matches){document.documentElement.style.setProperty('--fullscreen-vh',`${window.innerHeight}px`);const metaViewport=document.querySelector('meta[name="viewport"]');if(metaViewport){metaViewport.setAttribute('data-original-content',metaViewport.content);metaViewport.content='width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=0';}}
+setupFullscreenMouseEvents();hideFullscreenControls();}else{reader.classList.remove('fullscreen');document.body.style.overflow='';document.body.classList.remove('manga-fullscreen-active');if(originalViewMode!==null){viewMode=originalViewMode;originalViewMode=null;applyMangaSettings();}
+if(window.matchMedia('(max-width: 768px) and (pointer: coarse)').matches){document.documentElement.style.removeProperty('--fullscreen-vh');const metaViewport=document.querySelector('meta[name="viewport"]');if(metaViewport&&metaViewport.hasAttribute('data-original-content')){metaViewport.content=metaViewport.getAttribute('data-original-content');metaViewport.removeAttribute('data-original-content');}}
+showFullscreenControls();cleanupFullscreenMouseEvents();}}
+function setupFullscreenMouseEvents(){const controls=document.querySelector('.manga-controls');document.addEventListener('mousemove',handleFullscreenMouseMove);document.addEventListener('mouseleave',hideFullscreenControls);}
+function cleanupFullscreenMouseEvents(){document.removeEventListener('mousemove',handleFullscreenMouseMove);document.removeEventListener('mouseleave',hideFullscreenControls);}
+function handleFullscreenMouseMove(e){const controls=document.querySelector('.manga-controls');const modal=document.getElementById('manga-settings-modal');const isModalOpen=modal&&modal.style.display!=='none'&&modal.style.display!=='';if(e.clientY<100&&!isModalOpen){showFullscreenControls();if(mouseTimer){clearTimeout(mouseTimer);}
+mouseTimer=setTimeout(()=>{hideFullscreenControls();},3000);}else{hideFullscreenControls();}}
+function showFullscreenControls(){const controls=document.querySelector('.manga-controls');if(isFullscreen){controls.classList.add('show');}}
+function hideFullscreenControls(){const controls=document.querySelector('.manga-controls');if(isFullscreen){controls.classList.remove('show');}}
+function zoomToFit(){const viewportHeight=window.innerHeight*0.9;const currentImage=document.querySelector(`.manga-page[data-page="${currentPage}"] .manga-image`);if(currentImage){const originalStyles={width:currentImage.style.width,height:currentImage.style.height,maxWidth:currentImage.style.maxWidth,maxHeight:currentImage.style.maxHeight,transform:currentImage.style.transform};currentImage.style.width='auto';currentImage.style.height='auto';currentImage.style.maxWidth='none';currentImage.style.maxHeight='none';currentImage.style.transform='none';currentImage.offsetHeight;const naturalHeight=currentImage.getBoundingClientRect().height;Object.assign(currentImage.style,originalStyles);const targetZoom=Math.floor((viewportHeight/naturalHeight)*100);zoomLevel=Math.max(50,Math.min(300,targetZoom));saveMangaSettings();applyMangaSettings();const mangaReader=document.getElementById('manga-reader');mangaReader.scrollIntoView({behavior:'smooth',block:'start'});}}
+function setupPageCompletionTracking(){window.mangaCompletionCheck=function(pageNum){if(pageNum===mangaData.page_count){console.log('Marking manga chapter as completed - reached last page');markChapterCompleted(chapterConfig.novelSlug,chapterConfig.chapterId);}};}
+function applyViewMode(){const viewer=document.getElementById('manga-viewer');viewer.classList.remove('double-page','scroll-mode','scroll-double-mode','original-size','seamless-mode');restoreOriginalStructure();const pages=viewer.querySelectorAll('.manga-page');pages.forEach(page=>{page.classList.remove('current','next','prev');page.style.position='';page.style.opacity='';page.style.zIndex='';});switch(viewMode){case'double':viewer.classList.add('double-page');setupDoublePage();break;case'scroll':viewer.classList.add('scroll-mode');setupScrollMode();break;case'scroll_double':viewer.classList.add('scroll-double-mode');setupScrollDoublePage();break;default:setupSinglePage();break;}
+if(imageScaling==='original'){viewer.classList.add('original-size');}}
+function restoreOriginalStructure(){const viewer=document.getElementById('manga-viewer');const pagePairs=viewer.querySelectorAll('.page-pair');if(pagePairs.length>0){const originalPages=[];pagePairs.forEach(pair=>{const pagesInPair=pair.querySelectorAll('.manga-page');pagesInPair.forEach(page=>{page.classList.remove('active','single-cover','current','next','prev');page.style.display='';originalPages.push(page);});});viewer.innerHTML='';originalPages.forEach(page=>{viewer.appendChild(page);});}}
+function setupSinglePage(){const viewer=document.getElementById('manga-viewer');const pages=document.querySelectorAll('.manga-page');if(seamlessConfig.enabled){viewer.classList.add('seamless-mode');}else{viewer.classList.remove('seamless-mode');}
+if(seamlessConfig.enabled){pages.forEach((page,index)=>{const pageNum=index+1;page.style.display='flex';page.classList.remove('active','single-cover','current','next','prev');if(pageNum===currentPage){page.classList.add('current');}else if(pageNum===currentPage+1){page.classList.add('next');preloadImage(pageNum);}else if(pageNum===currentPage-1){page.classList.add('prev');}});}else{pages.forEach((page,index)=>{page.style.display=(index+1===currentPage)?'flex':'none';page.classList.remove('active','single-cover','current','next','prev');});}}
+function setupDoublePage(){const pages=document.querySelectorAll('.manga-page');const coverSeparate=!!mangaData.config.cover_separate;pages.forEach(page=>{page.style.display='none';page.classList.remove('active','single-cover');});if(coverSeparate&&currentPage===1){const firstPage=document.querySelector('.manga-page[data-page="1"]');if(firstPage){firstPage.style.display='block';firstPage.classList.add('active','single-cover');}}else{let leftPage,rightPage;if(coverSeparate){if(currentPage===2){leftPage=2;rightPage=3;}else if(currentPage%2===0){leftPage=currentPage;rightPage=currentPage+1;}else{leftPage=currentPage-1;rightPage=currentPage;}}else{if(currentPage%2===1){leftPage=currentPage;rightPage=currentPage+1;}else{leftPage=currentPage-1;rightPage=currentPage;}}
+if(leftPage>=1&&leftPage<=mangaData.page_count){const leftPageEl=document.querySelector(`.manga-page[data-page="${leftPage}"]`);if(leftPageEl){leftPageEl.style.display='block';leftPageEl.classList.add('active');}}
+if(rightPage>=1&&rightPage<=mangaData.page_count){const rightPageEl=document.querySelector(`.manga-page[data-page="${rightPage}"]`);if(rightPageEl){rightPageEl.style.display='block';rightPageEl.classList.add('active');}}}}
+function setupScrollMode(){const pages=document.querySelectorAll('.manga-page');pages.forEach(page=>{page.style.display='block';page.classList.remove('active','single-cover');});}
+function setupScrollDoublePage(){const viewer=document.getElementById('manga-viewer');const pages=document.querySelectorAll('.manga-page');const coverSeparate=!!mangaData.config.cover_separate;const totalPages=pages.length;viewer.innerHTML='';let pageIndex=0;if(coverSeparate&&totalPages>0){const coverPair=document.createElement('div');coverPair.className='page-pair single-page';const coverPage=pages[0].cloneNode(true);coverPage.classList.remove('active','single-cover');coverPair.appendChild(coverPage);viewer.appendChild(coverPair);pageIndex=1;}
+while(pageIndex<totalPages){const pair=document.createElement('div');pair.className='page-pair';if(pageIndex<totalPages){const page1=pages[pageIndex].cloneNode(true);page1.classList.remove('active','single-cover');pair.appendChild(page1);pageIndex++;}
+if(pageIndex<totalPages){const page2=pages[pageIndex].cloneNode(true);page2.classList.remove('active','single-cover');pair.appendChild(page2);pageIndex++;}else{pair.classList.add('single-page');}
+viewer.appendChild(pair);}
+viewer.setAttribute('data-reading-direction',readingDirection);setTimeout(()=>{applyImageScaling();},10);}
\ No newline at end of file
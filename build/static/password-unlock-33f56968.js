@@ -0,0 +1,7 @@
+function sha256(str){const msgBuffer=new TextEncoder().encode(str);return crypto.subtle.digest('SHA-256',msgBuffer).then(hashBuffer=>{const hashArray=Array.from(new Uint8Array(hashBuffer));return hashArray.map(b=>b.toString(16).padStart(2,'0')).join('');});}
+function xorDecrypt(encryptedBase64,password){return sha256(password).then(hashHex=>{const key=new Uint8Array(hashHex.match(/.{1,2}/g).map(byte=>parseInt(byte,16)));const encrypted=Uint8Array.from(atob(encryptedBase64),c=>c.charCodeAt(0));const decrypted=new Uint8Array(encrypted.length);for(let i=0;i<encrypted.length;i++){decrypted[i]=encrypted[i]^key[i%key.length];}
+return new TextDecoder().decode(decrypted);});}
+function verifyPassword(password){return sha256(password).then(hash=>{return hash.substring(0,16)===chapterConfig.passwordHash;});}
+function unlockContent(){const passwordInput=document.getElementById('password-input');const password=passwordInput.value;const errorMsg=document.getElementById('password-error');const loadingMsg=document.getElementById('password-loading');if(!password){errorMsg.textContent='Please enter a password.';errorMsg.style.display='block';return;}
+errorMsg.style.display='none';loadingMsg.style.display='block';verifyPassword(password).then(isValid=>{loadingMsg.style.display='none';if(isValid){xorDecrypt(chapterConfig.encryptedContent,password).then(decryptedContent=>{document.getElementById('chapter-content-wrapper').innerHTML=decryptedContent;document.getElementById('password-protection-form').style.display='none';if(typeof window.initializeUtterances==='function'){setTimeout(()=>window.initializeUtterances(),100);}});}else{errorMsg.textContent='Invalid password. Please try again.';errorMsg.style.display='block';}});}
+document.addEventListener('DOMContentLoaded',function(){const passwordInput=document.getElementById('password-input');if(passwordInput){passwordInput.addEventListener('keypress',function(e){if(e.key==='Enter'){unlockContent();}});}});
\ No newline at end of file
@@ -1,18 +1,28 @@
 import os
 import shutil
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, pass_context
 import markdown
 import yaml
 import re
 import glob
 from pathlib import Path
 import hashlib
+import html
+import posixpath
 import base64
 import json
 import datetime
 import argparse
-from urllib.parse import urljoin, urlparse
-from urllib.request import urlopen
+import sys
+import time
+import io
+import contextlib
+import itertools
+import concurrent.futures
+import importlib.util
+import threading
+from urllib.parse import unquote, urljoin, urlparse
+from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 from bs4 import BeautifulSoup
 # Lazy import for optional dependencies
@@ -52,9 +62,21 @@ CONTENT_DIR = "./content"
 PAGES_DIR = "./pages"
 TEMPLATES_DIR = "./templates"
 STATIC_DIR = "./static"
+CACHE_DIR = "./.cache"
+
+TEMPLATE_BYTECODE_CACHE_DIR = os.path.join(CACHE_DIR, "jinja")
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """Jinja2 bytecode cache that creates its directory on first write"""
+    def dump_bytecode(self, bucket):
+        os.makedirs(self.directory, exist_ok=True)
+        super().dump_bytecode(bucket)
+
+# Compiled templates shared by every environment, worker process and build (validated against the source)
+template_bytecode_cache = TemplateBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIR)
 
 # Global template environment (will be enhanced with novel-specific support)
-env = Environment(loader=FileSystemLoader(TEMPLATES_DIR))
+env = Environment(loader=FileSystemLoader(TEMPLATES_DIR), bytecode_cache=template_bytecode_cache)
 
 # Global asset map for cache busting
 ASSET_MAP = {}
@@ -63,8 +85,13 @@ def asset_url(filename):
     """Convert asset filename to cache-busted version if available"""
     return ASSET_MAP.get(filename, filename)
 
+@pass_context
+def asset_url_filter(context, filename):
+    """Jinja2 asset_url filter; taking the context stops Jinja folding asset names into cached bytecode"""
+    return asset_url(filename)
+
 # Register the asset_url filter
-env.filters['asset_url'] = asset_url
+env.filters['asset_url'] = asset_url_filter
 
 # Cache for novel-specific template environments
 _novel_template_envs = {}
@@ -88,13 +115,13 @@ def get_novel_template_env(novel_slug):
     if novel_slug not in _novel_template_envs:
         template_dirs = get_novel_template_directories(novel_slug)
         loader = FileSystemLoader(template_dirs)
-        novel_env = Environment(loader=loader)
+        novel_env = Environment(loader=loader, bytecode_cache=template_bytecode_cache)
         
         # Add the same filters as the global environment
         novel_env.filters['slugify_tag'] = slugify_tag
         novel_env.filters['format_date_for_display'] = format_date_for_display
         novel_env.filters['find_author_username'] = find_author_username_filter
-        novel_env.filters['asset_url'] = asset_url
+        novel_env.filters['asset_url'] = asset_url_filter
         
         # Note: is_chapter_new filter will be set per render with proper config
         
@@ -102,6 +129,26 @@ def get_novel_template_env(novel_slug):
     
     return _novel_template_envs[novel_slug]
 
+def precompile_templates():
+    """Compile the global templates and every novel's template chain into the bytecode cache"""
+    print("Precompiling templates...")
+    environments = [("global", env)]
+    if os.path.exists(CONTENT_DIR):
+        for novel_slug in sorted(os.listdir(CONTENT_DIR)):
+            if check_novel_has_custom_templates(novel_slug):
+                environments.append((novel_slug, get_novel_template_env(novel_slug)))
+    
+    compiled = 0
+    for name, template_env in environments:
+        for template_name in template_env.list_templates(extensions=['html', 'xml', 'txt']):
+            try:
+                template_env.get_template(template_name)
+                compiled += 1
+            except Exception as e:
+                print(f"  [ERROR] Failed to compile {template_name} ({name}): {e}")
+    
+    print(f"[INFO] Compiled {compiled} templates into {TEMPLATE_BYTECODE_CACHE_DIR}")
+
 def check_novel_has_custom_templates(novel_slug):
     """Check if a novel has any custom templates"""
     novel_templates_dir = os.path.join(CONTENT_DIR, novel_slug, "templates")
@@ -765,13 +812,288 @@ def minify_js_content(js_content):
         print(f"    Warning: JavaScript minification failed: {e}")
         return js_content
 
+# Development server output store: rendered pages kept in memory while --serve is running,
+# keyed by their path relative to BUILD_DIR
+_served_outputs = None
+_served_outputs_lock = threading.Lock()
+_served_outputs_script = b''
+# Outputs changed since the last live-reload broadcast ('all' after the build directory is wiped), and
+# the pages among them whose change is confined to the chapter text
+_served_changes = {'paths': set(), 'body_only': set(), 'all': False}
+# Cache-busting hashes in asset references, ignored when deciding whether a page's content changed
+ASSET_HASH_PATTERN = re.compile(rb'-[0-9a-f]{8}(\.(?:css|js))\b')
+# The chapter text element that live reload can replace in place, and the div tags nested inside it
+CHAPTER_CONTENT_WRAPPER_PATTERN = re.compile(rb'<div\b[^>]*\bid=["\']?chapter-content-wrapper\b[^>]*>', re.IGNORECASE)
+DIV_TAG_PATTERN = re.compile(rb'<(/?)div\b[^>]*>', re.IGNORECASE)
+
+def enable_served_outputs(reload_script=''):
+    """Start keeping rendered pages in memory, with the live-reload script injected"""
+    global _served_outputs, _served_outputs_script
+    with _served_outputs_lock:
+        _served_outputs = {}
+        _served_outputs_script = reload_script.encode('utf-8')
+
+def page_frame_digest(content):
+    """Digest of a page without the contents of #chapter-content-wrapper, or None if it has no such element"""
+    wrapper = CHAPTER_CONTENT_WRAPPER_PATTERN.search(content)
+    if not wrapper:
+        return None
+    depth = 1
+    for tag in DIV_TAG_PATTERN.finditer(content, wrapper.end()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            frame = content[:wrapper.end()] + content[tag.start():]
+            return hashlib.sha1(ASSET_HASH_PATTERN.sub(rb'\1', frame)).hexdigest()
+    return None
+
+def served_output_key(file_path):
+    """Path of a build file relative to BUILD_DIR, as used by the output store"""
+    return os.path.relpath(file_path, BUILD_DIR).replace(os.sep, '/')
+
+def publish_served_output(file_path, content, track_change=True):
+    """Store a page's bytes for the development server, injecting the reload script once"""
+    if _served_outputs is None:
+        return
+    if _served_outputs_script and b'</body>' in content:
+        content = content.replace(b'</body>', _served_outputs_script + b'</body>', 1)
+    entry = {
+        'body': content,
+        'etag': '"' + hashlib.sha1(content).hexdigest() + '"',
+        # A stylesheet or script changing renames it in every page; that alone is not a page change
+        'content_digest': hashlib.sha1(ASSET_HASH_PATTERN.sub(rb'\1', content)).hexdigest(),
+        # Navigation, comments and the manga reader sit outside the chapter text and need a full reload
+        'frame_digest': page_frame_digest(content)
+    }
+    key = served_output_key(file_path)
+    with _served_outputs_lock:
+        previous = _served_outputs.get(key)
+        _served_outputs[key] = entry
+        # Only pages already served can be open in a browser, so only those are reported
+        if track_change and previous is not None and previous['content_digest'] != entry['content_digest']:
+            # A page stays body-only only while every change to it since the last broadcast was
+            body_only = (entry['frame_digest'] is not None and previous['frame_digest'] == entry['frame_digest']
+                         and (key not in _served_changes['paths'] or key in _served_changes['body_only']))
+            _served_changes['paths'].add(key)
+            if body_only:
+                _served_changes['body_only'].add(key)
+            else:
+                _served_changes['body_only'].discard(key)
+
+def get_served_output(file_path):
+    """Return the stored page for a build file, loading it from disk on first request"""
+    if _served_outputs is None:
+        return None
+    key = served_output_key(file_path)
+    with _served_outputs_lock:
+        entry = _served_outputs.get(key)
+    if entry is None and os.path.isfile(file_path):
+        with open(file_path, 'rb') as f:
+            publish_served_output(file_path, f.read(), track_change=False)
+        with _served_outputs_lock:
+            entry = _served_outputs.get(key)
+    return entry
+
+def discard_served_output(file_path=None):
+    """Forget a stored page (or every page) after it is removed or replaced on disk"""
+    if _served_outputs is None:
+        return
+    with _served_outputs_lock:
+        if file_path is None:
+            _served_outputs.clear()
+            _served_changes['all'] = True
+        else:
+            key = served_output_key(file_path)
+            _served_outputs.pop(key, None)
+            _served_changes['paths'].add(key)
+            _served_changes['body_only'].discard(key)
+
+def take_served_changes():
+    """Return the outputs changed since the last call as {'paths', 'body_only'} lists, or None if the
+    whole build was replaced"""
+    with _served_outputs_lock:
+        changed = None if _served_changes['all'] else {
+            'paths': sorted(_served_changes['paths']),
+            'body_only': sorted(_served_changes['body_only'])
+        }
+        _served_changes['paths'].clear()
+        _served_changes['body_only'].clear()
+        _served_changes['all'] = False
+    return changed
+
+# Output writes: every generated build file goes through write_output_file or emit_file, which leave
+# identical files untouched (keeping mtimes stable for deploys) and count each outcome
+OUTPUT_WRITE_OUTCOMES = ('unchanged', 'changed', 'new', 'deleted')
+_output_write_stats = dict.fromkeys(OUTPUT_WRITE_OUTCOMES, 0)
+_output_write_lock = threading.Lock()
+# Build files written or emitted by this process during the current build, relative to BUILD_DIR
+_written_outputs = set()
+
+def reset_output_writes():
+    """Start counting output writes for a new build (or worker job)"""
+    with _output_write_lock:
+        _output_write_stats.update(dict.fromkeys(OUTPUT_WRITE_OUTCOMES, 0))
+        _written_outputs.clear()
+
+def record_output_write(file_path, outcome):
+    """Count one output write outcome and remember that the file belongs to this build"""
+    with _output_write_lock:
+        _output_write_stats[outcome] += 1
+        if outcome != 'deleted':
+            _written_outputs.add(os.path.relpath(file_path, BUILD_DIR).replace(os.sep, '/'))
+
+def merge_output_write_stats(stats):
+    """Add output write counts returned by a worker process"""
+    with _output_write_lock:
+        for outcome, count in stats.items():
+            _output_write_stats[outcome] += count
+
+def print_output_write_stats():
+    """Print how many build files were left alone, rewritten, created and deleted"""
+    stats = _output_write_stats
+    print(f"Output files: {stats['unchanged']} unchanged, {stats['changed']} changed, "
+          f"{stats['new']} new, {stats['deleted']} deleted")
+
+def write_output_file(file_path, data):
+    """Write a generated build file unless it already holds exactly these bytes; returns True if written.
+    
+    Existing files are compared by size, then content. Changed files are written to a temporary file
+    and swapped in with os.replace, so the dev server and deploy tools never see a partial file.
+    """
+    try:
+        existing_size = os.path.getsize(file_path)
+    except OSError:
+        existing_size = None
+    
+    if existing_size == len(data):
+        with open(file_path, 'rb') as f:
+            if hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest():
+                record_output_write(file_path, 'unchanged')
+                return False
+    
+    temp_file = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, file_path)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    record_output_write(file_path, 'new' if existing_size is None else 'changed')
+    return True
+
+def write_text_output(file_path, content):
+    """Write a generated text file into the build, publishing pages to the dev server's store"""
+    data = content.encode('utf-8')
+    write_output_file(file_path, data)
+    if _served_outputs is not None and file_path.endswith('.html'):
+        publish_served_output(file_path, data)
+
 def write_html_file(file_path, html_content, minify=False):
     """Write HTML content to file with optional minification"""
     if minify:
         html_content = minify_html_content(html_content)
     
-    with open(file_path, "w", encoding='utf-8') as f:
-        f.write(html_content)
+    write_text_output(file_path, html_content)
+
+# Asset emission: how unmodified source files (images, static assets) are placed into the build directory
+ASSET_EMISSION_MODES = ('link', 'copy')
+# ioctl request for copy-on-write clones on Linux (Btrfs, XFS, bcachefs)
+FICLONE = 0x40049409
+_asset_emission_settings = {'mode': 'link'}
+
+def configure_asset_emission(site_config):
+    """Apply asset_emission settings from site_config.yaml"""
+    mode = site_config.get('asset_emission', {}).get('mode', 'link')
+    if mode not in ASSET_EMISSION_MODES:
+        print(f"[WARNING] Unknown asset_emission mode '{mode}', using 'link'")
+        mode = 'link'
+    _asset_emission_settings['mode'] = mode
+
+def reflink_file(source_path, dest_path):
+    """Clone a file copy-on-write to a new dest_path where the filesystem supports it; returns True on success"""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    
+    try:
+        # Exclusive create: never write through an existing file, which may share an inode with a source
+        with open(source_path, 'rb') as source, open(dest_path, 'xb') as dest:
+            fcntl.ioctl(dest.fileno(), FICLONE, source.fileno())
+    except OSError:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        return False
+    shutil.copystat(source_path, dest_path)
+    return True
+
+def emit_file(source_path, dest_path):
+    """Place a byte-identical copy of source_path at dest_path.
+    
+    Destinations that already match by size and mtime (or content hash) are left alone. In 'link' mode
+    the file is hardlinked, or cloned copy-on-write if hardlinks fail (e.g. across filesystems), and only
+    copied as a last resort. Replacements are placed under a temporary name and renamed over the old file,
+    which is never opened for writing: it may be a hardlink to a source file, and with --jobs another
+    worker may be emitting the same destination.
+    """
+    source_stat = os.stat(source_path)
+    try:
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
+        dest_stat = None
+    
+    if dest_stat is not None:
+        if os.path.samestat(source_stat, dest_stat):
+            record_output_write(dest_path, 'unchanged')
+            return
+        if dest_stat.st_size == source_stat.st_size:
+            if dest_stat.st_mtime_ns == source_stat.st_mtime_ns:
+                record_output_write(dest_path, 'unchanged')
+                return
+            if calculate_file_hash(dest_path, length=64) == calculate_file_hash(source_path, length=64):
+                # A hardlinked destination shares its mtime with some other source file, so leave it be
+                if dest_stat.st_nlink == 1:
+                    os.utime(dest_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+                record_output_write(dest_path, 'unchanged')
+                return
+    discard_served_output(dest_path)
+    record_output_write(dest_path, 'new' if dest_stat is None else 'changed')
+    
+    link_mode = _asset_emission_settings['mode'] == 'link'
+    if link_mode and dest_stat is None:
+        try:
+            os.link(source_path, dest_path)
+            return
+        except FileExistsError:
+            # A peer worker emitted it first; done if that was the same link, otherwise replace it below
+            try:
+                if os.path.samestat(source_stat, os.stat(dest_path)):
+                    return
+            except FileNotFoundError:
+                pass
+        except OSError:
+            pass
+    
+    temp_file = f"{dest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    # A temp file left by an interrupted build may itself be a hardlink; unlink it, never write into it
+    if os.path.lexists(temp_file):
+        os.remove(temp_file)
+    try:
+        placed = False
+        if link_mode:
+            try:
+                os.link(source_path, temp_file)
+                placed = True
+            except OSError:
+                placed = reflink_file(source_path, temp_file)
+        if not placed:
+            shutil.copy2(source_path, temp_file)
+        os.replace(temp_file, dest_path)
+    except BaseException:
+        if os.path.lexists(temp_file):
+            os.remove(temp_file)
+        raise
 
 def process_cover_art(novel_slug, novel_config):
     """Process cover art images by copying them to static/images with hash-based filenames"""
@@ -793,7 +1115,7 @@ def process_cover_art(novel_slug, novel_config):
             dest_path = os.path.join(images_dir, unique_filename)
             
             # Copy the image
-            shutil.copy2(source_path, dest_path)
+            emit_file(source_path, dest_path)
             
             # Store the processed path
             processed_images['story_cover'] = f"static/images/{unique_filename}"
@@ -812,7 +1134,7 @@ def process_cover_art(novel_slug, novel_config):
                     dest_path = os.path.join(images_dir, unique_filename)
                     
                     # Copy the image
-                    shutil.copy2(source_path, dest_path)
+                    emit_file(source_path, dest_path)
                     
                     # Store the processed path
                     processed_images[f'arc_{i}_cover'] = f"static/images/{unique_filename}"
@@ -1125,33 +1447,136 @@ def load_webring_config():
             return config.get('webring', {})
     return {}
 
-def fetch_rss_feed(url, timeout=10):
-    """Fetch and parse RSS feed from URL with comprehensive error handling"""
+# Webring feed cache: parsed items plus the ETag/Last-Modified validators for conditional requests
+WEBRING_CACHE_DIR = os.path.join(CACHE_DIR, "webring")
+WEBRING_CACHE_VERSION = 1
+# fetch_rss_feed result when the server answered 304 Not Modified
+WEBRING_NOT_MODIFIED = 'not-modified'
+
+def webring_cache_path(rss_url):
+    """Get the cache file for a webring RSS feed URL"""
+    key = hashlib.sha256(rss_url.encode('utf-8')).hexdigest()
+    return os.path.join(WEBRING_CACHE_DIR, f"{key}.json")
+
+def load_webring_cache_entry(rss_url):
+    """Load a feed's cached validators and items, or None if it has not been fetched before"""
+    try:
+        with open(webring_cache_path(rss_url), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get('version') != WEBRING_CACHE_VERSION or entry.get('url') != rss_url:
+        return None
+    return entry
+
+def save_webring_cache_entry(rss_url, validators, items, fetched):
+    """Store a feed's validators and parsed items (dates as ISO strings)"""
+    entry = {
+        'version': WEBRING_CACHE_VERSION,
+        'url': rss_url,
+        'fetched': fetched,
+        'validators': validators,
+        'items': [dict(item, pub_date=item['pub_date'].isoformat() if item['pub_date'] else None) for item in items]
+    }
+    cache_file = webring_cache_path(rss_url)
+    try:
+        os.makedirs(WEBRING_CACHE_DIR, exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+def cached_webring_items(entry, site_name, site_url):
+    """Restore the items of a feed cache entry, labelled with the site's current name and URL"""
+    items = []
+    for item in entry['items']:
+        pub_date = datetime.datetime.fromisoformat(item['pub_date']) if item['pub_date'] else None
+        items.append(dict(item, pub_date=pub_date, site_name=site_name, site_url=site_url))
+    return items
+
+def fetch_rss_feed(url, timeout=10, validators=None):
+    """Fetch and parse RSS feed from URL with comprehensive error handling.
+    
+    Sends If-None-Match/If-Modified-Since when cached validators are given. Returns (feed, validators,
+    warning): feed is the parsed feed, WEBRING_NOT_MODIFIED for a 304 response, or None on failure with
+    warning describing why.
+    """
+    headers = {}
+    if validators and validators.get('etag'):
+        headers['If-None-Match'] = validators['etag']
+    if validators and validators.get('last_modified'):
+        headers['If-Modified-Since'] = validators['last_modified']
+    
     try:
-        with urlopen(url, timeout=timeout) as response:
+        with urlopen(Request(url, headers=headers), timeout=timeout) as response:
             # Check response status
             if response.status != 200:
-                print(f"    Warning: RSS feed returned status {response.status}: {url}")
-                return None
+                return None, None, f"RSS feed returned status {response.status}: {url}"
                 
             content = response.read().decode('utf-8')
             soup = BeautifulSoup(content, 'xml')
             
             # Verify it's actually an RSS/XML feed
             if not soup.find('rss') and not soup.find('feed'):
-                print(f"    Warning: URL does not appear to be a valid RSS feed: {url}")
-                return None
-                
-            return soup
-    except (URLError, HTTPError) as e:
-        print(f"    Warning: Network error fetching RSS feed from {url}: {e}")
-        return None
+                return None, None, f"URL does not appear to be a valid RSS feed: {url}"
+            
+            new_validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            return soup, new_validators, None
+    except HTTPError as e:
+        if e.code == 304:
+            return WEBRING_NOT_MODIFIED, validators, None
+        return None, None, f"Network error fetching RSS feed from {url}: {e}"
+    except URLError as e:
+        return None, None, f"Network error fetching RSS feed from {url}: {e}"
     except UnicodeDecodeError as e:
-        print(f"    Warning: Unable to decode RSS feed content from {url}: {e}")
-        return None
+        return None, None, f"Unable to decode RSS feed content from {url}: {e}"
     except Exception as e:
-        print(f"    Warning: Unexpected error fetching RSS feed from {url}: {e}")
-        return None
+        return None, None, f"Unexpected error fetching RSS feed from {url}: {e}"
+
+def fetch_webring_site(site, cache_duration, timeout):
+    """Fetch one webring site's items (runs on a thread), falling back to its cached items.
+    
+    Returns (items, log_lines, status) with status 'fetched', 'cached', 'stale' or 'failed'; log lines
+    are printed by the caller so sites report in configuration order.
+    """
+    site_name = site.get('name', 'Unknown Site')
+    site_url = site.get('url', '')
+    rss_url = site['rss']
+    lines = [f"    Fetching RSS from {site_name}..."]
+    
+    entry = load_webring_cache_entry(rss_url)
+    now = time.time()
+    if entry and now - entry['fetched'] < cache_duration:
+        items = cached_webring_items(entry, site_name, site_url)
+        lines.append(f"      Cached: {len(items)} items from {site_name} (fetched {int(now - entry['fetched'])}s ago)")
+        return items, lines, 'cached' if items else 'failed'
+    
+    feed, validators, warning = fetch_rss_feed(rss_url, timeout, entry['validators'] if entry else None)
+    if feed == WEBRING_NOT_MODIFIED:
+        items = cached_webring_items(entry, site_name, site_url)
+        save_webring_cache_entry(rss_url, validators, items, now)
+        lines.append(f"      Not modified: Reusing {len(items)} cached items from {site_name}")
+        return items, lines, 'fetched' if items else 'failed'
+    
+    if feed is not None:
+        items = parse_rss_items(feed, site_name, site_url)
+        if items:
+            save_webring_cache_entry(rss_url, validators, items, now)
+            lines.append(f"      Success: Found {len(items)} items from {site_name}")
+            return items, lines, 'fetched'
+        warning = f"No valid items found in RSS feed from {site_name}"
+    
+    lines.append(f"      Warning: {warning}")
+    if entry and entry['items']:
+        items = cached_webring_items(entry, site_name, site_url)
+        lines.append(f"      Using {len(items)} stale cached items from {site_name}")
+        return items, lines, 'stale'
+    return [], lines, 'failed'
 
 def parse_rss_items(rss_soup, site_name, site_url):
     """Parse RSS feed and extract items"""
@@ -1229,31 +1654,54 @@ def generate_webring_data(webring_config, display_config):
     
     successful_sites = 0
     failed_sites = 0
+    stale_sites = 0
+    
+    # Feeds fetched within cache_duration are reused without a request; the rest are fetched
+    # concurrently, and the whole fetch gives up after fetch_timeout seconds
+    cache_duration = webring_config.get('cache_duration', 3600)
+    fetch_timeout = webring_config.get('fetch_timeout', 10)
+    feed_sites = [site for site in sites_list if site.get('rss')]
+    futures = {}
+    if feed_sites:
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(webring_config.get('max_concurrent_fetches', 8), len(feed_sites)))
+        futures = {id(site): executor.submit(fetch_webring_site, site, cache_duration, fetch_timeout)
+                   for site in feed_sites}
+        concurrent.futures.wait(futures.values(), timeout=fetch_timeout)
+        # Don't wait for peers that are still hanging; their requests time out in the background
+        executor.shutdown(wait=False, cancel_futures=True)
     
     for site in sites_list:
         site_name = site.get('name', 'Unknown Site')
         site_url = site.get('url', '')
-        rss_url = site.get('rss', '')
         
-        if not rss_url:
+        if not site.get('rss'):
             print(f"    Skipping {site_name}: No RSS URL configured")
             failed_sites += 1
             continue
-            
-        print(f"    Fetching RSS from {site_name}...")
-        rss_soup = fetch_rss_feed(rss_url)
         
-        if rss_soup:
-            items = parse_rss_items(rss_soup, site_name, site_url)
-            if items:
-                all_items.extend(items)
-                successful_sites += 1
-                print(f"      Success: Found {len(items)} items from {site_name}")
-            else:
-                print(f"      Warning: No valid items found in RSS feed from {site_name}")
-                failed_sites += 1
+        future = futures[id(site)]
+        # Feeds still queued at the deadline were cancelled; they fall back like the ones still running
+        if future.done() and not future.cancelled():
+            items, lines, status = future.result()
         else:
+            lines = [f"    Fetching RSS from {site_name}...",
+                     f"      Warning: Gave up on {site_name} after {fetch_timeout}s"]
+            entry = load_webring_cache_entry(site['rss'])
+            items = cached_webring_items(entry, site_name, site_url) if entry else []
+            status = 'stale' if items else 'failed'
+            if items:
+                lines.append(f"      Using {len(items)} stale cached items from {site_name}")
+        
+        for line in lines:
+            print(line)
+        all_items.extend(items)
+        if status == 'failed':
             failed_sites += 1
+        else:
+            successful_sites += 1
+            if status == 'stale':
+                stale_sites += 1
     
     # Include site's own RSS feed if configured
     if include_own_rss:
@@ -1300,119 +1748,49 @@ def generate_webring_data(webring_config, display_config):
     print(f"    Generated webring with {len(limited_items)} items from {successful_sites}/{total_sites} sites")
     if failed_sites > 0:
         print(f"    Note: {failed_sites} site(s) failed to load - webring will continue with available content")
+    if stale_sites > 0:
+        print(f"    Note: {stale_sites} site(s) could not be refreshed - showing their last fetched items")
     
     return limited_items
 
 
-def generate_story_epub(novel_slug, novel_config, site_config, novel_data=None, language='en'):
-    """Generate EPUB for entire story"""
-    if not _check_ebooklib():
-        return False
-    
-    # Check if EPUB generation is enabled
-    if not site_config.get('pdf_epub', {}).get('generate_enabled', True):
-        return False
-    if not site_config.get('pdf_epub', {}).get('epub_enabled', True):
-        return False
-    if not novel_config.get('downloads', {}).get('epub_enabled', True):
-        return False
-    
-    try:
-        # Get non-hidden chapters for the specified language
-        chapters_data = get_chapters_for_epub(novel_config, novel_slug, language, INCLUDE_DRAFTS, INCLUDE_SCHEDULED)
-        if not chapters_data:
-            return False
-        
-        # Create EPUB book
-        import ebooklib
-        from ebooklib import epub
-        book = epub.EpubBook()
-        
-        # Set metadata
-        story_title = novel_config.get('title', novel_slug)
-        book.set_identifier(f'web-novel-{novel_slug}')
-        book.set_title(story_title)
-        book.set_language('en')
-        
-        author_name = novel_config.get('author', {}).get('name', 'Unknown Author')
-        book.add_author(author_name)
-        
-        description = novel_config.get('description', '')
-        if description:
-            book.add_metadata('DC', 'description', description)
-        
-        # Track added images to avoid duplicates
-        added_images = {}
-        
-        # Add cover image if available - use processed image paths if available
-        cover_art_path = None
-        if novel_data and novel_data.get('front_page', {}).get('cover_art'):
-            cover_art_path = novel_data['front_page']['cover_art']
-        elif novel_config.get('front_page', {}).get('cover_art'):
-            cover_art_path = novel_config['front_page']['cover_art']
-            
-        if cover_art_path:
-            cover_image_absolute = os.path.join(BUILD_DIR, cover_art_path)
-            if os.path.exists(cover_image_absolute):
-                # Determine image type
-                image_ext = os.path.splitext(cover_art_path)[1].lower()
-                image_type = 'image/jpeg' if image_ext in ['.jpg', '.jpeg'] else 'image/png'
-                
-                # Read and add cover image
-                with open(cover_image_absolute, 'rb') as img_file:
-                    cover_image = img_file.read()
-                
-                # Create proper cover filename with extension
-                cover_filename = f"cover{image_ext}"
-                book.set_cover(cover_filename, cover_image)
-                added_images[cover_art_path] = cover_filename
-        
-        # Create and add CSS file for styling
-        css_content = """
+EPUB_CSS = """
         body { font-family: Georgia, serif; line-height: 1.6; }
         h1 { border-bottom: 2px solid #333; padding-bottom: 0.5em; }
         p { margin-bottom: 1em; text-align: justify; }
         img { max-width: 100%; height: auto; display: block; margin: 1.5em auto; text-align: center; }
         p img { margin: 1.5em auto; }
         """
-        
-        css_item = epub.EpubItem(
-            uid="style_default",
-            file_name="style/default.css",
-            media_type="text/css",
-            content=css_content
-        )
-        book.add_item(css_item)
-        
-        # Add chapters to EPUB
-        spine = ['nav']
-        toc = []
-        
-        for arc_index, arc in enumerate(chapters_data):
-            arc_chapters = []
+
+def epub_downloads_enabled(site_config, novel_config):
+    """Check the site and story settings that turn EPUB generation on or off"""
+    if not site_config.get('pdf_epub', {}).get('generate_enabled', True):
+        return False
+    if not site_config.get('pdf_epub', {}).get('epub_enabled', True):
+        return False
+    return novel_config.get('downloads', {}).get('epub_enabled', True)
+
+def build_epub_chapter_parts(novel_slug, novel_config, chapters_data, language='en'):
+    """Prepare each chapter's XHTML and image files once, to be shared by the story and arc EPUBs.
+    
+    Returns one list of chapter parts per arc of chapters_data, and the image files by EPUB file name.
+    """
+    epub_images = {}
+    arc_parts = []
+    
+    for arc_index, arc in enumerate(chapters_data):
+        chapter_parts = []
+        for chapter_index, chapter in enumerate(arc['chapters']):
+            # Chapter content HTML as rendered on the chapter page
+            chapter_html = load_chapter_html_fragment(novel_slug, novel_config, chapter, language)
             
-            for chapter_index, chapter in enumerate(arc['chapters']):
-                # Create EPUB chapter
-                chapter_id = f"chapter_{arc_index}_{chapter_index}"
-                chapter_file = f"chapter_{arc_index}_{chapter_index}.xhtml"
-                
-                # Try to load processed HTML content first, fall back to markdown
-                chapter_html = load_processed_chapter_content(novel_slug, chapter['id'], language)
-                if not chapter_html:
-                    # Fallback to markdown processing
-                    chapter_html = markdown.markdown(chapter['content'])
-                
-                # Process images in chapter content
-                chapter_html = process_epub_images(chapter_html, novel_slug, book, added_images)
-                
-                # Create EPUB chapter content
-                epub_chapter = epub.EpubHtml(
-                    title=chapter['title'],
-                    file_name=chapter_file,
-                    lang='en'
-                )
-                
-                epub_chapter.content = f"""
+            # Process images in chapter content
+            chapter_html, image_files = process_epub_images(chapter_html, novel_slug, epub_images)
+            
+            chapter_parts.append({
+                'title': chapter['title'],
+                'file_name': f"chapter_{arc_index}_{chapter_index}.xhtml",
+                'content': f"""
                 <html xmlns="http://www.w3.org/1999/xhtml">
                 <head>
                     <title>{chapter['title']}</title>
@@ -1423,316 +1801,233 @@ def generate_story_epub(novel_slug, novel_config, site_config, novel_data=None,
                     {chapter_html}
                 </body>
                 </html>
-                """
-                
-                # Link the CSS file to this chapter
-                epub_chapter.add_item(css_item)
-                book.add_item(epub_chapter)
-                spine.append(epub_chapter)
-                arc_chapters.append(epub_chapter)
-            
-            # Add arc to TOC if multiple arcs
-            if len(chapters_data) > 1:
-                toc.append((epub.Section(arc['title']), arc_chapters))
-            else:
-                toc.extend(arc_chapters)
-        
-        # Set TOC and spine
-        book.toc = toc
-        book.spine = spine
-        
-        # Add default navigation files
-        book.add_item(epub.EpubNcx())
-        book.add_item(epub.EpubNav())
-        
-        # Ensure output directory exists
-        epub_dir = os.path.normpath(os.path.join(BUILD_DIR, "static", "epub"))
-        os.makedirs(epub_dir, exist_ok=True)
-        
-        # Write EPUB file with language suffix if not English
-        if language == 'en':
-            epub_filename = f"{novel_slug}.epub"
-        else:
-            epub_filename = f"{novel_slug}_{language}.epub"
-        epub_path = os.path.join(epub_dir, epub_filename)
-        epub.write_epub(epub_path, book, {})
-        
-        return True
-    except Exception as e:
-        print(f"Error generating EPUB for {novel_slug}: {e}")
-        return False
-
-def generate_arc_epub(novel_slug, novel_config, site_config, arc_index, novel_data=None, language='en'):
-    """Generate EPUB for a specific arc"""
-    if not _check_ebooklib():
-        return False
-    
-    # Check if EPUB generation is enabled
-    if not site_config.get('pdf_epub', {}).get('generate_enabled', True):
-        return False
-    if not site_config.get('pdf_epub', {}).get('epub_enabled', True):
-        return False
-    if not novel_config.get('downloads', {}).get('epub_enabled', True):
-        return False
-    if not novel_config.get('downloads', {}).get('include_arcs', True):
-        return False
-    
-    try:
-        # Get all chapters and filter for this arc
-        all_chapters = get_chapters_for_epub(novel_config, novel_slug, language, INCLUDE_DRAFTS, INCLUDE_SCHEDULED)
-        if not all_chapters or arc_index >= len(all_chapters):
-            return False
-        
-        # Get the specific arc
-        arc_data = all_chapters[arc_index]
-        if not arc_data['chapters']:
-            return False
-        
-        # Create EPUB book
-        import ebooklib
-        from ebooklib import epub
-        book = epub.EpubBook()
-        
-        # Set metadata
-        arc_title = arc_data['title']
-        story_title = novel_config.get('title', novel_slug)
-        epub_title = f"{story_title} - {arc_title}"
-        
-        book.set_identifier(f'web-novel-{novel_slug}-arc-{arc_index}')
-        book.set_title(epub_title)
-        book.set_language('en')
-        
-        author_name = novel_config.get('author', {}).get('name', 'Unknown Author')
-        book.add_author(author_name)
-        
-        description = novel_config.get('description', '')
-        if description:
-            book.add_metadata('DC', 'description', f"{description} - {arc_title}")
-        
-        # Track added images to avoid duplicates
-        added_images = {}
-        
-        # Add cover image - prefer arc cover, fall back to story cover
-        cover_art_path = None
-        # Try to get arc cover from processed data first
-        if novel_data and novel_data.get('arcs') and arc_index < len(novel_data['arcs']):
-            cover_art_path = novel_data['arcs'][arc_index].get('cover_art')
-        
-        # Fall back to story cover if no arc cover
-        if not cover_art_path:
-            if novel_data and novel_data.get('front_page', {}).get('cover_art'):
-                cover_art_path = novel_data['front_page']['cover_art']
-            elif novel_config.get('front_page', {}).get('cover_art'):
-                cover_art_path = novel_config['front_page']['cover_art']
-                
-        if cover_art_path:
-            cover_image_absolute = os.path.join(BUILD_DIR, cover_art_path)
-            if os.path.exists(cover_image_absolute):
-                # Determine image type
-                image_ext = os.path.splitext(cover_art_path)[1].lower()
-                image_type = 'image/jpeg' if image_ext in ['.jpg', '.jpeg'] else 'image/png'
-                
-                # Read and add cover image
-                with open(cover_image_absolute, 'rb') as img_file:
-                    cover_image = img_file.read()
-                
-                # Create proper cover filename with extension
-                cover_filename = f"cover{image_ext}"
-                book.set_cover(cover_filename, cover_image)
-                added_images[cover_art_path] = cover_filename
-        
-        # Create and add CSS file for styling
-        css_content = """
-        body { font-family: Georgia, serif; line-height: 1.6; }
-        h1 { border-bottom: 2px solid #333; padding-bottom: 0.5em; }
-        p { margin-bottom: 1em; text-align: justify; }
-        img { max-width: 100%; height: auto; display: block; margin: 1.5em auto; text-align: center; }
-        p img { margin: 1.5em auto; }
-        """
-        
-        css_item = epub.EpubItem(
-            uid="style_default",
-            file_name="style/default.css",
-            media_type="text/css",
-            content=css_content
-        )
-        book.add_item(css_item)
-        
-        # Add chapters to EPUB
-        spine = ['nav']
-        toc = []
-        
-        for chapter_index, chapter in enumerate(arc_data['chapters']):
-            # Create EPUB chapter
-            chapter_id = f"chapter_{chapter_index}"
-            chapter_file = f"chapter_{chapter_index}.xhtml"
-            
-            # Try to load processed HTML content first, fall back to markdown
-            chapter_html = load_processed_chapter_content(novel_slug, chapter['id'], language)
-            if not chapter_html:
-                # Fallback to markdown processing
-                chapter_html = markdown.markdown(chapter['content'])
-            
-            # Process images in chapter content
-            chapter_html = process_epub_images(chapter_html, novel_slug, book, added_images)
-            
-            # Create EPUB chapter content
+                """,
+                'images': image_files
+            })
+        arc_parts.append(chapter_parts)
+    
+    images_by_file = {image['file_name']: image for image in epub_images.values()}
+    return arc_parts, images_by_file
+
+def assemble_epub_book(identifier, title, author_name, description, cover, arc_parts, arc_titles, images):
+    """Create an EpubBook from shared chapter parts; arcs become TOC sections when arc_titles is given"""
+    from ebooklib import epub
+    book = epub.EpubBook()
+    
+    # Set metadata
+    book.set_identifier(identifier)
+    book.set_title(title)
+    book.set_language('en')
+    book.add_author(author_name)
+    if description:
+        book.add_metadata('DC', 'description', description)
+    
+    # Add cover image if available
+    if cover:
+        book.set_cover(*cover)
+    
+    # Create and add CSS file for styling
+    css_item = epub.EpubItem(
+        uid="style_default",
+        file_name="style/default.css",
+        media_type="text/css",
+        content=EPUB_CSS
+    )
+    book.add_item(css_item)
+    
+    # Add the images referenced by this book's chapters
+    added_images = set()
+    for chapter_parts in arc_parts:
+        for part in chapter_parts:
+            for image_file in part['images']:
+                if image_file not in added_images:
+                    image = images[image_file]
+                    book.add_item(epub.EpubImage(uid=image['uid'], file_name=image_file,
+                                                 media_type=image['media_type'], content=image['data']))
+                    added_images.add(image_file)
+    
+    # Add chapters to EPUB
+    spine = ['nav']
+    toc = []
+    for arc_index, chapter_parts in enumerate(arc_parts):
+        arc_chapters = []
+        for part in chapter_parts:
             epub_chapter = epub.EpubHtml(
-                title=chapter['title'],
-                file_name=chapter_file,
+                title=part['title'],
+                file_name=part['file_name'],
                 lang='en'
             )
-            
-            epub_chapter.content = f"""
-            <html xmlns="http://www.w3.org/1999/xhtml">
-            <head>
-                <title>{chapter['title']}</title>
-                <link rel="stylesheet" type="text/css" href="../style/default.css"/>
-            </head>
-            <body>
-                <h1>{chapter['title']}</h1>
-                {chapter_html}
-            </body>
-            </html>
-            """
+            epub_chapter.content = part['content']
             
             # Link the CSS file to this chapter
             epub_chapter.add_item(css_item)
             book.add_item(epub_chapter)
             spine.append(epub_chapter)
-            toc.append(epub_chapter)
-        
-        # Set TOC and spine
-        book.toc = toc
-        book.spine = spine
+            arc_chapters.append(epub_chapter)
         
-        # Add default navigation files
-        book.add_item(epub.EpubNcx())
-        book.add_item(epub.EpubNav())
-        
-        # Ensure output directory exists
-        epub_dir = os.path.normpath(os.path.join(BUILD_DIR, "static", "epub"))
-        os.makedirs(epub_dir, exist_ok=True)
-        
-        # Generate EPUB with arc-specific filename and language suffix if not English
-        arc_slug = arc_title.lower().replace(' ', '-').replace(':', '').replace(',', '')
-        if language == 'en':
-            epub_filename = f"{novel_slug}-{arc_slug}.epub"
+        if arc_titles:
+            toc.append((epub.Section(arc_titles[arc_index]), arc_chapters))
         else:
-            epub_filename = f"{novel_slug}-{arc_slug}_{language}.epub"
-        epub_path = os.path.join(epub_dir, epub_filename)
-        epub.write_epub(epub_path, book, {})
-        
-        return True
-    except Exception as e:
-        print(f"Error generating EPUB for {novel_slug} arc {arc_index}: {e}")
-        return False
-
-def load_processed_chapter_content(novel_slug, chapter_id, language='en'):
-    """Load processed chapter content from the built HTML files"""
-    chapter_path = os.path.join(BUILD_DIR, novel_slug, language, chapter_id, 'index.html')
-    if not os.path.exists(chapter_path):
-        return None
+            toc.extend(arc_chapters)
     
+    # Set TOC and spine
+    book.toc = toc
+    book.spine = spine
+    
+    # Add default navigation files
+    book.add_item(epub.EpubNcx())
+    book.add_item(epub.EpubNav())
+    return book
+
+# Threads writing a novel's EPUB files; None means one per CPU. EPUB worker processes write one at a time,
+# since --jobs already runs one per CPU
+_epub_write_settings = {'threads': None}
+
+def write_epub_book(epub_path, book):
+    """Serialise an EPUB to disk; runs on a writer thread, so it only reports errors"""
+    from ebooklib import epub
     try:
-        with open(chapter_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Extract just the chapter content between the chapter-content div
-        import re
-        # Look for the inner content wrapper
-        content_match = re.search(r'<div id="chapter-content-wrapper"[^>]*>(.*?)</div>', html_content, re.DOTALL)
-        if content_match:
-            inner_content = content_match.group(1).strip()
-            # Remove the duplicate h1 title if present (it's already in the EPUB structure)
-            inner_content = re.sub(r'<h1[^>]*>.*?</h1>', '', inner_content, count=1)
-            return inner_content.strip()
-        
-        # Fallback: try the outer chapter-content div
-        content_match = re.search(r'<div class="chapter-content">(.*?)</div>', html_content, re.DOTALL)
-        if content_match:
-            return content_match.group(1).strip()
-        
-        # Fallback: try to extract content between main tags
-        main_match = re.search(r'<main[^>]*>(.*?)</main>', html_content, re.DOTALL)
-        if main_match:
-            content = main_match.group(1)
-            # Remove navigation and other non-content elements, keep just the chapter text
-            content = re.sub(r'<nav[^>]*>.*?</nav>', '', content, flags=re.DOTALL)
-            content = re.sub(r'<div class="chapter-nav[^"]*">.*?</div>', '', content, flags=re.DOTALL)
-            content = re.sub(r'<div class="comments-section">.*?</div>', '', content, flags=re.DOTALL)
-            return content.strip()
-        
+        # Serialise in memory so the output writer can swap the finished file in atomically
+        buffer = io.BytesIO()
+        epub.write_epub(buffer, book, {})
+        write_output_file(epub_path, buffer.getvalue())
         return None
     except Exception as e:
-        print(f"Error loading processed chapter content for {chapter_id}: {e}")
-        return None
+        return e
+
+# Per-EPUB records of the content each book was written from, so unchanged books are not rewritten
+EPUB_RECORD_DIR = os.path.join(CACHE_DIR, "epub")
+EPUB_RECORD_VERSION = 1
+
+def epub_book_signature(book_args, images):
+    """Hash an EPUB's metadata, cover, chapter XHTML and image contents"""
+    identifier, title, author_name, description, cover, arc_parts, arc_titles = book_args
+    chapters = [[(part['file_name'], part['title'], part['content'],
+                  [(image_file, images[image_file]['hash']) for image_file in part['images']])
+                 for part in chapter_parts] for chapter_parts in arc_parts]
+    cover_hash = (cover[0], hashlib.sha256(cover[1]).hexdigest()) if cover else None
+    return hash_build_signature(EPUB_RECORD_VERSION, hash_build_input(__file__), EPUB_CSS, identifier, title,
+                                author_name, description, cover_hash, arc_titles, chapters)
+
+def epub_record_path(epub_path):
+    """Record file for an EPUB, named after the EPUB file"""
+    return os.path.join(EPUB_RECORD_DIR, os.path.basename(epub_path) + ".json")
+
+def epub_is_current(epub_path, signature):
+    """Check whether an EPUB exists and was written from content with this signature"""
+    if not os.path.exists(epub_path):
+        return False
+    try:
+        with open(epub_record_path(epub_path), 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return record.get('signature') == signature and record.get('size') == os.path.getsize(epub_path)
+
+def save_epub_record(epub_path, signature):
+    """Remember the content signature an EPUB was just written from"""
+    os.makedirs(EPUB_RECORD_DIR, exist_ok=True)
+    with open(epub_record_path(epub_path), 'w', encoding='utf-8') as f:
+        json.dump({'signature': signature, 'size': os.path.getsize(epub_path)}, f)
+
+# Chapter content HTML from this build's chapter renders, keyed by (novel_slug, language, chapter_id),
+# so EPUB assembly does not have to read the built pages back
+_chapter_html_fragments = {}
+
+def reset_chapter_html_fragments():
+    """Forget chapter content kept from the previous build"""
+    _chapter_html_fragments.clear()
+
+def epub_chapter_fragment(chapter_html):
+    """Drop the chapter's own title heading, which the EPUB chapter adds itself"""
+    return re.sub(r'<h1[^>]*>.*?</h1>', '', chapter_html, count=1).strip()
 
-def process_epub_images(content_html, novel_slug, book, added_images):
-    """Process images in chapter content and add them to EPUB"""
+def store_chapter_html_fragment(novel_slug, language, chapter_id, chapter_html):
+    """Keep a rendered chapter's content HTML for EPUB assembly"""
+    _chapter_html_fragments[(novel_slug, language, chapter_id)] = epub_chapter_fragment(chapter_html)
+
+def load_chapter_html_fragment(novel_slug, novel_config, chapter, language='en'):
+    """Return a chapter's content HTML for an EPUB.
+    
+    Uses the fragment kept when the chapter page was rendered in this build; chapters whose pages
+    were reused from the previous build are converted from their markdown the same way.
+    """
+    fragment = _chapter_html_fragments.get((novel_slug, language, chapter['id']))
+    if fragment is not None:
+        return fragment
+    
+    primary_lang = novel_config.get('primary_language', 'en')
+    content_lang = language if language == primary_lang or chapter_translation_exists(novel_slug, chapter['id'], language) else primary_lang
+    is_manga_chapter = chapter['metadata'].get('type', novel_config.get('chapter_type')) == 'manga'
+    chapter_html = build_chapter_content_html(novel_slug, chapter['id'], content_lang, chapter['content'], is_manga_chapter)
+    store_chapter_html_fragment(novel_slug, language, chapter['id'], chapter_html)
+    return _chapter_html_fragments[(novel_slug, language, chapter['id'])]
+
+def process_epub_images(content_html, novel_slug, epub_images):
+    """Point local images in chapter content at EPUB image files.
+    
+    epub_images maps each image src to its EPUB file (file_name, uid, media_type, data, hash) and is shared by
+    every chapter of the novel, so each image is read once. Returns the updated HTML and the EPUB file
+    names of the images it references.
+    """
     import re
     
-    # Import EPUB library
-    try:
-        import ebooklib
-        from ebooklib import epub
-    except ImportError:
-        print("ebooklib not available for image processing")
-        return content_html
+    image_files = []
     
     # Find all image references in the HTML
     img_pattern = r'<img[^>]+src=["\']([^"\']+)["\'][^>]*>'
     
+    # Responsive image markup points at variant files that are not packaged; keep the plain <img>
+    content_html = re.sub(r'</?picture>|<source\s[^>]*>', '', content_html)
+    
     def replace_image(match):
-        img_tag = match.group(0)
+        img_tag = re.sub(r'\s(?:srcset|sizes)="[^"]*"', '', match.group(0))
         src = match.group(1)
         
         # Skip external images
         if src.startswith(('http://', 'https://', '//')):
             return img_tag
         
-        # Convert relative path to absolute
-        if src.startswith('../'):
-            # Remove leading ../../../ and reconstruct path
-            clean_src = src.replace('../', '')  
-            image_absolute = os.path.join(BUILD_DIR, clean_src)
-        else:
-            image_absolute = os.path.join(BUILD_DIR, src)
-        
-        if not os.path.exists(image_absolute):
-            return img_tag  # Keep original if image not found
-        
         # Check if image already added
-        if src in added_images:
-            epub_filename = added_images[src]
+        if src in epub_images:
+            epub_filename = epub_images[src]['file_name']
         else:
-            # Add image to EPUB
+            # Convert relative path to absolute
+            if src.startswith('../'):
+                # Remove leading ../../../ and reconstruct path
+                clean_src = src.replace('../', '')  
+                image_absolute = os.path.join(BUILD_DIR, clean_src)
+            else:
+                image_absolute = os.path.join(BUILD_DIR, src)
+            
+            record_build_input(image_absolute)
+            if not os.path.exists(image_absolute):
+                return img_tag  # Keep original if image not found
+            
             try:
                 with open(image_absolute, 'rb') as img_file:
                     image_data = img_file.read()
-                
-                # Generate EPUB-friendly filename
-                image_name = os.path.basename(src)
-                image_ext = os.path.splitext(image_name)[1].lower()
-                image_type = 'image/jpeg' if image_ext in ['.jpg', '.jpeg'] else 'image/png'
-                
-                # Create unique filename for EPUB
-                epub_filename = f"images/{len(added_images)}_{image_name}"
-                
-                # Create EPUB image item
-                epub_image = epub.EpubImage(
-                    uid=f"img_{len(added_images)}",
-                    file_name=epub_filename,
-                    media_type=image_type,
-                    content=image_data
-                )
-                
-                book.add_item(epub_image)
-                added_images[src] = epub_filename
-                
             except Exception as e:
                 print(f"Error adding image {src} to EPUB: {e}")
                 return img_tag
+            
+            # Generate EPUB-friendly filename
+            image_name = os.path.basename(src)
+            image_ext = os.path.splitext(image_name)[1].lower()
+            image_type = 'image/jpeg' if image_ext in ['.jpg', '.jpeg'] else 'image/png'
+            
+            # Create unique filename for EPUB
+            epub_filename = f"images/{len(epub_images)}_{image_name}"
+            epub_images[src] = {
+                'file_name': epub_filename,
+                'uid': f"img_{len(epub_images)}",
+                'media_type': image_type,
+                'data': image_data,
+                'hash': hashlib.sha256(image_data).hexdigest()
+            }
+        
+        if epub_filename not in image_files:
+            image_files.append(epub_filename)
         
         # Replace src with EPUB path (no ../ prefix needed for EPUB internal files)
         new_img_tag = img_tag.replace(f'src="{src}"', f'src="{epub_filename}"')
@@ -1742,24 +2037,13 @@ def process_epub_images(content_html, novel_slug, book, added_images):
     
     # Process all images in the content
     processed_content = re.sub(img_pattern, replace_image, content_html)
-    return processed_content
-
-def update_toc_with_downloads(novel, novel_slug, novel_config, site_config, lang):
-    """Update TOC page with download links after files are generated"""
-    # Read the existing TOC file
-    novel_dir = os.path.join(BUILD_DIR, novel_slug)
-    lang_dir = os.path.join(novel_dir, lang)
-    toc_dir = os.path.join(lang_dir, "toc")
+    return processed_content, image_files
+
+def generate_toc_page(novel, novel_slug, novel_config, site_config, lang, available_languages, download_links):
+    """Render the table of contents page for a novel/language (after downloads are generated)"""
+    toc_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug, lang, "toc"))
     toc_file = os.path.join(toc_dir, "index.html")
-    
-    if not os.path.exists(toc_file):
-        return
-    
-    # Generate download links data
-    download_links = generate_download_links(novel_slug, novel_config, site_config, lang)
-    
-    # Prepare all the same data that was used for original TOC generation
-    available_languages = novel_config.get('languages', {}).get('available', ['en'])
+    os.makedirs(toc_dir, exist_ok=True)
     
     # Build social metadata for TOC
     toc_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/toc/"
@@ -1797,37 +2081,41 @@ def update_toc_with_downloads(novel, novel_slug, novel_config, site_config, lang
     # Process story metadata with the correct display unit
     story_metadata = process_story_metadata(novel_config, story_length_stats, site_config, novel_slug, lang, story_length_unit, story_length_count)
     
-    # Re-generate the TOC page with download links
-    with open(toc_file, "w", encoding='utf-8') as f:
-        f.write(render_template("toc.html", 
-                               novel_slug=novel_slug,
-                               site_config=site_config,
-                               novel_config=novel_config,
-                               novel=filtered_novel, 
-                               current_language=lang, 
-                               available_languages=available_languages,
-                               story_length_count=story_length_count,
-                               story_length_unit=story_length_unit,
-                               site_name=site_config.get('site_name', 'Web Novel Collection'),
-                               social_title=toc_social_meta['title'],
-                               social_description=toc_social_meta['description'], 
-                               social_image=toc_social_meta['image'],
-                               social_url=toc_social_meta['url'],
-                               seo_meta_description=toc_seo_meta.get('meta_description'),
-                               seo_keywords=toc_social_meta.get('keywords'),
-                               allow_indexing=toc_seo_meta.get('allow_indexing', True),
-                               twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                               footer_data=footer_data,
-                               download_links=download_links,
-                               comments_enabled=toc_comments_enabled,
-                               comments_repo=comments_config['repo'],
-                               comments_issue_term=comments_config['issue_term'],
-                               comments_label=comments_config['label'],
-                               comments_theme=comments_config['theme'],
-                               story_metadata=story_metadata))
-
-def generate_download_links(novel_slug, novel_config, site_config, language='en'):
-    """Generate download links data for TOC template"""
+    # Generate the TOC page with download links
+    record_build_output(toc_file)
+    write_text_output(toc_file, render_template("toc.html",
+                                               novel_slug=novel_slug,
+                                               site_config=site_config,
+                                               novel_config=novel_config,
+                                               novel=filtered_novel, 
+                                               current_language=lang, 
+                                               available_languages=available_languages,
+                                               story_length_count=story_length_count,
+                                               story_length_unit=story_length_unit,
+                                               site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                               social_title=toc_social_meta['title'],
+                                               social_description=toc_social_meta['description'], 
+                                               social_image=toc_social_meta['image'],
+                                               social_url=toc_social_meta['url'],
+                                               seo_meta_description=toc_seo_meta.get('meta_description'),
+                                               seo_keywords=toc_social_meta.get('keywords'),
+                                               allow_indexing=toc_seo_meta.get('allow_indexing', True),
+                                               twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                               footer_data=footer_data,
+                                               download_links=download_links,
+                                               comments_enabled=toc_comments_enabled,
+                                               comments_repo=comments_config['repo'],
+                                               comments_issue_term=comments_config['issue_term'],
+                                               comments_label=comments_config['label'],
+                                               comments_theme=comments_config['theme'],
+                                               story_metadata=story_metadata))
+
+def generate_download_links(novel_slug, novel_config, site_config, language='en', built_outputs=frozenset()):
+    """Generate download links data for TOC template.
+    
+    Only EPUBs in built_outputs (written or reused by this build) are linked; files left over in
+    static/epub from earlier builds are removed at the end of the build.
+    """
     download_links = {}
     
     # Check if downloads are enabled
@@ -1843,7 +2131,7 @@ def generate_download_links(novel_slug, novel_config, site_config, language='en'
     if site_config.get('epub', {}).get('generate_enabled', True) and novel_config.get('downloads', {}).get('epub_enabled', True):
         epub_filename = f"{novel_slug}{lang_suffix}.epub"
         epub_path = f"../../../static/epub/{epub_filename}"
-        if os.path.exists(os.path.join(BUILD_DIR, "static", "epub", epub_filename)):
+        if f"static/epub/{epub_filename}" in built_outputs:
             download_links['story_epub'] = epub_path
     
     # Arc-specific downloads
@@ -1863,7 +2151,7 @@ def generate_download_links(novel_slug, novel_config, site_config, language='en'
             if site_config.get('epub', {}).get('generate_enabled', True) and novel_config.get('downloads', {}).get('epub_enabled', True):
                 arc_epub_filename = f"{novel_slug}-{arc_title_slug}{lang_suffix}.epub"
                 arc_epub_path = f"../../../static/epub/{arc_epub_filename}"
-                if os.path.exists(os.path.join(BUILD_DIR, "static", "epub", arc_epub_filename)):
+                if f"static/epub/{arc_epub_filename}" in built_outputs:
                     arc_download['epub'] = arc_epub_path
             
             # Only add arc if it has at least one download
@@ -2126,31 +2414,61 @@ def should_skip_chapter_in_epub(chapter_metadata, include_drafts=False, include_
         return True
     return False
 
-def get_navigation_chapters(novel_slug, all_chapters, current_chapter_id, lang):
-    """Get previous and next chapters for navigation, skipping hidden chapters"""
-    visible_chapters = []
+def build_visible_chapter_index(novel, novel_slug, lang):
+    """Build the ordered visible-chapter index for a novel/language in a single pass.
     
-    # Filter out hidden chapters from navigation
-    for chapter in all_chapters:
-        try:
-            _, chapter_metadata = load_chapter_content(novel_slug, chapter['id'], lang)
-            if not should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                visible_chapters.append(chapter)
-        except:
-            # Include chapters that can't be loaded (they might exist in other languages)
-            visible_chapters.append(chapter)
+    Returns a dict with:
+    - 'chapters': visible chapters in reading order (used for prev/next navigation)
+    - 'positions': chapter id -> position in 'chapters' for O(1) neighbour lookups
+    - 'novel': copy of the novel with hidden chapters filtered out and published dates added
+    """
+    visible_chapters = []
+    positions = {}
+    filtered_novel = novel.copy()
+    filtered_arcs = []
     
-    # Find current chapter position in visible chapters
-    current_index = -1
-    for i, chapter in enumerate(visible_chapters):
-        if chapter['id'] == current_chapter_id:
-            current_index = i
-            break
+    for arc in novel.get('arcs', []):
+        filtered_chapters = []
+        
+        for chapter in arc.get('chapters', []):
+            try:
+                _, chapter_metadata = load_chapter_content(novel_slug, chapter['id'], lang)
+                if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
+                    continue
+                # Add published date to chapter data for TOC display
+                enhanced_chapter = chapter.copy()
+                enhanced_chapter['published'] = chapter_metadata.get('published')
+                filtered_chapters.append(enhanced_chapter)
+            except:
+                # Include chapters that can't be loaded (they might exist in other languages)
+                filtered_chapters.append(chapter)
+            
+            positions.setdefault(chapter['id'], len(visible_chapters))
+            visible_chapters.append(chapter)
+        
+        # Only include arcs that have visible chapters
+        if filtered_chapters:
+            filtered_arc = arc.copy()
+            filtered_arc['chapters'] = filtered_chapters
+            filtered_arcs.append(filtered_arc)
+    
+    filtered_novel['arcs'] = filtered_arcs
+    
+    return {
+        'chapters': visible_chapters,
+        'positions': positions,
+        'novel': filtered_novel
+    }
+
+def get_navigation_chapters(chapter_index, current_chapter_id):
+    """Get previous and next chapters for navigation from a visible-chapter index"""
+    current_index = chapter_index['positions'].get(current_chapter_id)
     
-    if current_index == -1:
+    if current_index is None:
         # Current chapter is not in visible list (probably hidden), no navigation
         return None, None
     
+    visible_chapters = chapter_index['chapters']
     prev_chapter = visible_chapters[current_index - 1] if current_index > 0 else None
     next_chapter = visible_chapters[current_index + 1] if current_index < len(visible_chapters) - 1 else None
     
@@ -2316,50 +2634,66 @@ def process_story_metadata(novel_config, story_length_stats, site_config, novel_
 
 def filter_hidden_chapters_from_novel(novel, novel_slug, lang):
     """Create a copy of novel data with hidden chapters filtered out for TOC display"""
-    filtered_novel = novel.copy()
-    filtered_arcs = []
+    return build_visible_chapter_index(novel, novel_slug, lang)['novel']
+
+# Parsed chapter files shared by every build phase, keyed on path and validated by mtime/size
+_chapter_cache = {}
+_chapter_cache_stats = {'hits': 0, 'misses': 0}
+
+def reset_chapter_cache():
+    """Clear cached chapter files and hit/miss counters (called at the start of each build)"""
+    _chapter_cache.clear()
+    _chapter_cache_stats['hits'] = 0
+    _chapter_cache_stats['misses'] = 0
+
+def read_chapter_file(chapter_file):
+    """Read and parse a chapter file, returning (markdown_content, front_matter) or None if missing.
     
-    for arc in novel.get('arcs', []):
-        filtered_chapters = []
-        
-        for chapter in arc.get('chapters', []):
-            try:
-                _, chapter_metadata = load_chapter_content(novel_slug, chapter['id'], lang)
-                if not should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                    # Add published date to chapter data for TOC display
-                    enhanced_chapter = chapter.copy()
-                    enhanced_chapter['published'] = chapter_metadata.get('published')
-                    filtered_chapters.append(enhanced_chapter)
-            except:
-                # Include chapters that can't be loaded (they might exist in other languages)
-                filtered_chapters.append(chapter)
-        
-        # Only include arcs that have visible chapters
-        if filtered_chapters:
-            filtered_arc = arc.copy()
-            filtered_arc['chapters'] = filtered_chapters
-            filtered_arcs.append(filtered_arc)
+    Each file is opened and parsed once per build; later calls are served from memory as long as
+    the file's mtime and size are unchanged. The returned objects are shared, so treat them as read-only.
+    """
+    record_build_input(chapter_file)
+    try:
+        file_stat = os.stat(chapter_file)
+    except OSError:
+        return None
     
-    filtered_novel['arcs'] = filtered_arcs
-    return filtered_novel
+    cache_key = os.path.normpath(chapter_file)
+    signature = (file_stat.st_mtime_ns, file_stat.st_size)
+    cached = _chapter_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        _chapter_cache_stats['hits'] += 1
+        return cached[1]
+    
+    _chapter_cache_stats['misses'] += 1
+    with open(chapter_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    front_matter, markdown_content = parse_front_matter(content)
+    result = (markdown_content, front_matter)
+    _chapter_cache[cache_key] = (signature, result)
+    return result
+
+def print_chapter_cache_stats():
+    """Print chapter cache hit/miss counts for the current build"""
+    hits = _chapter_cache_stats['hits']
+    misses = _chapter_cache_stats['misses']
+    total = hits + misses
+    hit_rate = (hits / total * 100) if total else 0
+    print(f"Chapter cache: {hits} hits, {misses} misses ({len(_chapter_cache)} files, {hit_rate:.1f}% hit rate)")
 
 def load_chapter_content(novel_slug, chapter_id, language='en'):
     """Load chapter content from markdown file with language support and front matter parsing"""
     # Try language-specific file first
     chapter_file = os.path.join(CONTENT_DIR, novel_slug, "chapters", language, f"{chapter_id}.md")
-    if os.path.exists(chapter_file):
-        with open(chapter_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            front_matter, markdown_content = parse_front_matter(content)
-            return markdown_content, front_matter
+    chapter_data = read_chapter_file(chapter_file)
+    if chapter_data is not None:
+        return chapter_data
     
     # Fallback to default language file (in root chapters folder)
     chapter_file = os.path.join(CONTENT_DIR, novel_slug, "chapters", f"{chapter_id}.md")
-    if os.path.exists(chapter_file):
-        with open(chapter_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            front_matter, markdown_content = parse_front_matter(content)
-            return markdown_content, front_matter
+    chapter_data = read_chapter_file(chapter_file)
+    if chapter_data is not None:
+        return chapter_data
     
     return f"# {chapter_id}\n\nContent not found for language: {language}.", {}
 
@@ -2379,6 +2713,7 @@ def get_available_languages(novel_slug):
 def chapter_translation_exists(novel_slug, chapter_id, language):
     """Check if a chapter translation exists for a specific language"""
     chapter_file = os.path.join(CONTENT_DIR, novel_slug, "chapters", language, f"{chapter_id}.md")
+    record_build_input(chapter_file)
     return os.path.exists(chapter_file)
 
 def parse_front_matter(content):
@@ -2434,26 +2769,28 @@ def collect_tags_for_novel(novel_slug, language):
                     chapter_id = filename[:-3]  # Remove .md extension
                     chapter_file = os.path.join(search_dir, filename)
                     
-                    with open(chapter_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        front_matter, _ = parse_front_matter(content)
-                        
-                        # Skip hidden chapters from tag collections
-                        if is_chapter_hidden(front_matter):
-                            continue
-                        
-                        chapter_tags = front_matter.get('tags', [])
-                        chapter_title = front_matter.get('title', f'Chapter {chapter_id}')
+                    # Skip chapters that vanished or can't be read since the directory was listed
+                    chapter_data = read_chapter_file(chapter_file)
+                    if chapter_data is None:
+                        continue
+                    _, front_matter = chapter_data
+                    
+                    # Skip hidden chapters from tag collections
+                    if is_chapter_hidden(front_matter):
+                        continue
+                    
+                    chapter_tags = front_matter.get('tags', [])
+                    chapter_title = front_matter.get('title', f'Chapter {chapter_id}')
+                    
+                    for tag in chapter_tags:
+                        if tag not in tags_data:
+                            tags_data[tag] = []
                         
-                        for tag in chapter_tags:
-                            if tag not in tags_data:
-                                tags_data[tag] = []
-                            
-                            tags_data[tag].append({
-                                'id': chapter_id,
-                                'title': chapter_title,
-                                'filename': filename
-                            })
+                        tags_data[tag].append({
+                            'id': chapter_id,
+                            'title': chapter_title,
+                            'filename': filename
+                        })
     
     return tags_data
 
@@ -2507,6 +2844,177 @@ def extract_local_images(markdown_content):
     
     return local_images
 
+# Responsive image variants: resized (and re-encoded) copies of chapter images and manga pages for srcset
+RESPONSIVE_IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, "responsive")
+RESPONSIVE_IMAGE_CACHE_VERSION = 1
+RESPONSIVE_IMAGE_CACHE_MAX_AGE_DAYS = 30
+# Subdirectory of each chapter's image directory holding the variants
+RESPONSIVE_VARIANT_DIR = "variants"
+RESPONSIVE_IMAGE_FORMATS = {'.jpg': 'jpeg', '.jpeg': 'jpeg', '.png': 'png', '.webp': 'webp'}
+RESPONSIVE_IMAGE_EXTENSIONS = {'jpeg': 'jpg', 'png': 'png', 'webp': 'webp', 'avif': 'avif'}
+_responsive_image_settings = {'enabled': False, 'widths': [], 'formats': [], 'quality': 80, 'sizes': '', 'threads': 1}
+
+def configure_responsive_images(site_config, threads=None):
+    """Apply responsive_images settings from site_config.yaml; returns the formats Pillow cannot encode"""
+    image_config = site_config.get('responsive_images', {})
+    enabled = image_config.get('enabled', False)
+    requested_formats = [str(image_format).lower() for image_format in image_config.get('formats', ['avif', 'webp'])]
+    formats = []
+    
+    if enabled:
+        try:
+            from PIL import Image
+            Image.init()
+            formats = [image_format for image_format in requested_formats
+                       if image_format in RESPONSIVE_IMAGE_EXTENSIONS and image_format.upper() in Image.SAVE]
+        except ImportError:
+            print("[ERROR] Pillow library not found, responsive images disabled. Install with: pip install Pillow")
+            enabled = False
+    
+    _responsive_image_settings.update({
+        'enabled': enabled,
+        'widths': sorted({int(width) for width in image_config.get('widths', [480, 800, 1200])}),
+        'formats': formats,
+        'quality': image_config.get('quality', 80),
+        'sizes': image_config.get('sizes', '(max-width: 800px) 100vw, 800px'),
+        'threads': threads or os.cpu_count() or 1
+    })
+    return [image_format for image_format in requested_formats if enabled and image_format not in formats]
+
+def responsive_variant_cache_path(source_digest, width, image_format, quality):
+    """Get the cached variant file for an image's content hash, width, format and quality"""
+    key = hashlib.sha256(json.dumps([RESPONSIVE_IMAGE_CACHE_VERSION, source_digest, width, image_format, quality]).encode('utf-8')).hexdigest()
+    return os.path.join(RESPONSIVE_IMAGE_CACHE_DIR, key[:2], f"{key}.{RESPONSIVE_IMAGE_EXTENSIONS[image_format]}")
+
+def encode_image_variant(source_file, variant_file, width, image_format, quality):
+    """Resize an image to width and encode it as image_format; returns an error message or None"""
+    try:
+        from PIL import Image, ImageOps
+        
+        temp_file = f"{variant_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with Image.open(source_file) as img:
+            # Variants carry no EXIF, so bake in the orientation browsers apply to the original
+            img = ImageOps.exif_transpose(img)
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            if img.width > width:
+                img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+            
+            if image_format == 'png':
+                img.save(temp_file, 'PNG')
+            else:
+                if image_format == 'jpeg' and img.mode != 'RGB':
+                    # JPEG has no transparency, so flatten onto a white background
+                    background = Image.new('RGB', img.size, (255, 255, 255))
+                    img = img.convert('RGBA')
+                    background.paste(img, mask=img.split()[-1])
+                    img = background
+                img.save(temp_file, image_format.upper(), quality=quality)
+        os.replace(temp_file, variant_file)
+        return None
+    except Exception as e:
+        return str(e)
+
+def build_responsive_image(source_file, dest_image_path, url_prefix):
+    """Write resized variants of an image copied into the build and return its srcset data.
+    
+    Variants are encoded once per image content into .cache/responsive, several at a time, and copied
+    into a variants folder next to the image. Returns None when responsive images are disabled or the
+    image cannot be read.
+    """
+    settings = _responsive_image_settings
+    base_format = RESPONSIVE_IMAGE_FORMATS.get(os.path.splitext(dest_image_path)[1].lower())
+    if not settings['enabled'] or not base_format:
+        return None
+    
+    try:
+        from PIL import Image
+        with Image.open(source_file) as img:
+            width, height = img.size
+            # EXIF orientations 5-8 rotate the image by 90 degrees
+            if img.getexif().get(0x0112) in (5, 6, 7, 8):
+                width, height = height, width
+    except Exception as e:
+        print(f"[WARNING] Failed to read image {source_file}: {e}")
+        return None
+    
+    source_digest = hash_build_input(source_file)
+    quality = settings['quality']
+    widths = [variant_width for variant_width in settings['widths'] if variant_width < width] + [width]
+    formats = [image_format for image_format in settings['formats'] if image_format != base_format] + [base_format]
+    image_name = os.path.basename(dest_image_path)
+    stem = os.path.splitext(image_name)[0]
+    variant_dir = os.path.join(os.path.dirname(dest_image_path), RESPONSIVE_VARIANT_DIR)
+    
+    variants = []
+    for image_format in formats:
+        for variant_width in widths:
+            # The copied original is the full-width variant in its own format
+            if image_format == base_format and variant_width == width:
+                continue
+            variant_name = f"{stem}-{variant_width}w.{RESPONSIVE_IMAGE_EXTENSIONS[image_format]}"
+            variants.append((variant_name, variant_width, image_format,
+                             responsive_variant_cache_path(source_digest, variant_width, image_format, quality)))
+    
+    missing = [variant for variant in variants if not os.path.exists(variant[3])]
+    for variant in missing:
+        os.makedirs(os.path.dirname(variant[3]), exist_ok=True)
+    
+    def encode(variant):
+        return encode_image_variant(source_file, variant[3], variant[1], variant[2], quality)
+    
+    if settings['threads'] > 1 and len(missing) > 1:
+        # Pillow releases the GIL while resizing and encoding
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(settings['threads'], len(missing))) as executor:
+            errors = list(executor.map(encode, missing))
+    else:
+        errors = [encode(variant) for variant in missing]
+    for variant, error in zip(missing, errors):
+        if error:
+            print(f"[WARNING] Failed to resize {source_file} to {variant[1]}px {variant[2]}: {error}")
+    
+    os.makedirs(variant_dir, exist_ok=True)
+    encoded = {variant[3] for variant in missing}
+    srcsets = {image_format: [] for image_format in formats}
+    for variant_name, variant_width, image_format, cache_file in variants:
+        if not os.path.exists(cache_file):
+            continue
+        if cache_file not in encoded:
+            # Mark the cache entry as used so pruning keeps it
+            os.utime(cache_file)
+        variant_path = os.path.join(variant_dir, variant_name)
+        emit_file(cache_file, variant_path)
+        record_build_output(variant_path)
+        srcsets[image_format].append(f"{url_prefix}{RESPONSIVE_VARIANT_DIR}/{variant_name} {variant_width}w")
+    srcsets[base_format].append(f"{url_prefix}{image_name} {width}w")
+    
+    return {
+        'width': width,
+        'height': height,
+        'sizes': settings['sizes'],
+        'srcset': ", ".join(srcsets[base_format]),
+        'sources': [{'type': f"image/{image_format}", 'srcset': ", ".join(srcsets[image_format])}
+                    for image_format in formats if image_format != base_format and srcsets[image_format]]
+    }
+
+def responsive_image_html(img_tag, responsive):
+    """Add srcset, sizes and intrinsic dimensions to an <img> tag, wrapping it in <picture> for extra formats"""
+    attributes = f' srcset="{responsive["srcset"]}" sizes="{responsive["sizes"]}"'
+    # Leave the dimensions alone when the author sized the image themselves
+    if not re.search(r'\s(?:width|height)\s*=|style\s*=\s*["\'][^"\']*\b(?:width|height)\s*:', img_tag, re.IGNORECASE):
+        attributes += f' width="{responsive["width"]}" height="{responsive["height"]}"'
+    img_tag = re.sub(r'\s*/?>$', lambda match: attributes + match.group(0), img_tag, count=1)
+    
+    if not responsive['sources']:
+        return img_tag
+    sources = "".join(f'<source type="{source["type"]}" srcset="{source["srcset"]}" sizes="{responsive["sizes"]}">'
+                      for source in responsive['sources'])
+    return f"<picture>{sources}{img_tag}</picture>"
+
+def prune_responsive_image_cache():
+    """Delete cached image variants that have not been used for RESPONSIVE_IMAGE_CACHE_MAX_AGE_DAYS"""
+    prune_image_cache(RESPONSIVE_IMAGE_CACHE_DIR, RESPONSIVE_IMAGE_CACHE_MAX_AGE_DAYS)
+
 def process_chapter_images(novel_slug, chapter_id, language, markdown_content):
     """Process and copy chapter images, return updated markdown content"""
     local_images = extract_local_images(markdown_content)
@@ -2527,17 +3035,29 @@ def process_chapter_images(novel_slug, chapter_id, language, markdown_content):
     
     for image_info in local_images:
         source_image_path = os.path.join(chapter_source_dir, image_info['original_path'])
+        record_build_input(source_image_path)
         
         if os.path.exists(source_image_path):
             # Copy image to build directory
             image_filename = os.path.basename(image_info['original_path'])
             dest_image_path = os.path.join(build_images_dir, image_filename)
-            shutil.copy2(source_image_path, dest_image_path)
+            emit_file(source_image_path, dest_image_path)
+            record_build_output(dest_image_path, source_image_path)
             
             # Update markdown content with new path (relative to the chapter page)
-            new_image_path = f"../../../images/{novel_slug}/{chapter_id}/{image_filename}"
+            image_url_prefix = f"../../../images/{novel_slug}/{chapter_id}/"
+            new_image_path = f"{image_url_prefix}{image_filename}"
+            responsive = build_responsive_image(source_image_path, dest_image_path, image_url_prefix)
+            
+            if image_info['type'] == 'markdown' and responsive:
+                # Responsive images need srcset attributes, so write the image as HTML
+                new_img_tag = f'<img alt="{html.escape(image_info["alt"])}" src="{new_image_path}"'
+                if image_info['title']:
+                    new_img_tag += f' title="{html.escape(image_info["title"])}"'
+                new_img_tag += ">"
+                updated_content = updated_content.replace(image_info['full_match'], responsive_image_html(new_img_tag, responsive))
             
-            if image_info['type'] == 'markdown':
+            elif image_info['type'] == 'markdown':
                 # Handle markdown images
                 new_markdown = f"![{image_info['alt']}]({new_image_path}"
                 if image_info['title']:
@@ -2550,10 +3070,111 @@ def process_chapter_images(novel_slug, chapter_id, language, markdown_content):
                 old_src_pattern = r'src\s*=\s*["\'][^"\']*["\']'
                 new_src = f'src="{new_image_path}"'
                 new_img_tag = re.sub(old_src_pattern, new_src, image_info['full_match'], flags=re.IGNORECASE)
+                if responsive:
+                    new_img_tag = responsive_image_html(new_img_tag, responsive)
                 updated_content = updated_content.replace(image_info['full_match'], new_img_tag)
     
     return updated_content
 
+def build_chapter_content_html(novel_slug, chapter_id, language, markdown_content, is_manga_chapter=False):
+    """Convert chapter markdown to the content HTML shown on its page (copying text chapter images)"""
+    if not is_manga_chapter:
+        markdown_content = process_chapter_images(novel_slug, chapter_id, language, markdown_content)
+    return convert_markdown_to_html(markdown_content)
+
+# Manga page details (dimensions, dominant colour, blurred placeholder) cached by page image hash
+MANGA_PAGE_CACHE_DIR = os.path.join(CACHE_DIR, "manga")
+MANGA_PAGE_CACHE_VERSION = 1
+MANGA_PAGE_CACHE_MAX_AGE_DAYS = 30
+MANGA_PAGE_PLACEHOLDER_WIDTH = 16
+# Per-chapter page manifest written next to each manga chapter page and fetched by the reader
+MANGA_PAGE_MANIFEST = "pages.json"
+
+def natural_sort_key(name):
+    """Sort key that orders embedded numbers numerically (page2 before page10)"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+
+def read_manga_page_details(page_file):
+    """Get a page's width, height, dominant colour and placeholder data URI, cached by image hash"""
+    key = hashlib.sha256(json.dumps([MANGA_PAGE_CACHE_VERSION, hash_build_input(page_file), MANGA_PAGE_PLACEHOLDER_WIDTH]).encode('utf-8')).hexdigest()
+    cache_file = os.path.join(MANGA_PAGE_CACHE_DIR, key[:2], f"{key}.json")
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            details = json.load(f)
+        # Mark the cache entry as used so pruning keeps it
+        os.utime(cache_file)
+        return details
+    except (OSError, ValueError):
+        pass
+    
+    details = {'width': None, 'height': None, 'color': None, 'placeholder': None}
+    try:
+        from PIL import Image, ImageOps
+    except ImportError:
+        return details
+    
+    try:
+        with Image.open(page_file) as img:
+            # Opening only reads the header, so the size is known without decoding the page
+            width, height = img.size
+            # EXIF orientations 5-8 rotate the image by 90 degrees
+            if img.getexif().get(0x0112) in (5, 6, 7, 8):
+                width, height = height, width
+            details['width'], details['height'] = width, height
+            
+            placeholder_height = max(1, round(height * MANGA_PAGE_PLACEHOLDER_WIDTH / width))
+            # JPEG pages are decoded at a reduced scale
+            img.draft('RGB', (MANGA_PAGE_PLACEHOLDER_WIDTH, placeholder_height))
+            thumbnail = ImageOps.exif_transpose(img).convert('RGB').resize(
+                (MANGA_PAGE_PLACEHOLDER_WIDTH, placeholder_height), Image.LANCZOS)
+    except Exception as e:
+        print(f"    Warning: Could not read manga page {page_file}: {e}")
+        return details
+    
+    details['color'] = '#{:02x}{:02x}{:02x}'.format(*thumbnail.resize((1, 1), Image.BOX).getpixel((0, 0)))
+    # WebP keeps the placeholder a few hundred bytes; JPEG headers alone are larger
+    Image.init()
+    placeholder_format = 'WEBP' if 'WEBP' in Image.SAVE else 'JPEG'
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, placeholder_format, quality=60)
+    details['placeholder'] = f"data:image/{placeholder_format.lower()};base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(details, f)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+    
+    return details
+
+def prune_manga_page_cache():
+    """Delete cached manga page details that have not been used for MANGA_PAGE_CACHE_MAX_AGE_DAYS"""
+    prune_image_cache(MANGA_PAGE_CACHE_DIR, MANGA_PAGE_CACHE_MAX_AGE_DAYS)
+
+def write_manga_page_manifest(chapter_dir, chapter_id, manga_data):
+    """Write the page manifest the manga reader fetches for preloading and placeholders"""
+    manifest = {
+        'chapter_id': chapter_id,
+        'page_count': manga_data['page_count'],
+        'pages': [{
+            'number': page['number'],
+            'url': page['path'],
+            'width': page.get('width'),
+            'height': page.get('height'),
+            'color': page.get('color'),
+            'placeholder': page.get('placeholder'),
+            'srcset': page.get('srcset'),
+            'sizes': page.get('sizes'),
+            'alt_text': page['alt_text']
+        } for page in manga_data['pages']]
+    }
+    manifest_file = os.path.join(chapter_dir, MANGA_PAGE_MANIFEST)
+    record_build_output(manifest_file)
+    write_text_output(manifest_file, json.dumps(manifest, ensure_ascii=False, separators=(',', ':')))
+
 def process_manga_pages(novel_slug, chapter_id, language, chapter_metadata, novel_config):
     """Process manga pages for a manga chapter and return page data"""
     # Determine chapter source directory
@@ -2567,6 +3188,8 @@ def process_manga_pages(novel_slug, chapter_id, language, chapter_metadata, nove
     
     # First, try to find pages in a subfolder named after the chapter_id
     chapter_subfolder = os.path.join(chapter_source_dir, chapter_id)
+    record_build_input(chapter_subfolder)
+    record_build_input(chapter_source_dir)
     if os.path.exists(chapter_subfolder):
         # Scan for page files in the subfolder
         for ext in ['png', 'jpg', 'jpeg', 'webp']:
@@ -2583,8 +3206,8 @@ def process_manga_pages(novel_slug, chapter_id, language, chapter_metadata, nove
         print(f"    Warning: No manga pages found for {chapter_id}")
         return {}
     
-    # Sort pages naturally (page01, page02, etc.)
-    page_files.sort(key=lambda x: os.path.basename(x))
+    # Sort pages naturally (page1, page2, ..., page10)
+    page_files.sort(key=lambda x: natural_sort_key(os.path.basename(x)))
     
     # Create images directory in build
     build_images_dir = os.path.normpath(os.path.join(BUILD_DIR, "images", novel_slug, chapter_id))
@@ -2597,11 +3220,14 @@ def process_manga_pages(novel_slug, chapter_id, language, chapter_metadata, nove
         dest_image_path = os.path.join(build_images_dir, page_filename)
         
         # Copy image to build directory
-        shutil.copy2(page_file, dest_image_path)
+        emit_file(page_file, dest_image_path)
+        record_build_input(page_file)
+        record_build_output(dest_image_path, page_file)
         
         # Build page data
         page_number = i + 1
-        page_path = f"../../../images/{novel_slug}/{chapter_id}/{page_filename}"
+        page_url_prefix = f"../../../images/{novel_slug}/{chapter_id}/"
+        page_path = f"{page_url_prefix}{page_filename}"
         
         # Generate alt text from pattern or use default
         alt_pattern = chapter_metadata.get('page_alt_pattern', '{story_title} Chapter {chapter_number}, Page {page}')
@@ -2619,6 +3245,9 @@ def process_manga_pages(novel_slug, chapter_id, language, chapter_metadata, nove
             'path': page_path,
             'alt_text': alt_text
         }
+        page_data.update(read_manga_page_details(page_file))
+        # Add srcset, sizes and sources when responsive images are enabled
+        page_data.update(build_responsive_image(page_file, dest_image_path, page_url_prefix) or {})
         pages_data.append(page_data)
     
     # Get manga configuration
@@ -2637,7 +3266,8 @@ def process_manga_pages(novel_slug, chapter_id, language, chapter_metadata, nove
     return {
         'pages': pages_data,
         'page_count': len(pages_data),
-        'config': manga_config
+        'config': manga_config,
+        'manifest_url': MANGA_PAGE_MANIFEST
     }
 
 # Add the slugify_tag function as a Jinja2 filter
@@ -2737,6 +3367,70 @@ def load_all_novels_data():
     
     return novels
 
+# Extensions used for chapter and page content
+MARKDOWN_EXTENSIONS = [
+    'tables',      # Table support for comparisons/data
+    'footnotes',   # Author notes, translation notes
+    'smarty',      # Professional typography (curly quotes, em-dashes)
+    'attr_list',   # Custom CSS classes {: .class-name}
+    'md_in_html',  # Mix markdown inside HTML blocks
+    'abbr',        # Abbreviations with hover tooltips
+    'nl2br'        # Convert single newlines to <br> tags
+]
+
+# Converted HTML keyed on a hash of the markdown source, shared across builds
+MARKDOWN_CACHE_DIR = os.path.join(CACHE_DIR, "markdown")
+MARKDOWN_CACHE_VERSION = 2
+MARKDOWN_CACHE_MAX_AGE_DAYS = 30
+
+# One configured converter per thread (worker processes get their own), reset between documents
+_markdown_local = threading.local()
+_markdown_cache_stats = {'hits': 0, 'misses': 0}
+
+def get_markdown_converter():
+    """Return this thread's Markdown converter, creating it on first use"""
+    converter = getattr(_markdown_local, 'converter', None)
+    if converter is None:
+        converter = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        _markdown_local.converter = converter
+        _markdown_local.inline_pattern_count = len(converter.inlinePatterns)
+    return converter
+
+def release_markdown_converter(converter):
+    """Drop this thread's converter if the last document left per-document state that reset() keeps"""
+    # The abbr extension registers an inline pattern per *[ABBR]: definition and reset() does not remove them
+    if len(converter.inlinePatterns) != _markdown_local.inline_pattern_count:
+        _markdown_local.converter = None
+
+def markdown_cache_path(md_content):
+    """Get the HTML cache file for a piece of (preprocessed) markdown"""
+    key = hashlib.sha256(json.dumps([MARKDOWN_CACHE_VERSION, markdown.__version__, MARKDOWN_EXTENSIONS, md_content]).encode('utf-8')).hexdigest()
+    return os.path.join(MARKDOWN_CACHE_DIR, key[:2], f"{key}.html")
+
+def reset_markdown_cache_stats():
+    """Reset markdown cache hit/miss counters (called at the start of each build)"""
+    _markdown_cache_stats['hits'] = 0
+    _markdown_cache_stats['misses'] = 0
+
+def prune_markdown_cache():
+    """Delete cached HTML that has not been used for MARKDOWN_CACHE_MAX_AGE_DAYS"""
+    if not os.path.exists(MARKDOWN_CACHE_DIR):
+        return
+    cutoff = datetime.datetime.now().timestamp() - MARKDOWN_CACHE_MAX_AGE_DAYS * 86400
+    for cache_file in glob.glob(os.path.join(MARKDOWN_CACHE_DIR, "*", "*.html")):
+        try:
+            if os.path.getmtime(cache_file) < cutoff:
+                os.remove(cache_file)
+        except OSError:
+            pass
+
+def print_markdown_cache_stats():
+    """Print markdown HTML cache hit/miss counts for the current build"""
+    hits = _markdown_cache_stats['hits']
+    misses = _markdown_cache_stats['misses']
+    total = hits + misses
+    hit_rate = (hits / total * 100) if total else 0
+    print(f"Markdown cache: {hits} hits, {misses} conversions ({hit_rate:.1f}% hit rate)")
 
 def convert_markdown_to_html(md_content):
     # Hybrid approach: preserve line breaks using a different strategy
@@ -2756,16 +3450,32 @@ def convert_markdown_to_html(md_content):
     # Process multiple consecutive newlines
     preserved_content = re.sub(r'\n{3,}', preserve_multiple_breaks, md_content)
     
+    # Unchanged content is served from the HTML cache without running the converter
+    cache_file = markdown_cache_path(preserved_content)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        # Mark the cache entry as used so pruning keeps it
+        os.utime(cache_file)
+        _markdown_cache_stats['hits'] += 1
+        return html_content
+    except OSError:
+        pass
+    
     # Step 2: Use nl2br extension to handle single newlines and standard processing
-    html_content = markdown.markdown(preserved_content, extensions=[
-        'tables',      # Table support for comparisons/data
-        'footnotes',   # Author notes, translation notes
-        'smarty',      # Professional typography (curly quotes, em-dashes)
-        'attr_list',   # Custom CSS classes {: .class-name}
-        'md_in_html',  # Mix markdown inside HTML blocks
-        'abbr',        # Abbreviations with hover tooltips
-        'nl2br'        # Convert single newlines to <br> tags
-    ])
+    converter = get_markdown_converter()
+    html_content = converter.reset().convert(preserved_content)
+    release_markdown_converter(converter)
+    _markdown_cache_stats['misses'] += 1
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
     
     return html_content
 
@@ -2785,8 +3495,8 @@ def copy_static_assets(enable_minification=False):
         target_static_dir = os.path.normpath(os.path.join(BUILD_DIR, "static"))
         os.makedirs(target_static_dir, exist_ok=True)
         
-        # Files to add cache busting
-        cache_bust_files = ['style.css', 'theme-toggle.js']
+        # Files to add cache busting (chapter scripts are shared by every chapter page)
+        cache_bust_files = ['style.css', 'theme-toggle.js', 'chapter.js', 'manga-reader.js', 'password-unlock.js']
         
         for root, dirs, files in os.walk(STATIC_DIR):
             rel_dir = os.path.relpath(root, STATIC_DIR)
@@ -2829,10 +3539,9 @@ def copy_static_assets(enable_minification=False):
                     
                     # Write the file (minified or original)
                     if should_process_file:
-                        with open(dst_file, 'w', encoding='utf-8') as f:
-                            f.write(content)
+                        write_text_output(dst_file, content)
                     else:
-                        shutil.copy2(src_file, dst_file)
+                        emit_file(src_file, dst_file)
                         
                 else:
                     # Copy without modification (but still minify if enabled)
@@ -2847,10 +3556,9 @@ def copy_static_assets(enable_minification=False):
                         elif file_ext == '.js':
                             content = minify_js_content(content)
                         
-                        with open(dst_file, 'w', encoding='utf-8') as f:
-                            f.write(content)
+                        write_text_output(dst_file, content)
                     else:
-                        shutil.copy2(src_file, dst_file)
+                        emit_file(src_file, dst_file)
     
     return asset_map
 
@@ -2995,8 +3703,7 @@ def generate_static_pages(site_config):
                                        comments_theme=comments_config['theme'])
             
             # Write page
-            with open(os.path.join(page_dir, "index.html"), "w", encoding='utf-8') as f:
-                f.write(page_html)
+            write_text_output(os.path.join(page_dir, "index.html"), page_html)
             
             print(f"    Generated page: {page_slug} ({lang})")
     
@@ -3097,8 +3804,7 @@ def generate_page_index(site_config):
         
         # Write page index file
         index_filename = f"pages-{lang}.html" if lang != 'en' else "pages.html"
-        with open(os.path.join(BUILD_DIR, index_filename), "w", encoding='utf-8') as f:
-            f.write(page_index_html)
+        write_text_output(os.path.join(BUILD_DIR, index_filename), page_index_html)
         
         print(f"    Generated page index: {index_filename}")
     
@@ -3118,6 +3824,10 @@ def render_template(template_name, novel_slug=None, site_config=None, novel_conf
         template_env = env
         template = env.get_template(template_name)
     
+    # Record every override location so adding a novel-specific template invalidates the output
+    for search_path in template_env.loader.searchpath:
+        record_build_input(os.path.join(search_path, template_name))
+    
     # Set up configurable is_chapter_new filter if configs are provided
     if site_config is not None:
         is_chapter_new_filter = create_is_chapter_new_filter(site_config, novel_config)
@@ -3133,95 +3843,1175 @@ def render_template(template_name, novel_slug=None, site_config=None, novel_conf
     if novel_config is not None:
         kwargs['novel_config'] = novel_config
     
-    return template.render(**kwargs)
-
-def build_site(include_drafts=False, include_scheduled=False, no_epub=False, optimize_images=False, serve_mode=False, serve_port=8000, no_minify=False):
-    global INCLUDE_DRAFTS, INCLUDE_SCHEDULED, ASSET_MAP
-    INCLUDE_DRAFTS = include_drafts
-    INCLUDE_SCHEDULED = include_scheduled
-    ASSET_MAP = {}
+    # Serve identical renders from the on-disk cache (only when the is_chapter_new filter was configured above)
+    cache_file = render_cache_path(template_env, template_name, kwargs) if site_config is not None else None
+    if cache_file:
+        cached_html = read_render_cache(cache_file)
+        if cached_html is not None:
+            return cached_html
     
-    # Load site configuration early to check minification settings
-    site_config = load_site_config()
+    html_content = template.render(**kwargs)
+    if cache_file:
+        write_render_cache(cache_file, html_content)
+    return html_content
+
+# Persistent render cache: rendered template output keyed on the template source chain,
+# the serialised context and the asset map, evicted least-recently-used by total size
+RENDER_CACHE_DIR = os.path.join(CACHE_DIR, "render")
+RENDER_CACHE_VERSION = 1
+_render_cache_settings = {'enabled': True, 'max_bytes': 100 * 1024 * 1024}
+_render_cache_stats = {'hits': 0, 'misses': 0}
+_template_chain_signatures = {}
+
+def configure_render_cache(site_config):
+    """Apply render_cache settings from site_config.yaml and reset per-build state"""
+    cache_config = site_config.get('render_cache', {})
+    _render_cache_settings['enabled'] = cache_config.get('enabled', True)
+    _render_cache_settings['max_bytes'] = int(cache_config.get('max_size_mb', 100) * 1024 * 1024)
+    _render_cache_stats['hits'] = 0
+    _render_cache_stats['misses'] = 0
+    _template_chain_signatures.clear()
+
+def template_chain_signature(template_env):
+    """Hash every template a Jinja environment can load (novel overrides first, then defaults)"""
+    search_paths = tuple(template_env.loader.searchpath)
+    if search_paths not in _template_chain_signatures:
+        templates = []
+        for search_path in search_paths:
+            for root, dirs, files in os.walk(search_path):
+                dirs.sort()
+                for file in sorted(files):
+                    file_path = os.path.join(root, file)
+                    templates.append((os.path.relpath(file_path, search_path), hash_build_input(file_path)))
+        _template_chain_signatures[search_paths] = hash_build_signature(search_paths, templates)
+    return _template_chain_signatures[search_paths]
+
+def _render_cache_json_default(value):
+    """Serialise dates in a render context; anything else makes the context uncacheable"""
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot cache render context value of type {type(value).__name__}")
+
+def render_cache_path(template_env, template_name, context):
+    """Get the render cache file for a template and context, or None if caching is disabled or impossible"""
+    if not _render_cache_settings['enabled']:
+        return None
+    try:
+        data = json.dumps([RENDER_CACHE_VERSION, hash_build_input(__file__), template_chain_signature(template_env),
+                           template_name, context, ASSET_MAP, datetime.date.today()],
+                          default=_render_cache_json_default, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    key = hashlib.sha256(data.encode('utf-8')).hexdigest()
+    return os.path.join(RENDER_CACHE_DIR, key[:2], f"{key}.html")
+
+def read_render_cache(cache_file):
+    """Return cached HTML (marking the entry as recently used), or None on a miss"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+        os.utime(cache_file)
+    except OSError:
+        _render_cache_stats['misses'] += 1
+        return None
+    _render_cache_stats['hits'] += 1
+    return html_content
+
+def write_render_cache(cache_file, html_content):
+    """Store rendered HTML atomically so parallel workers can share the cache"""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+def prune_render_cache():
+    """Evict least-recently-used render cache entries until the cache fits its size cap"""
+    if not os.path.exists(RENDER_CACHE_DIR):
+        return
+    entries = []
+    total_size = 0
+    for cache_file in glob.glob(os.path.join(RENDER_CACHE_DIR, "*", "*.html")):
+        try:
+            file_stat = os.stat(cache_file)
+        except OSError:
+            continue
+        entries.append((file_stat.st_mtime, file_stat.st_size, cache_file))
+        total_size += file_stat.st_size
     
-    # Determine if minification should be applied
-    # Site config can enable/disable, but command line flags override
-    site_minify_enabled = site_config.get('minification', {}).get('enabled', True)
-    if no_minify:
-        enable_minification = False
-    elif serve_mode:
-        enable_minification = False  # Never minify in serve mode
+    entries.sort()
+    for mtime, size, cache_file in entries:
+        if total_size <= _render_cache_settings['max_bytes']:
+            break
+        try:
+            os.remove(cache_file)
+            total_size -= size
+        except OSError:
+            pass
+
+def print_render_cache_stats():
+    """Print render cache hit/miss counts for the current build"""
+    hits = _render_cache_stats['hits']
+    misses = _render_cache_stats['misses']
+    total = hits + misses
+    hit_rate = (hits / total * 100) if total else 0
+    print(f"Render cache: {hits} hits, {misses} misses ({hit_rate:.1f}% hit rate)")
+
+# Build profiling: wall time per build_site phase and per build task, written out by --profile
+BUILD_PROFILE_JSON = "build_profile.json"
+BUILD_PROFILE_MARKDOWN = "build_profile.md"
+BUILD_PROFILE_PSTATS = "build_profile.pstats"
+BUILD_PROFILE_TOP_N = 20
+_build_profile = {'started': None, 'total': 0.0, 'phases': {}, 'current_phase': None, 'tasks': {}}
+
+def reset_build_profile():
+    """Start timing a new build"""
+    _build_profile.update({'started': time.perf_counter(), 'total': 0.0, 'phases': {},
+                           'current_phase': None, 'tasks': {}})
+
+def start_build_phase(name):
+    """End the running build phase and start timing the named one (repeated phases accumulate)"""
+    now = time.perf_counter()
+    current = _build_profile['current_phase']
+    if current:
+        phase = _build_profile['phases'].setdefault(current[0], {'seconds': 0.0, 'runs': 0})
+        phase['seconds'] += now - current[1]
+        phase['runs'] += 1
+    _build_profile['current_phase'] = (name, now) if name else None
+
+def finish_build_profile():
+    """Close the last build phase and record the total build time"""
+    start_build_phase(None)
+    if _build_profile['started'] is not None:
+        _build_profile['total'] = time.perf_counter() - _build_profile['started']
+
+def record_task_timing(task_id, seconds):
+    """Record how long a freshly run build task took"""
+    _build_profile['tasks'][task_id] = seconds
+
+def collect_build_profile(top_n=BUILD_PROFILE_TOP_N):
+    """Summarise the last build's phase and task timings"""
+    total = _build_profile['total']
+    phases = [{
+        'name': name,
+        'seconds': round(phase['seconds'], 4),
+        'runs': phase['runs'],
+        'percent': round(phase['seconds'] / total * 100, 1) if total else 0
+    } for name, phase in _build_profile['phases'].items()]
+    slowest = sorted(_build_profile['tasks'].items(), key=lambda item: item[1], reverse=True)[:top_n]
+    return {
+        'generated': datetime.datetime.now().isoformat(timespec='seconds'),
+        'total_seconds': round(total, 4),
+        'phases': phases,
+        'tasks_run': len(_build_profile['tasks']),
+        'tasks_reused': _build_manifest_stats['reused'],
+        'slowest_tasks': [{'task': task_id, 'seconds': round(seconds, 4)} for task_id, seconds in slowest]
+    }
+
+def write_build_profile(profiler=None, top_n=BUILD_PROFILE_TOP_N):
+    """Write the build profile as JSON and Markdown (plus a pstats dump when cProfile was used)"""
+    profile = collect_build_profile(top_n)
+    report_dir = os.path.dirname(BUILD_DIR)
+    
+    json_path = os.path.join(report_dir, BUILD_PROFILE_JSON)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, indent=2, ensure_ascii=False)
+    
+    markdown_path = os.path.join(report_dir, BUILD_PROFILE_MARKDOWN)
+    with open(markdown_path, 'w', encoding='utf-8') as f:
+        f.write("# Build Profile\n\n")
+        f.write(f"Generated: {profile['generated']}\n\n")
+        f.write(f"Total build time: **{profile['total_seconds']:.2f}s** "
+                f"({profile['tasks_run']} tasks run, {profile['tasks_reused']} reused)\n\n")
+        f.write("## Phases\n\n")
+        f.write("| Phase | Seconds | Share | Runs |\n")
+        f.write("|-------|---------|-------|------|\n")
+        for phase in profile['phases']:
+            f.write(f"| {phase['name']} | {phase['seconds']:.3f} | {phase['percent']:.1f}% | {phase['runs']} |\n")
+        f.write(f"\n## Slowest Tasks (top {top_n})\n\n")
+        if profile['slowest_tasks']:
+            f.write("| Task | Seconds |\n")
+            f.write("|------|---------|\n")
+            for task in profile['slowest_tasks']:
+                f.write(f"| `{task['task']}` | {task['seconds']:.3f} |\n")
+        else:
+            f.write("No tasks were run; every task was reused from the previous build.\n")
+    
+    print(f"\n[INFO] Build profile written to: {json_path} and {markdown_path}")
+    
+    if profiler:
+        pstats_path = os.path.join(report_dir, BUILD_PROFILE_PSTATS)
+        profiler.dump_stats(pstats_path)
+        print(f"[INFO] cProfile statistics written to: {pstats_path} (python -m pstats {BUILD_PROFILE_PSTATS})")
+
+# Persistent build manifest: records each build task's inputs (with content hashes) and the
+# outputs it produced, so unchanged chapter pages can be reused by the next non-clean build
+BUILD_MANIFEST_FILE = os.path.join(CACHE_DIR, "build_manifest.json")
+BUILD_MANIFEST_VERSION = 1
+_build_manifest = {'previous': {}, 'untracked': set(), 'tasks': {}}
+_build_manifest_stats = {'reused': 0, 'rendered': 0, 'removed': 0}
+_current_build_task = None
+_input_hash_cache = {}
+
+def hash_build_input(path):
+    """Return the content hash of a build input (directories hash their listing, missing paths are None)"""
+    path = os.path.normpath(path)
+    if path in _input_hash_cache:
+        return _input_hash_cache[path]
+    
+    if os.path.isfile(path):
+        hasher = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(65536), b''):
+                hasher.update(block)
+        digest = hasher.hexdigest()
+    elif os.path.isdir(path):
+        listing = '\n'.join(sorted(os.listdir(path)))
+        digest = 'dir:' + hashlib.sha256(listing.encode('utf-8')).hexdigest()
     else:
-        enable_minification = site_minify_enabled and should_minify(serve_mode=serve_mode, no_minify=no_minify)
+        digest = None
     
-    print("Building site...")
-    if os.path.exists(BUILD_DIR):
-        # On Windows, retry deletion if it fails due to file locks
-        import time
-        for attempt in range(3):
-            try:
-                shutil.rmtree(BUILD_DIR)
-                break
-            except (OSError, PermissionError) as e:
-                if attempt < 2:
-                    print(f"Retrying directory deletion (attempt {attempt + 1})...")
-                    time.sleep(0.5)
-                else:
-                    raise e
+    _input_hash_cache[path] = digest
+    return digest
+
+def hash_build_signature(*parts):
+    """Hash in-memory data (configs, navigation, flags) that a build task depends on"""
+    data = json.dumps(parts, default=str, ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def compute_build_signature(include_drafts, include_scheduled, serve_mode, serve_port, enable_minification):
+    """Signature of the generator and build flags; a mismatch invalidates the whole manifest"""
+    return hash_build_signature(BUILD_MANIFEST_VERSION, hash_build_input(__file__),
+                                include_drafts, include_scheduled, serve_mode, serve_port, enable_minification)
+
+def load_build_manifest(build_signature):
+    """Load the previous build manifest, or None if a full rebuild is required"""
+    if not os.path.isdir(BUILD_DIR) or not os.path.exists(BUILD_MANIFEST_FILE):
+        return None
+    try:
+        with open(BUILD_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Ignoring unreadable build manifest: {e}")
+        return None
     
-    # Ensure directory is created with retry
-    for attempt in range(3):
-        try:
-            os.makedirs(BUILD_DIR, exist_ok=True)
-            break
-        except (OSError, PermissionError) as e:
-            if attempt < 2:
-                print(f"Retrying directory creation (attempt {attempt + 1})...")
-                time.sleep(0.5)
-            else:
-                raise e
+    if manifest.get('version') != BUILD_MANIFEST_VERSION or manifest.get('build_signature') != build_signature:
+        return None
+    return manifest
+
+def reset_build_manifest(previous_manifest=None):
+    """Start tracking build tasks, optionally against the previous build's manifest"""
+    global _current_build_task
+    _build_manifest['previous'] = previous_manifest.get('tasks', {}) if previous_manifest else {}
+    _build_manifest['untracked'] = find_untracked_outputs(previous_manifest) if previous_manifest else set()
+    _build_manifest['tasks'] = {}
+    _build_manifest_stats.update({'reused': 0, 'rendered': 0, 'removed': 0})
+    _current_build_task = None
+    _input_hash_cache.clear()
+
+def record_build_input(path):
+    """Record a file or directory read by the build task currently running"""
+    if _current_build_task is not None:
+        _current_build_task['inputs'].add(os.path.normpath(path))
+
+def record_build_output(path, source_path=None):
+    """Record a file written by the build task currently running (source_path for plain copies)"""
+    if _current_build_task is not None:
+        output = os.path.relpath(path, BUILD_DIR).replace(os.sep, '/')
+        _current_build_task['outputs'][output] = os.path.normpath(source_path) if source_path else None
+
+def begin_build_task(inputs=()):
+    """Start collecting inputs and outputs for a build task"""
+    global _current_build_task
+    _current_build_task = {'inputs': set(os.path.normpath(path) for path in inputs), 'outputs': {},
+                           'started': time.perf_counter()}
+
+def end_build_task(signature):
+    """Finish the current build task and return its manifest record"""
+    global _current_build_task
+    task = _current_build_task
+    _current_build_task = None
+    return {
+        'signature': signature,
+        'inputs': {path: hash_build_input(path) for path in sorted(task['inputs'])},
+        'outputs': task['outputs'],
+        'seconds': time.perf_counter() - task['started']
+    }
 
-    ASSET_MAP = copy_static_assets(enable_minification=enable_minification)
+def store_build_task(task_id, record):
+    """Add a freshly run task to the manifest"""
+    record_task_timing(task_id, record.pop('seconds', 0.0))
+    _build_manifest['tasks'][task_id] = record
+    _build_manifest_stats['rendered'] += 1
+
+def run_build_task(task_id, signature, inputs, task_func, *args, **kwargs):
+    """Run a build task unless its previous outputs are still fresh; returns True if it ran"""
+    if reuse_build_task(task_id, signature):
+        return False
     
-    # Generate static pages
-    generate_static_pages(site_config)
+    begin_build_task(inputs)
+    task_func(*args, **kwargs)
+    store_build_task(task_id, end_build_task(signature))
+    return True
 
-    # Load all novels for processing
-    all_novels_data = load_all_novels_data()
+def reuse_build_task(task_id, signature):
+    """Keep a task's previous outputs if its signature and input hashes are unchanged"""
+    record = _build_manifest['previous'].get(task_id)
+    if not record or record.get('signature') != signature:
+        return False
     
-    # Process cover art for all novels first
-    for novel in all_novels_data:
-        novel_slug = novel['slug']
-        novel_config = load_novel_config(novel_slug)
-        
-        # Process cover art images and get processed paths
-        processed_images = process_cover_art(novel_slug, novel_config)
-        
-        # Update novel data with processed image paths
-        if processed_images.get('story_cover'):
-            if 'front_page' not in novel:
-                novel['front_page'] = {}
-            novel['front_page']['cover_art'] = processed_images['story_cover']
-        
-        # Update arc data with processed image paths
-        if novel_config.get('arcs') and novel.get('arcs'):
-            for i, arc in enumerate(novel_config['arcs']):
-                if i < len(novel['arcs']):  # Safety check
-                    arc_cover_key = f'arc_{i}_cover'
-                    if processed_images.get(arc_cover_key):
-                        novel['arcs'][i]['cover_art'] = processed_images[arc_cover_key]
+    for path, digest in record['inputs'].items():
+        if hash_build_input(path) != digest:
+            return False
+    for output in record['outputs']:
+        if not os.path.exists(os.path.join(BUILD_DIR, output)):
+            return False
     
-    # Filter novels for front page display
-    front_page_novels_data = []
+    # Replay plain copies so outputs shared between tasks end up as in a clean build
+    for output, source_path in record['outputs'].items():
+        if source_path:
+            dest_path = os.path.join(BUILD_DIR, output)
+            emit_file(source_path, dest_path)
     
-    # Get story sorting method with backward compatibility
-    front_page_config = site_config.get('front_page', {})
-    story_sort_method = front_page_config.get('story_sort_method')
+    _build_manifest['tasks'][task_id] = record
+    _build_manifest_stats['reused'] += 1
+    return True
+
+def _remove_build_output(output):
+    """Delete an output file and any build subdirectories it leaves empty"""
+    path = os.path.join(BUILD_DIR, output)
+    if os.path.exists(path):
+        os.remove(path)
+        discard_served_output(path)
+        record_output_write(path, 'deleted')
+        _build_manifest_stats['removed'] += 1
+    
+    parent = os.path.dirname(path)
+    while os.path.normpath(parent) != BUILD_DIR and os.path.isdir(parent) and not os.listdir(parent):
+        os.rmdir(parent)
+        parent = os.path.dirname(parent)
+
+def current_build_outputs():
+    """Outputs (relative to BUILD_DIR) of the tasks this build has run or reused so far"""
+    outputs = set()
+    for record in _build_manifest['tasks'].values():
+        outputs.update(record['outputs'])
+    return outputs
+
+def find_untracked_outputs(previous_manifest):
+    """List build files not owned by a task in the previous manifest; any this build does not write are pruned"""
+    keep = set()
+    for record in previous_manifest.get('tasks', {}).values():
+        keep.update(record['outputs'])
+    
+    untracked = set()
+    for root, dirs, files in os.walk(BUILD_DIR):
+        for name in files:
+            output = os.path.relpath(os.path.join(root, name), BUILD_DIR).replace(os.sep, '/')
+            if output not in keep:
+                untracked.add(output)
+    return untracked
+
+def save_build_manifest(build_signature):
+    """Remove outputs orphaned or no longer generated since the previous build and write the new manifest"""
+    claimed = current_build_outputs()
+    for record in _build_manifest['previous'].values():
+        for output in record['outputs']:
+            if output not in claimed:
+                _remove_build_output(output)
+                claimed.add(output)
+    
+    # Untracked files (static assets, pages) survive only if this build wrote them again
+    for output in sorted(_build_manifest['untracked'] - claimed - _written_outputs):
+        _remove_build_output(output)
+    
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(BUILD_MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': BUILD_MANIFEST_VERSION,
+            'build_signature': build_signature,
+            'tasks': _build_manifest['tasks']
+        }, f, indent=1, ensure_ascii=False)
+
+def print_build_manifest_stats():
+    """Print a summary of reused and re-rendered build tasks"""
+    stats = _build_manifest_stats
+    print(f"Incremental build: {stats['reused']} tasks reused, "
+          f"{stats['rendered']} rebuilt, {stats['removed']} orphaned outputs removed")
+
+def chapter_task_id(novel_slug, lang, chapter_id):
+    """Manifest task id for a rendered chapter page"""
+    return f"chapter:{novel_slug}/{lang}/{chapter_id}"
+
+def read_build_graph():
+    """Read the dependency graph (task inputs and outputs) recorded by the last build, or None"""
+    if not os.path.exists(BUILD_MANIFEST_FILE):
+        return None
+    try:
+        with open(BUILD_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f).get('tasks', {})
+    except (OSError, ValueError):
+        return None
+
+def find_dependent_tasks(tasks, path):
+    """Find tasks that read a path, directly or through a recorded directory listing"""
+    target = os.path.abspath(path)
+    parent = os.path.dirname(target)
+    dependents = []
+    for task_id, record in tasks.items():
+        for input_path, digest in record['inputs'].items():
+            input_abs = os.path.abspath(input_path)
+            if input_abs == target or (input_abs == parent and (digest is None or digest.startswith('dir:'))):
+                dependents.append(task_id)
+                break
+    return dependents
+
+def find_producing_tasks(tasks, path):
+    """Find tasks that wrote a build output (path may be absolute or relative to the build directory)"""
+    target = os.path.abspath(path)
+    if target.startswith(BUILD_DIR + os.sep):
+        output = os.path.relpath(target, BUILD_DIR).replace(os.sep, '/')
+    else:
+        output = path.replace(os.sep, '/').lstrip('/')
+        if output.startswith('build/'):
+            output = output[len('build/'):]
+    return [task_id for task_id, record in tasks.items() if output in record['outputs']]
+
+def explain_build_path(path):
+    """Print how a build output was produced, or which outputs depend on an input file"""
+    tasks = read_build_graph()
+    if tasks is None:
+        print("[ERROR] No build manifest found. Please generate the site first.")
+        return
     
-    # Backward compatibility: convert old boolean setting to new string format
-    if story_sort_method is None:
-        sort_by_recent_update = front_page_config.get('sort_by_recent_update', True)
-        story_sort_method = "recent_update" if sort_by_recent_update else "original"
+    producers = find_producing_tasks(tasks, path)
+    dependents = find_dependent_tasks(tasks, path)
+    
+    for task_id in producers:
+        record = tasks[task_id]
+        print(f"{path} is produced by task {task_id}")
+        print(f"  Inputs ({len(record['inputs'])}):")
+        for input_path, digest in sorted(record['inputs'].items()):
+            current = hash_build_input(input_path)
+            if current == digest:
+                status = "unchanged" if digest is not None else "absent"
+            else:
+                status = "changed" if digest is not None and current is not None else ("added" if digest is None else "removed")
+            print(f"    [{status}] {input_path}")
+        print(f"  Outputs ({len(record['outputs'])}):")
+        for output in sorted(record['outputs']):
+            print(f"    {output}")
+    
+    if dependents:
+        print(f"{path} is read by {len(dependents)} tasks:")
+        for task_id in sorted(dependents):
+            print(f"  {task_id}")
+            for output in sorted(tasks[task_id]['outputs']):
+                print(f"    -> {output}")
+    
+    if not producers and not dependents:
+        print(f"{path} is not tracked by the build graph.")
+        print("  Untracked pages (front page, static pages, assets) are regenerated on every build;")
+        print("  configuration and asset hash changes are detected through task signatures.")
+
+def write_site_feeds(site_config, all_novels_data):
+    """Write robots.txt, sitemap.xml and the site-wide RSS feed"""
+    # Generate robots.txt (using all novels)
+    robots_txt_content = generate_robots_txt(site_config, all_novels_data)
+    robots_file = os.path.join(BUILD_DIR, "robots.txt")
+    record_build_output(robots_file)
+    write_text_output(robots_file, robots_txt_content)
+
+    # Generate sitemap.xml (using all novels)
+    sitemap_xml_content = generate_sitemap_xml(site_config, all_novels_data)
+    sitemap_file = os.path.join(BUILD_DIR, "sitemap.xml")
+    record_build_output(sitemap_file)
+    write_text_output(sitemap_file, sitemap_xml_content)
+
+    # Generate site-wide RSS feed (using all novels)
+    site_rss_content = generate_rss_feed(site_config, all_novels_data)
+    rss_file = os.path.join(BUILD_DIR, "rss.xml")
+    record_build_output(rss_file)
+    write_text_output(rss_file, site_rss_content)
+
+def write_story_feed(site_config, all_novels_data, novel_config, novel_slug):
+    """Write the story-specific RSS feed"""
+    novel_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug))
+    os.makedirs(novel_dir, exist_ok=True)
+    story_rss_content = generate_rss_feed(site_config, all_novels_data, novel_config, novel_slug)
+    rss_file = os.path.join(novel_dir, "rss.xml")
+    record_build_output(rss_file)
+    write_text_output(rss_file, story_rss_content)
+
+def generate_author_pages(site_config, authors_config, all_novels_data, footer_data):
+    """Render the authors index and one page per author"""
+    author_contributions = collect_author_contributions(all_novels_data)
+    
+    # Create authors directory
+    authors_dir = os.path.normpath(os.path.join(BUILD_DIR, "authors"))
+    os.makedirs(authors_dir, exist_ok=True)
+    
+    # Build social metadata for authors index
+    authors_url = f"{site_config.get('site_url', '').rstrip('/')}/authors/"
+    authors_social_meta = build_social_meta(site_config, {}, {}, 'authors', "Authors", authors_url)
+    authors_seo_meta = build_seo_meta(site_config, {}, {}, 'authors')
+    
+    # Render authors index page
+    authors_index_file = os.path.join(authors_dir, "index.html")
+    record_build_output(authors_index_file)
+    write_text_output(authors_index_file, render_template("authors.html",
+                                                         authors=authors_config,
+                                                         site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                                         social_title=authors_social_meta['title'],
+                                                         social_description=authors_social_meta['description'],
+                                                         social_image=authors_social_meta['image'],
+                                                         social_url=authors_social_meta['url'],
+                                                         seo_meta_description=authors_seo_meta.get('meta_description'),
+                                                         seo_keywords=authors_social_meta.get('keywords'),
+                                                         allow_indexing=authors_seo_meta.get('allow_indexing', True),
+                                                         twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                                         footer_data=footer_data))
+    
+    # Generate individual author pages
+    for username, author_info in authors_config.items():
+        author_dir = os.path.normpath(os.path.join(authors_dir, username))
+        os.makedirs(author_dir, exist_ok=True)
+        
+        # Get contributions for this author (match by name)
+        author_name = author_info.get('name', username)
+        contributions = author_contributions.get(author_name, {'stories': [], 'chapters': []})
+        
+        # Sort chapters by publication date (most recent first)
+        if contributions['chapters']:
+            contributions['chapters'].sort(key=lambda x: x.get('published', '1900-01-01'), reverse=True)
+            
+            # Limit chapters based on site configuration
+            max_chapters = site_config.get('author_pages', {}).get('max_recent_chapters', 20)
+            if max_chapters > 0:
+                contributions['chapters'] = contributions['chapters'][:max_chapters]
+        
+        # Build social metadata for author
+        author_url = f"{site_config.get('site_url', '').rstrip('/')}/authors/{username}/"
+        author_social_meta = build_social_meta(site_config, {}, {}, 'author', f"{author_name} - Author", author_url)
+        author_seo_meta = build_seo_meta(site_config, {}, {}, 'author')
+        
+        # Render author page
+        author_file = os.path.join(author_dir, "index.html")
+        record_build_output(author_file)
+        write_text_output(author_file, render_template("author.html",
+                                                      author=author_info,
+                                                      stories=contributions['stories'],
+                                                      chapters=contributions['chapters'],
+                                                      max_chapters=max_chapters,
+                                                      site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                                      social_title=author_social_meta['title'],
+                                                      social_description=author_social_meta['description'],
+                                                      social_image=author_social_meta['image'],
+                                                      social_url=author_social_meta['url'],
+                                                      seo_meta_description=author_seo_meta.get('meta_description'),
+                                                      seo_keywords=author_social_meta.get('keywords'),
+                                                      allow_indexing=author_seo_meta.get('allow_indexing', True),
+                                                      twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                                      footer_data=footer_data))
+
+def generate_tag_pages(novel, novel_slug, lang, available_languages):
+    """Render the tags index and one page per tag for a novel/language"""
+    tags_data = collect_tags_for_novel(novel_slug, lang)
+    if not tags_data:
+        return
+    
+    # Create tags directory
+    tags_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug, lang, "tags"))
+    os.makedirs(tags_dir, exist_ok=True)
+    
+    # Create tag slug mapping for templates
+    tag_slug_map = {tag: slugify_tag(tag) for tag in tags_data.keys()}
+    
+    # Generate main tags index page
+    tags_index_file = os.path.join(tags_dir, "index.html")
+    record_build_output(tags_index_file)
+    write_text_output(tags_index_file, render_template("tags_index.html",
+                                                       novel_slug=novel_slug,
+                                                       novel=novel,
+                                                       tags_data=tags_data,
+                                                       tag_slug_map=tag_slug_map,
+                                                       current_language=lang,
+                                                       available_languages=available_languages))
+    
+    # Generate individual tag pages
+    for tag, chapters in tags_data.items():
+        tag_slug = slugify_tag(tag)
+        tag_page_dir = os.path.normpath(os.path.join(tags_dir, tag_slug))
+        os.makedirs(tag_page_dir, exist_ok=True)
+        
+        # Build cross-language tag mapping for this tag
+        cross_lang_tags = {}
+        for other_lang in available_languages:
+            if other_lang != lang:
+                other_tags_data = collect_tags_for_novel(novel_slug, other_lang)
+                # For now, just check if any tags exist in other language
+                # (proper cross-language tag mapping would require more complex logic)
+                if other_tags_data:
+                    cross_lang_tags[other_lang] = None  # Don't show cross-language links for now
+        
+        tag_page_file = os.path.join(tag_page_dir, "index.html")
+        record_build_output(tag_page_file)
+        write_text_output(tag_page_file, render_template("tag_page.html",
+                                                         novel_slug=novel_slug,
+                                                         novel=novel,
+                                                         tag_name=tag,
+                                                         tag_slug=tag_slug,
+                                                         chapters=chapters,
+                                                         current_language=lang,
+                                                         available_languages=available_languages,
+                                                         cross_lang_tags=cross_lang_tags))
+
+def read_epub_cover(cover_art_path, covers):
+    """Return the (file name, data) cover for an EPUB, reading each cover image once"""
+    if not cover_art_path:
+        return None
+    if cover_art_path not in covers:
+        cover_image_absolute = os.path.join(BUILD_DIR, cover_art_path)
+        record_build_input(cover_image_absolute)
+        covers[cover_art_path] = None
+        if os.path.exists(cover_image_absolute):
+            # Read cover image and create proper cover filename with extension
+            image_ext = os.path.splitext(cover_art_path)[1].lower()
+            with open(cover_image_absolute, 'rb') as img_file:
+                covers[cover_art_path] = (f"cover{image_ext}", img_file.read())
+    return covers[cover_art_path]
+
+def generate_novel_epubs(novel, novel_slug, novel_config, site_config, language):
+    """Generate the full story EPUB and any arc EPUBs for a novel/language.
+    
+    Chapter XHTML and images are prepared once and shared by every book. Books whose chapters,
+    images, cover and metadata are unchanged since they were last written are kept; the rest
+    are written on a thread pool.
+    """
+    # Check if this language has translated chapters
+    if not has_translated_chapters(novel_slug, language):
+        return
+    if not _check_ebooklib() or not epub_downloads_enabled(site_config, novel_config):
+        return
+    
+    language_suffix = f"-{language}" if language != novel_config.get('languages', {}).get('default', 'en') else ""
+    
+    try:
+        # Get non-hidden chapters for the specified language
+        chapters_data = get_chapters_for_epub(novel_config, novel_slug, language, INCLUDE_DRAFTS, INCLUDE_SCHEDULED)
+        if not chapters_data:
+            return
+        arc_parts, images = build_epub_chapter_parts(novel_slug, novel_config, chapters_data, language)
+        
+        story_title = novel_config.get('title', novel_slug)
+        author_name = novel_config.get('author', {}).get('name', 'Unknown Author')
+        description = novel_config.get('description', '')
+        epub_dir = os.path.normpath(os.path.join(BUILD_DIR, "static", "epub"))
+        os.makedirs(epub_dir, exist_ok=True)
+        covers = {}
+        books = []
+        
+        # Full story EPUB (with language suffix if not English), use processed cover path if available
+        cover_art_path = novel.get('front_page', {}).get('cover_art') or novel_config.get('front_page', {}).get('cover_art')
+        epub_filename = f"{novel_slug}.epub" if language == 'en' else f"{novel_slug}_{language}.epub"
+        books.append((os.path.join(epub_dir, epub_filename),
+                      f"{novel_slug}{language_suffix}",
+                      f"Error generating EPUB for {novel_slug}",
+                      (f'web-novel-{novel_slug}', story_title, author_name, description,
+                       read_epub_cover(cover_art_path, covers), arc_parts,
+                       [arc['title'] for arc in chapters_data] if len(chapters_data) > 1 else None)))
+        
+        # Arc-specific EPUBs if enabled
+        if novel_config.get('downloads', {}).get('include_arcs', True):
+            all_chapters = get_non_hidden_chapters(novel_config, novel_slug, language, INCLUDE_DRAFTS, INCLUDE_SCHEDULED)
+            for arc_index, arc in enumerate(all_chapters):
+                # Only generate if arc has chapters
+                if not arc['chapters'] or arc_index >= len(chapters_data):
+                    continue
+                arc_title = chapters_data[arc_index]['title']
+                
+                # Prefer arc cover, fall back to story cover
+                arc_cover_path = None
+                if novel.get('arcs') and arc_index < len(novel['arcs']):
+                    arc_cover_path = novel['arcs'][arc_index].get('cover_art')
+                
+                arc_slug = arc_title.lower().replace(' ', '-').replace(':', '').replace(',', '')
+                epub_filename = f"{novel_slug}-{arc_slug}.epub" if language == 'en' else f"{novel_slug}-{arc_slug}_{language}.epub"
+                books.append((os.path.join(epub_dir, epub_filename),
+                              f"{novel_slug} - {arc['title']}{language_suffix}",
+                              f"Error generating EPUB for {novel_slug} arc {arc_index}",
+                              (f'web-novel-{novel_slug}-arc-{arc_index}', f"{story_title} - {arc_title}",
+                               author_name, f"{description} - {arc_title}" if description else '',
+                               read_epub_cover(arc_cover_path or cover_art_path, covers),
+                               [arc_parts[arc_index]], None)))
+        
+        # Keep books whose recorded signature still matches, assemble the rest
+        pending = []
+        for epub_path, label, error_message, book_args in books:
+            signature = epub_book_signature(book_args, images)
+            if epub_is_current(epub_path, signature):
+                record_build_output(epub_path)
+                print(f"    EPUB unchanged for {label}")
+            else:
+                pending.append((epub_path, label, error_message, signature, assemble_epub_book(*book_args, images)))
+    except Exception as e:
+        print(f"Error generating EPUB for {novel_slug}: {e}")
+        return
+    
+    if not pending:
+        return
+    
+    # Write the zip containers in parallel, reporting in build order
+    workers = min(len(pending), _epub_write_settings['threads'] or os.cpu_count() or 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        errors = list(executor.map(lambda book: write_epub_book(book[0], book[4]), pending))
+    for (epub_path, label, error_message, signature, _), error in zip(pending, errors):
+        if error:
+            print(f"{error_message}: {error}")
+        else:
+            record_build_output(epub_path)
+            save_epub_record(epub_path, signature)
+            print(f"    Generated EPUB for {label}")
+
+def render_chapter_page(site_config, chapter_context, lang, chapter, authors_config, serve_mode=False, serve_port=8000):
+    """Render a single chapter page for a language, falling back to the primary language if untranslated.
+    
+    Returns True if the page was written, False if the chapter was skipped.
+    """
+    novel = chapter_context['novel']
+    novel_config = chapter_context['novel_config']
+    chapter_index = chapter_context['chapter_index']
+    available_languages = chapter_context['available_languages']
+    filtered_novel = chapter_index['novel']
+    novel_slug = novel['slug']
+    chapter_id = chapter["id"]
+    chapter_title = chapter["title"]
+    primary_lang = novel.get('primary_language', 'en')
+    
+    # Check if translation exists for this language
+    translation_exists = (lang == primary_lang) or chapter_translation_exists(novel_slug, chapter_id, lang)
+    
+    # Untranslated chapters show the primary language content with a "not translated" notice
+    content_lang = lang if translation_exists else primary_lang
+    chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, content_lang)
+    
+    # Skip draft/scheduled chapters unless flags are set
+    if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
+        # Safe printing that handles Unicode issues
+        safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
+        if is_chapter_draft(chapter_metadata):
+            print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
+        elif is_chapter_scheduled_future(chapter_metadata):
+            publish_date = chapter_metadata.get('published', 'Unknown')
+            print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
+        else:
+            print(f"      Skipping chapter: {chapter_id} - {safe_title}")
+        return False
+    
+    # Determine if this is a manga chapter
+    story_chapter_type = novel_config.get('chapter_type')
+    chapter_type = chapter_metadata.get('type', story_chapter_type)
+    is_manga_chapter = chapter_type == 'manga'
+    
+    # Initialize manga data
+    manga_data = None
+    
+    if is_manga_chapter:
+        # Process manga pages instead of regular content
+        if translation_exists:
+            print(f"      Processing manga chapter: {chapter_id}")
+        else:
+            print(f"      Processing manga chapter (untranslated): {chapter_id}")
+        manga_data = process_manga_pages(novel_slug, chapter_id, content_lang, chapter_metadata, novel_config)
+        
+        if not manga_data:
+            print(f"      Error: No manga pages found for {chapter_id}, skipping...")
+            return False
+    
+    # Manga chapters still show their markdown content below the images
+    chapter_content_html = build_chapter_content_html(novel_slug, chapter_id, content_lang, chapter_content_md, is_manga_chapter)
+    
+    # Handle password protection
+    is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
+    encrypted_content = None
+    password_hash = None
+    password_hint = None
+    
+    if is_password_protected:
+        if is_manga_chapter:
+            # For manga chapters, we'll handle this in the template
+            chapter_content_html = ""
+        
+        # Build the complete content to be encrypted including comments
+        complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
+        
+        # Add translator commentary if present
+        if chapter_metadata.get('translator_commentary'):
+            complete_content += f'''
+                        <div class="translator-commentary">
+                            <h3>Translator's Commentary</h3>
+                            <div class="commentary-content">
+                                {chapter_metadata['translator_commentary']}
+                            </div>
+                        </div>'''
+        
+        # Add comments section if enabled
+        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
+        if comments_enabled:
+            comments_config = build_comments_config(site_config)
+            complete_content += f'''
+                        <div class="comments-section">
+                            <h3>Comments</h3>
+                            <script src="https://utteranc.es/client.js"
+                                    repo="{comments_config['repo']}"
+                                    issue-term="{comments_config['issue_term']}"
+                                    label="{comments_config['label']}"
+                                    theme="{comments_config['theme']}"
+                                    crossorigin="anonymous"
+                                    async>
+                            </script>
+                        </div>'''
+        
+        # Encrypt the complete content
+        encrypted_content = encrypt_content_with_password(complete_content, chapter_metadata['password'])
+        password_hash = create_password_verification_hash(chapter_metadata['password'])
+        password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
+        # Set content to placeholder for password-protected chapters
+        chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
+    else:
+        # Keep the content for EPUB assembly (password-protected chapters are left out of EPUBs)
+        store_chapter_html_fragment(novel_slug, lang, chapter_id, chapter_content_html)
+    
+    # Look up neighbours in the visible-chapter index (skips hidden chapters)
+    prev_chapter, next_chapter = get_navigation_chapters(chapter_index, chapter_id)
+
+    # Use front matter title if available, otherwise use chapter title from config
+    display_title = chapter_metadata.get('title', chapter_title)
+    
+    # Determine what to display based on config and front matter
+    show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=not translation_exists)
+    show_metadata = should_show_metadata(novel_config, chapter_metadata)
+    show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
+    
+    # Build social metadata for chapter
+    chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
+    chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
+    chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
+    
+    # Build footer data for chapter
+    footer_data = build_footer_content(site_config, novel_config, 'chapter')
+    
+    # Build comments configuration
+    comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
+    comments_config = build_comments_config(site_config)
+    
+    # Extra template variables for the missing translation notice
+    translation_kwargs = {}
+    if not translation_exists:
+        translation_kwargs = {
+            'primary_language': primary_lang,
+            'requested_language': lang,
+            'translation_missing': True
+        }
+    
+    chapter_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug, lang, chapter_id))
+    os.makedirs(chapter_dir, exist_ok=True)
+    if manga_data:
+        write_manga_page_manifest(chapter_dir, chapter_id, manga_data)
+    chapter_file = os.path.join(chapter_dir, "index.html")
+    record_build_output(chapter_file)
+    write_text_output(chapter_file, render_template("chapter.html",
+                                                    novel_slug=novel_slug,
+                                                    site_config=site_config,
+                                                    novel_config=novel_config,
+                                                    novel=filtered_novel,
+                                                    novel_title=novel['title'],
+                                                    arcs=novel['arcs'],
+                                                    chapter=chapter,
+                                                    chapter_id=chapter_id,
+                                                    chapter_title=display_title,
+                                                    chapter_content=chapter_content_html,
+                                                    chapter_metadata=chapter_metadata,
+                                                    prev_chapter=prev_chapter,
+                                                    next_chapter=next_chapter,
+                                                    language=lang,
+                                                    current_language=lang,
+                                                    available_languages=available_languages,
+                                                    show_tags=show_tags,
+                                                    show_metadata=show_metadata,
+                                                    show_translation_notes=show_translation_notes,
+                                                    password_protected=is_password_protected,
+                                                    is_password_protected=is_password_protected,
+                                                    encrypted_content=encrypted_content,
+                                                    password_hash=password_hash,
+                                                    password_hint=password_hint,
+                                                    authors_config=authors_config,
+                                                    site_name=site_config.get('site_name', 'Web Novel Collection'),
+                                                    social_title=chapter_social_meta['title'],
+                                                    social_description=chapter_social_meta['description'],
+                                                    social_image=chapter_social_meta['image'],
+                                                    social_url=chapter_social_meta['url'],
+                                                    seo_meta_description=chapter_seo_meta.get('meta_description'),
+                                                    seo_keywords=chapter_social_meta.get('keywords'),
+                                                    allow_indexing=chapter_seo_meta.get('allow_indexing', True),
+                                                    twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
+                                                    footer_copyright=footer_data['copyright'],
+                                                    footer_links=footer_data['links'],
+                                                    footer_data=footer_data,
+                                                    comments_enabled=comments_enabled,
+                                                    comments_repo=comments_config['repo'],
+                                                    comments_issue_term=comments_config['issue_term'],
+                                                    comments_label=comments_config['label'],
+                                                    comments_theme=comments_config['theme'],
+                                                    is_serve_mode=serve_mode,
+                                                    serve_port=serve_port if serve_mode else None,
+                                                    is_manga_chapter=is_manga_chapter,
+                                                    manga_data=manga_data,
+                                                    **translation_kwargs))
+    return True
+
+# Shared read-only state for chapter render workers, set once per process by the pool initializer
+_chapter_worker_state = {}
+# Shared read-only state for EPUB workers, set once per process by the pool initializer
+_epub_worker_state = {}
+# Cache hit/miss counters that worker processes hand back to the main process after each job
+_worker_cache_stats = {'chapter': _chapter_cache_stats, 'markdown': _markdown_cache_stats, 'render': _render_cache_stats}
+
+def take_worker_cache_stats():
+    """Return this process's cache hit/miss counts since the last call and start counting from zero"""
+    taken = {}
+    for name, stats in _worker_cache_stats.items():
+        taken[name] = dict(stats)
+        stats['hits'] = 0
+        stats['misses'] = 0
+    return taken
+
+def merge_worker_cache_stats(taken):
+    """Add cache hit/miss counts returned by a worker process"""
+    for name, counts in taken.items():
+        for key, count in counts.items():
+            _worker_cache_stats[name][key] += count
+
+def _init_chapter_worker(state):
+    """Initialize a chapter render worker process with the shared build state"""
+    global INCLUDE_DRAFTS, INCLUDE_SCHEDULED, ASSET_MAP, _chapter_worker_state
+    INCLUDE_DRAFTS = state['include_drafts']
+    INCLUDE_SCHEDULED = state['include_scheduled']
+    ASSET_MAP = state['asset_map']
+    _chapter_worker_state = state
+    # Forked workers start with the parent's counts, which the parent already has
+    take_worker_cache_stats()
+    configure_render_cache(state['site_config'])
+    configure_asset_emission(state['site_config'])
+    # Chapters already render in parallel, so each worker encodes image variants one at a time
+    configure_responsive_images(state['site_config'], threads=1)
+
+def _render_chapter_job(job):
+    """Render one queued chapter page in a worker, returning its log output, manifest record, EPUB fragments,
+    output write counts and cache hit/miss counts"""
+    novel_slug, lang, arc_index, chapter_index_in_arc, task_id, task_signature = job
+    state = _chapter_worker_state
+    chapter_context = state['chapter_contexts'][(novel_slug, lang)]
+    chapter = chapter_context['novel']['arcs'][arc_index]['chapters'][chapter_index_in_arc]
+    
+    output = io.StringIO()
+    reset_output_writes()
+    with contextlib.redirect_stdout(output):
+        begin_build_task(chapter_context['inputs'])
+        render_chapter_page(state['site_config'], chapter_context, lang, chapter, state['authors_config'],
+                            serve_mode=state['serve_mode'], serve_port=state['serve_port'])
+        record = end_build_task(task_signature)
+    fragments = dict(_chapter_html_fragments)
+    _chapter_html_fragments.clear()
+    return output.getvalue(), task_id, record, fragments, dict(_output_write_stats), take_worker_cache_stats()
+
+def start_chapter_renders(chapter_jobs, state, jobs):
+    """Start rendering queued chapter pages on a process pool.
+    
+    Returns the pool (None if nothing is queued) and an iterator over the results in queue order,
+    for collect_chapter_renders.
+    """
+    if not chapter_jobs:
+        return None, iter(())
+    
+    workers = min(jobs, len(chapter_jobs))
+    print(f"Rendering {len(chapter_jobs)} chapter pages with {workers} workers...")
+    chunksize = max(1, len(chapter_jobs) // (workers * 4))
+    
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                      initializer=_init_chapter_worker,
+                                                      initargs=(state,))
+    return executor, executor.map(_render_chapter_job, chapter_jobs, chunksize=chunksize)
+
+def collect_chapter_renders(results, count):
+    """Wait for the next count queued chapter pages, replaying each one's log output as it completes"""
+    for output, task_id, record, fragments, write_stats, cache_stats in itertools.islice(results, count):
+        if output:
+            sys.stdout.write(output)
+        store_build_task(task_id, record)
+        _chapter_html_fragments.update(fragments)
+        merge_output_write_stats(write_stats)
+        merge_worker_cache_stats(cache_stats)
+
+def _init_epub_worker(state):
+    """Initialize an EPUB worker process with the shared build state"""
+    global INCLUDE_DRAFTS, INCLUDE_SCHEDULED, _epub_worker_state
+    INCLUDE_DRAFTS = state['include_drafts']
+    INCLUDE_SCHEDULED = state['include_scheduled']
+    _epub_worker_state = state
+    take_worker_cache_stats()
+    configure_asset_emission(state['site_config'])
+    configure_responsive_images(state['site_config'], threads=1)
+    _epub_write_settings['threads'] = 1
+
+def _generate_epub_job(job):
+    """Generate one novel/language's EPUBs in a worker, returning its captured log output, manifest record,
+    output write counts and cache hit/miss counts"""
+    novel, novel_config, language, task_id, task_signature, inputs, fragments = job
+    # Chapter content rendered by this build is handed over from the main process
+    reset_chapter_html_fragments()
+    _chapter_html_fragments.update(fragments)
+    
+    output = io.StringIO()
+    reset_output_writes()
+    with contextlib.redirect_stdout(output):
+        begin_build_task(inputs)
+        generate_novel_epubs(novel, novel['slug'], novel_config, _epub_worker_state['site_config'], language)
+        record = end_build_task(task_signature)
+    return output.getvalue(), task_id, record, dict(_output_write_stats), take_worker_cache_stats()
+
+def generate_epubs_parallel(epub_jobs, state, jobs):
+    """Generate queued novel/language EPUBs on a process pool, replaying worker output in build order"""
+    if not epub_jobs:
+        return
+    
+    workers = min(jobs, len(epub_jobs))
+    print(f"Generating EPUBs for {len(epub_jobs)} novel languages with {workers} workers...")
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                initializer=_init_epub_worker,
+                                                initargs=(state,)) as executor:
+        for output, task_id, record, write_stats, cache_stats in executor.map(_generate_epub_job, epub_jobs):
+            if output:
+                sys.stdout.write(output)
+            store_build_task(task_id, record)
+            merge_output_write_stats(write_stats)
+            merge_worker_cache_stats(cache_stats)
+
+def build_site(include_drafts=False, include_scheduled=False, no_epub=False, optimize_images=False, serve_mode=False, serve_port=8000, no_minify=False, jobs=1):
+    global INCLUDE_DRAFTS, INCLUDE_SCHEDULED, ASSET_MAP
+    INCLUDE_DRAFTS = include_drafts
+    INCLUDE_SCHEDULED = include_scheduled
+    ASSET_MAP = {}
+    reset_chapter_cache()
+    reset_chapter_html_fragments()
+    reset_markdown_cache_stats()
+    reset_build_profile()
+    reset_output_writes()
+    
+    # Load site configuration early to check minification settings
+    site_config = load_site_config()
+    configure_render_cache(site_config)
+    configure_asset_emission(site_config)
+    unsupported_image_formats = configure_responsive_images(site_config)
+    if unsupported_image_formats:
+        print(f"[WARNING] Pillow cannot encode {', '.join(unsupported_image_formats)}; skipping these responsive image formats")
+    
+    # Determine if minification should be applied
+    # Site config can enable/disable, but command line flags override
+    site_minify_enabled = site_config.get('minification', {}).get('enabled', True)
+    if no_minify:
+        enable_minification = False
+    elif serve_mode:
+        enable_minification = False  # Never minify in serve mode
+    else:
+        enable_minification = site_minify_enabled and should_minify(serve_mode=serve_mode, no_minify=no_minify)
+    
+    print("Building site...")
+    
+    start_build_phase("setup")
+    # Reuse unchanged chapter pages from the previous build unless the manifest is missing or stale
+    build_signature = compute_build_signature(include_drafts, include_scheduled, serve_mode, serve_port, enable_minification)
+    previous_manifest = load_build_manifest(build_signature)
+    reset_build_manifest(previous_manifest)
+    
+    if previous_manifest:
+        print("[INFO] Build manifest found, performing incremental build")
+    elif os.path.exists(BUILD_DIR):
+        # On Windows, retry deletion if it fails due to file locks
+        for attempt in range(3):
+            try:
+                shutil.rmtree(BUILD_DIR)
+                discard_served_output()
+                break
+            except (OSError, PermissionError) as e:
+                if attempt < 2:
+                    print(f"Retrying directory deletion (attempt {attempt + 1})...")
+                    time.sleep(0.5)
+                else:
+                    raise e
+    
+    # Ensure directory is created with retry
+    for attempt in range(3):
+        try:
+            os.makedirs(BUILD_DIR, exist_ok=True)
+            break
+        except (OSError, PermissionError) as e:
+            if attempt < 2:
+                print(f"Retrying directory creation (attempt {attempt + 1})...")
+                time.sleep(0.5)
+            else:
+                raise e
+
+    start_build_phase("static assets")
+    ASSET_MAP = copy_static_assets(enable_minification=enable_minification)
+    
+    # Generate static pages
+    start_build_phase("static pages")
+    generate_static_pages(site_config)
+
+    # Load all novels for processing
+    start_build_phase("load novels")
+    all_novels_data = load_all_novels_data()
+    
+    # Process cover art for all novels first
+    start_build_phase("cover art")
+    for novel in all_novels_data:
+        novel_slug = novel['slug']
+        novel_config = load_novel_config(novel_slug)
+        
+        # Process cover art images and get processed paths
+        processed_images = process_cover_art(novel_slug, novel_config)
+        
+        # Update novel data with processed image paths
+        if processed_images.get('story_cover'):
+            if 'front_page' not in novel:
+                novel['front_page'] = {}
+            novel['front_page']['cover_art'] = processed_images['story_cover']
+        
+        # Update arc data with processed image paths
+        if novel_config.get('arcs') and novel.get('arcs'):
+            for i, arc in enumerate(novel_config['arcs']):
+                if i < len(novel['arcs']):  # Safety check
+                    arc_cover_key = f'arc_{i}_cover'
+                    if processed_images.get(arc_cover_key):
+                        novel['arcs'][i]['cover_art'] = processed_images[arc_cover_key]
+    
+    # Filter novels for front page display
+    start_build_phase("front page order")
+    front_page_novels_data = []
+    
+    # Get story sorting method with backward compatibility
+    front_page_config = site_config.get('front_page', {})
+    story_sort_method = front_page_config.get('story_sort_method')
+    
+    # Backward compatibility: convert old boolean setting to new string format
+    if story_sort_method is None:
+        sort_by_recent_update = front_page_config.get('sort_by_recent_update', True)
+        story_sort_method = "recent_update" if sort_by_recent_update else "original"
     
     # Default to recent_update if invalid value
     if story_sort_method not in ["recent_update", "alphabetical", "original"]:
@@ -3260,32 +5050,24 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
                             if chapter_file.endswith('.md'):
                                 chapter_path = os.path.join(chapters_dir, chapter_file)
                                 try:
-                                    with open(chapter_path, 'r', encoding='utf-8') as f:
-                                        content = f.read()
-                                        if content.startswith('---'):
-                                            # Extract YAML front matter
-                                            parts = content.split('---', 2)
-                                            if len(parts) >= 3:
-                                                try:
-                                                    chapter_metadata = yaml.safe_load(parts[1])
-                                                    if chapter_metadata and isinstance(chapter_metadata, dict):
-                                                        published_date_str = chapter_metadata.get('published')
-                                                        if published_date_str:
-                                                            if should_skip_chapter(chapter_metadata, include_drafts=False, include_scheduled=False):
-                                                                continue  # Skip future/draft chapters
-                                                            
-                                                            try:
-                                                                chapter_date = parse_publish_date(published_date_str)
-                                                                if not chapter_date:
-                                                                    continue
-                                                                
-                                                                if most_recent_date is None or chapter_date > most_recent_date:
-                                                                    most_recent_date = chapter_date
-                                                            except (ValueError, TypeError):
-                                                                pass  # Skip invalid dates
-                                                except (yaml.YAMLError):
-                                                    pass  # Skip invalid YAML
-                                except (IOError, yaml.YAMLError):
+                                    # Front matter comes from the shared chapter cache
+                                    _, chapter_metadata = read_chapter_file(chapter_path)
+                                    if chapter_metadata and isinstance(chapter_metadata, dict):
+                                        published_date_str = chapter_metadata.get('published')
+                                        if published_date_str:
+                                            if should_skip_chapter(chapter_metadata, include_drafts=False, include_scheduled=False):
+                                                continue  # Skip future/draft chapters
+                                            
+                                            try:
+                                                chapter_date = parse_publish_date(published_date_str)
+                                                if not chapter_date:
+                                                    continue
+                                                
+                                                if most_recent_date is None or chapter_date > most_recent_date:
+                                                    most_recent_date = chapter_date
+                                            except (ValueError, TypeError):
+                                                pass  # Skip invalid dates
+                                except (IOError, TypeError):
                                     pass  # Skip files that can't be read or parsed
                 
                 # Add the most recent date to novel data
@@ -3328,28 +5110,34 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
         # Combine featured first, then non-featured
         front_page_novels_data = featured_novels + non_featured_novels
 
-    # Generate robots.txt (using all novels)
-    robots_txt_content = generate_robots_txt(site_config, all_novels_data)
-    with open(os.path.join(BUILD_DIR, "robots.txt"), "w", encoding='utf-8') as f:
-        f.write(robots_txt_content)
-
-    # Generate sitemap.xml (using all novels)
-    sitemap_xml_content = generate_sitemap_xml(site_config, all_novels_data)
-    with open(os.path.join(BUILD_DIR, "sitemap.xml"), "w", encoding='utf-8') as f:
-        f.write(sitemap_xml_content)
-
-    # Generate site-wide RSS feed (using all novels)
-    site_rss_content = generate_rss_feed(site_config, all_novels_data)
-    with open(os.path.join(BUILD_DIR, "rss.xml"), "w", encoding='utf-8') as f:
-        f.write(site_rss_content)
+    # Build the visible-chapter index for every novel/language; the visibility signatures let
+    # feed, tag, author and EPUB tasks notice chapters being hidden or scheduled chapters going live
+    start_build_phase("chapter index")
+    chapter_indexes = {}
+    novel_visibility_signatures = {}
+    for novel in all_novels_data:
+        novel_slug = novel['slug']
+        novel['languages'] = get_available_languages(novel_slug)
+        for lang in novel['languages']:
+            chapter_indexes[(novel_slug, lang)] = build_visible_chapter_index(novel, novel_slug, lang)
+        novel_visibility_signatures[novel_slug] = hash_build_signature(
+            [chapter_indexes[(novel_slug, lang)]['novel'] for lang in novel['languages']])
+    site_visibility_signature = hash_build_signature(novel_visibility_signatures)
+    site_inputs = ["site_config.yaml"] + [os.path.join(CONTENT_DIR, novel['slug'], "config.yaml") for novel in all_novels_data]
+
+    # Generate robots.txt, sitemap.xml and the site-wide RSS feed (using all novels)
+    start_build_phase("rss and sitemap")
+    run_build_task("site-feeds", hash_build_signature(site_config, all_novels_data, site_visibility_signature),
+                   site_inputs, write_site_feeds, site_config, all_novels_data)
     
     # Copy CNAME file if it exists (for GitHub Pages custom domains)
     cname_path = os.path.join(os.getcwd(), "CNAME")
     if os.path.exists(cname_path):
-        shutil.copy2(cname_path, os.path.join(BUILD_DIR, "CNAME"))
+        emit_file(cname_path, os.path.join(BUILD_DIR, "CNAME"))
         print("Copied CNAME file for GitHub Pages custom domain")
 
     # Build social metadata for front page
+    start_build_phase("front page")
     front_page_url = site_config.get('site_url', '').rstrip('/')
     social_meta = build_social_meta(site_config, {}, {}, 'index', site_config.get('site_name', 'Web Novel Collection'), front_page_url)
     seo_meta = build_seo_meta(site_config, {}, {}, 'index')
@@ -3358,6 +5146,7 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
     footer_data = build_footer_content(site_config, page_type='site')
 
     # Generate webring data
+    start_build_phase("webring")
     webring_config = load_webring_config()
     display_config = {}
     if os.path.exists(os.path.join(os.getcwd(), "webring.yaml")):
@@ -3368,6 +5157,7 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
     webring_data = generate_webring_data(webring_config, display_config)
     
     # Split novels into primary and additional based on configuration
+    start_build_phase("front page")
     primary_story_config = site_config.get('front_page', {}).get('primary_stories', {})
     limit_enabled = primary_story_config.get('limit_enabled', False)
     max_primary_count = primary_story_config.get('max_count', 3)
@@ -3406,756 +5196,383 @@ def build_site(include_drafts=False, include_scheduled=False, no_epub=False, opt
     write_html_file(os.path.join(BUILD_DIR, "index.html"), front_page_html, minify=enable_minification)
 
     # Generate author pages
+    start_build_phase("authors")
     authors_config = load_authors_config()
-    author_contributions = collect_author_contributions(all_novels_data)
     
     if authors_config:
-        # Create authors directory
-        authors_dir = os.path.normpath(os.path.join(BUILD_DIR, "authors"))
-        os.makedirs(authors_dir, exist_ok=True)
-        
-        # Build social metadata for authors index
-        authors_url = f"{site_config.get('site_url', '').rstrip('/')}/authors/"
-        authors_social_meta = build_social_meta(site_config, {}, {}, 'authors', "Authors", authors_url)
-        authors_seo_meta = build_seo_meta(site_config, {}, {}, 'authors')
-        
-        # Render authors index page
-        with open(os.path.join(authors_dir, "index.html"), "w", encoding='utf-8') as f:
-            f.write(render_template("authors.html",
-                                   authors=authors_config,
-                                   site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                   social_title=authors_social_meta['title'],
-                                   social_description=authors_social_meta['description'],
-                                   social_image=authors_social_meta['image'],
-                                   social_url=authors_social_meta['url'],
-                                   seo_meta_description=authors_seo_meta.get('meta_description'),
-                                   seo_keywords=authors_social_meta.get('keywords'),
-                                   allow_indexing=authors_seo_meta.get('allow_indexing', True),
-                                   twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                   footer_data=footer_data))
-        
-        # Generate individual author pages
-        for username, author_info in authors_config.items():
-            author_dir = os.path.normpath(os.path.join(authors_dir, username))
-            os.makedirs(author_dir, exist_ok=True)
-            
-            # Get contributions for this author (match by name)
-            author_name = author_info.get('name', username)
-            contributions = author_contributions.get(author_name, {'stories': [], 'chapters': []})
-            
-            # Sort chapters by publication date (most recent first)
-            if contributions['chapters']:
-                contributions['chapters'].sort(key=lambda x: x.get('published', '1900-01-01'), reverse=True)
-                
-                # Limit chapters based on site configuration
-                max_chapters = site_config.get('author_pages', {}).get('max_recent_chapters', 20)
-                if max_chapters > 0:
-                    contributions['chapters'] = contributions['chapters'][:max_chapters]
-            
-            # Build social metadata for author
-            author_url = f"{site_config.get('site_url', '').rstrip('/')}/authors/{username}/"
-            author_social_meta = build_social_meta(site_config, {}, {}, 'author', f"{author_name} - Author", author_url)
-            author_seo_meta = build_seo_meta(site_config, {}, {}, 'author')
-            
-            # Render author page
-            with open(os.path.join(author_dir, "index.html"), "w", encoding='utf-8') as f:
-                f.write(render_template("author.html",
-                                       author=author_info,
-                                       stories=contributions['stories'],
-                                       chapters=contributions['chapters'],
-                                       max_chapters=max_chapters,
-                                       site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                       social_title=author_social_meta['title'],
-                                       social_description=author_social_meta['description'],
-                                       social_image=author_social_meta['image'],
-                                       social_url=author_social_meta['url'],
-                                       seo_meta_description=author_seo_meta.get('meta_description'),
-                                       seo_keywords=author_social_meta.get('keywords'),
-                                       allow_indexing=author_seo_meta.get('allow_indexing', True),
-                                       twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                       footer_data=footer_data))
-
-    # Process each novel (including hidden ones)
+        run_build_task("authors", hash_build_signature(site_config, authors_config, all_novels_data, site_visibility_signature, ASSET_MAP),
+                       site_inputs + ["authors.yaml"], generate_author_pages, site_config, authors_config, all_novels_data, footer_data)
+
+    # Resolve chapter render worker count (0 means one worker per CPU core)
+    if jobs is None or jobs < 1:
+        jobs = os.cpu_count() or 1
+    
+    # Chapter render context for every novel/language, with everything a chapter page depends on besides
+    # its own files hashed once
+    start_build_phase("chapters")
+    chapter_contexts = {}
+    chapter_context_signatures = {}
     for novel in all_novels_data:
         novel_slug = novel['slug']
         novel_config = load_novel_config(novel_slug)
-        available_languages = get_available_languages(novel_slug)
-        novel['languages'] = available_languages
-        
-        # Create novel directory
-        novel_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug))
-        os.makedirs(novel_dir, exist_ok=True)
-
-        # Generate story-specific RSS feed
-        story_rss_content = generate_rss_feed(site_config, all_novels_data, novel_config, novel_slug)
-        with open(os.path.join(novel_dir, "rss.xml"), "w", encoding='utf-8') as f:
-            f.write(story_rss_content)
-
-        # Process each language
+        available_languages = novel['languages']
         for lang in available_languages:
-            lang_dir = os.path.normpath(os.path.join(novel_dir, lang))
-            os.makedirs(lang_dir, exist_ok=True)
+            chapter_index = chapter_indexes[(novel_slug, lang)]
+            chapter_contexts[(novel_slug, lang)] = {
+                'novel': novel,
+                'novel_config': novel_config,
+                'chapter_index': chapter_index,
+                'available_languages': available_languages,
+                'inputs': ["site_config.yaml", os.path.join(CONTENT_DIR, novel_slug, "config.yaml"), "authors.yaml"]
+            }
+            chapter_context_signatures[(novel_slug, lang)] = hash_build_signature(
+                site_config, novel_config, authors_config, novel, chapter_index['novel'], available_languages, ASSET_MAP)
+    
+    # With --jobs every chapter page that can't be reused is queued on the process pool up front, so it
+    # renders while this process writes feeds and tag pages. Each novel/language's results are collected,
+    # and their log output replayed, where a serial build would render them.
+    chapter_jobs = []
+    chapter_job_counts = {}
+    if jobs > 1:
+        for (novel_slug, lang), chapter_context in chapter_contexts.items():
+            queued = len(chapter_jobs)
+            for arc_index, arc in enumerate(chapter_context['novel']["arcs"]):
+                for chapter_index_in_arc, chapter in enumerate(arc["chapters"]):
+                    task_id = chapter_task_id(novel_slug, lang, chapter["id"])
+                    task_signature = hash_build_signature(chapter_context_signatures[(novel_slug, lang)], chapter)
+                    if not reuse_build_task(task_id, task_signature):
+                        chapter_jobs.append((novel_slug, lang, arc_index, chapter_index_in_arc, task_id, task_signature))
+            chapter_job_counts[(novel_slug, lang)] = len(chapter_jobs) - queued
+    chapter_pool, chapter_results = start_chapter_renders(chapter_jobs, {
+        'site_config': site_config,
+        'authors_config': authors_config,
+        'chapter_contexts': chapter_contexts,
+        'asset_map': ASSET_MAP,
+        'include_drafts': INCLUDE_DRAFTS,
+        'include_scheduled': INCLUDE_SCHEDULED,
+        'serve_mode': serve_mode,
+        'serve_port': serve_port
+    }, jobs)
 
-            # Render table of contents page for this novel/language
-            toc_dir = os.path.normpath(os.path.join(lang_dir, "toc"))
-            os.makedirs(toc_dir, exist_ok=True)
-            
-            # Build social metadata for TOC
-            toc_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/toc/"
-            toc_social_meta = build_social_meta(site_config, novel_config, {}, 'toc', f"{novel.get('title', '')} - Table of Contents", toc_url)
-            toc_seo_meta = build_seo_meta(site_config, novel_config, {}, 'toc')
-            
-            # Build footer data for TOC
-            footer_data = build_footer_content(site_config, novel_config, 'toc')
-            
-            # Build comments configuration for TOC
-            toc_comments_enabled = should_enable_comments(site_config, novel_config, {}, 'toc')
-            comments_config = build_comments_config(site_config)
-            
-            # Filter out hidden chapters for TOC display
-            filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
-            
-            # Calculate story length statistics
-            story_length_stats = calculate_story_length_stats(novel_slug, lang)
-            
-            # Determine which unit to display based on configuration
-            length_config = novel_config.get('length_display', {})
-            language_units = length_config.get('language_units', {})
-            default_unit = length_config.get('default_unit', 'words')
-            
-            # Check for language-specific override, fall back to default
-            display_unit = language_units.get(lang, default_unit)
-            
-            if display_unit == 'characters':
-                story_length_count = story_length_stats['characters']
-                story_length_unit = 'characters'
-            else:
-                story_length_count = story_length_stats['words']
-                story_length_unit = 'words'
-            
-            # Process story metadata with the correct display unit
-            story_metadata = process_story_metadata(novel_config, story_length_stats, site_config, novel_slug, lang, story_length_unit, story_length_count)
-            
-            # Generate download links for this story
-            download_links = generate_download_links(novel_slug, novel_config, site_config, lang)
-            
-            with open(os.path.join(toc_dir, "index.html"), "w", encoding='utf-8') as f:
-                f.write(render_template("toc.html", 
-                                       novel_slug=novel_slug,
-                                       site_config=site_config,
-                                       novel_config=novel_config,
-                                       novel=filtered_novel, 
-                                       current_language=lang, 
-                                       available_languages=available_languages,
-                                       story_length_count=story_length_count,
-                                       story_length_unit=story_length_unit,
-                                       site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                       social_title=toc_social_meta['title'],
-                                       social_description=toc_social_meta['description'], 
-                                       social_image=toc_social_meta['image'],
-                                       social_url=toc_social_meta['url'],
-                                       seo_meta_description=toc_seo_meta.get('meta_description'),
-                                       seo_keywords=toc_social_meta.get('keywords'),
-                                       allow_indexing=toc_seo_meta.get('allow_indexing', True),
-                                       twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                       footer_data=footer_data,
-                                       download_links=download_links,
-                                       comments_enabled=toc_comments_enabled,
-                                       comments_repo=comments_config['repo'],
-                                       comments_issue_term=comments_config['issue_term'],
-                                       comments_label=comments_config['label'],
-                                       comments_theme=comments_config['theme'],
-                                       story_metadata=story_metadata))
+    try:
+        # Process each novel (including hidden ones)
+        for novel in all_novels_data:
+            novel_slug = novel['slug']
+            novel_config = load_novel_config(novel_slug)
+            available_languages = novel['languages']
+            novel_inputs = ["site_config.yaml", os.path.join(CONTENT_DIR, novel_slug, "config.yaml")]
 
-            # Render chapter pages for this novel/language
-            all_chapters = []
-            for arc in novel["arcs"]:
-                all_chapters.extend(arc["chapters"])
+            # Generate story-specific RSS feed
+            start_build_phase("story feeds")
+            run_build_task(f"rss:{novel_slug}",
+                           hash_build_signature(site_config, novel_config, all_novels_data, novel_visibility_signatures[novel_slug]),
+                           novel_inputs, write_story_feed, site_config, all_novels_data, novel_config, novel_slug)
 
-            for i, chapter in enumerate(all_chapters):
-                chapter_id = chapter["id"]
-                chapter_title = chapter["title"]
-                primary_lang = novel.get('primary_language', 'en')
-                
-                # Check if translation exists for this language
-                translation_exists = (lang == primary_lang) or chapter_translation_exists(novel_slug, chapter_id, lang)
+            # Process each language (TOC pages are rendered once downloads have been generated)
+            for lang in available_languages:
+                # Render chapter pages for this novel/language, or collect the ones rendered on the pool
+                start_build_phase("chapters")
+                if chapter_pool is not None:
+                    collect_chapter_renders(chapter_results, chapter_job_counts.get((novel_slug, lang), 0))
+                    continue
                 
-                if translation_exists:
-                    # Generate normal chapter page
-                    chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, lang)
-                    
-                    # Skip draft/scheduled chapters unless flags are set
-                    if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                        # Safe printing that handles Unicode issues
-                        safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
-                        if is_chapter_draft(chapter_metadata):
-                            print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
-                        elif is_chapter_scheduled_future(chapter_metadata):
-                            publish_date = chapter_metadata.get('published', 'Unknown')
-                            print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
-                        else:
-                            print(f"      Skipping chapter: {chapter_id} - {safe_title}")
-                        continue
-                    
-                    # Determine if this is a manga chapter
-                    story_chapter_type = novel_config.get('chapter_type')
-                    chapter_type = chapter_metadata.get('type', story_chapter_type)
-                    is_manga_chapter = chapter_type == 'manga'
-                    
-                    # Initialize manga data
-                    manga_data = None
-                    
-                    if is_manga_chapter:
-                        # Process manga pages instead of regular content
-                        print(f"      Processing manga chapter: {chapter_id}")
-                        manga_data = process_manga_pages(novel_slug, chapter_id, lang, chapter_metadata, novel_config)
+                chapter_context = chapter_contexts[(novel_slug, lang)]
+                for arc_index, arc in enumerate(novel["arcs"]):
+                    for chapter_index_in_arc, chapter in enumerate(arc["chapters"]):
+                        task_id = chapter_task_id(novel_slug, lang, chapter["id"])
+                        task_signature = hash_build_signature(chapter_context_signatures[(novel_slug, lang)], chapter)
                         
-                        if not manga_data:
-                            print(f"      Error: No manga pages found for {chapter_id}, skipping...")
+                        # Skip chapters whose inputs are unchanged since the last build
+                        if reuse_build_task(task_id, task_signature):
                             continue
                         
-                        # For manga chapters, still process the markdown content for display below images
-                        chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    else:
-                        # Process regular chapter images and update markdown
-                        chapter_content_md = process_chapter_images(novel_slug, chapter_id, lang, chapter_content_md)
-                    
-                    # Handle password protection
-                    is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
-                    encrypted_content = None
-                    password_hash = None
-                    password_hint = None
-                    
-                    if is_password_protected:
-                        if not is_manga_chapter:
-                            # Convert markdown to HTML first for regular chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                        else:
-                            # For manga chapters, we'll handle this in the template
-                            chapter_content_html = ""
-                        
-                        # Build the complete content to be encrypted including comments
-                        complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
-                        
-                        # Add translator commentary if present
-                        if chapter_metadata.get('translator_commentary'):
-                            complete_content += f'''
-                        <div class="translator-commentary">
-                            <h3>Translator's Commentary</h3>
-                            <div class="commentary-content">
-                                {chapter_metadata['translator_commentary']}
-                            </div>
-                        </div>'''
-                        
-                        # Add comments section if enabled
-                        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                        if comments_enabled:
-                            comments_config = build_comments_config(site_config)
-                            complete_content += f'''
-                        <div class="comments-section">
-                            <h3>Comments</h3>
-                            <script src="https://utteranc.es/client.js"
-                                    repo="{comments_config['repo']}"
-                                    issue-term="{comments_config['issue_term']}"
-                                    label="{comments_config['label']}"
-                                    theme="{comments_config['theme']}"
-                                    crossorigin="anonymous"
-                                    async>
-                            </script>
-                        </div>'''
-                        
-                        # Encrypt the complete content
-                        encrypted_content = encrypt_content_with_password(complete_content, chapter_metadata['password'])
-                        password_hash = create_password_verification_hash(chapter_metadata['password'])
-                        password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
-                        # Set content to placeholder for password-protected chapters
-                        chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
-                    else:
-                        if not is_manga_chapter:
-                            # Only convert markdown for non-manga chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    
-                    # Use navigation function to skip hidden chapters
-                    prev_chapter, next_chapter = get_navigation_chapters(novel_slug, all_chapters, chapter_id, lang)
+                        begin_build_task(chapter_context['inputs'])
+                        render_chapter_page(site_config, chapter_context, lang, chapter, authors_config,
+                                            serve_mode=serve_mode, serve_port=serve_port)
+                        store_build_task(task_id, end_build_task(task_signature))
 
-                    # Use front matter title if available, otherwise use chapter title from config
-                    display_title = chapter_metadata.get('title', chapter_title)
-                    
-                    # Determine what to display based on config and front matter
-                    show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=False)
-                    show_metadata = should_show_metadata(novel_config, chapter_metadata)
-                    show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
-                    
-                    # Build social metadata for chapter
-                    chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
-                    chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
-                    chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
-                    
-                    # Build footer data for chapter
-                    footer_data = build_footer_content(site_config, novel_config, 'chapter')
-                    
-                    # Build comments configuration
-                    comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                    comments_config = build_comments_config(site_config)
-                    
-                    chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
-                    os.makedirs(chapter_dir, exist_ok=True)
-                    with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
-                        # Filter out hidden chapters for chapter dropdown
-                        filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
-                        f.write(render_template("chapter.html", 
-                                                novel_slug=novel_slug,
-                                                site_config=site_config,
-                                                novel_config=novel_config,
-                                                novel=filtered_novel,
-                                                novel_title=novel['title'],
-                                                arcs=novel['arcs'],
-                                                chapter=chapter,
-                                                chapter_id=chapter_id,
-                                                chapter_title=display_title,
-                                                chapter_content=chapter_content_html,
-                                                chapter_metadata=chapter_metadata,
-                                                prev_chapter=prev_chapter,
-                                                next_chapter=next_chapter,
-                                                language=lang,
-                                                current_language=lang,
-                                                available_languages=available_languages,
-                                                show_tags=show_tags,
-                                                show_metadata=show_metadata,
-                                                show_translation_notes=show_translation_notes,
-                                                password_protected=is_password_protected,
-                                                is_password_protected=is_password_protected,
-                                                encrypted_content=encrypted_content,
-                                                password_hash=password_hash,
-                                                password_hint=password_hint,
-                                                authors_config=authors_config,
-                                                site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                                social_title=chapter_social_meta['title'],
-                                                social_description=chapter_social_meta['description'],
-                                                social_image=chapter_social_meta['image'],
-                                                social_url=chapter_social_meta['url'],
-                                                seo_meta_description=chapter_seo_meta.get('meta_description'),
-                                                seo_keywords=chapter_social_meta.get('keywords'),
-                                                allow_indexing=chapter_seo_meta.get('allow_indexing', True),
-                                                twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                                footer_copyright=footer_data['copyright'],
-                                                footer_links=footer_data['links'],
-                                                footer_data=footer_data,
-                                                comments_enabled=comments_enabled,
-                                                comments_repo=comments_config['repo'],
-                                                comments_issue_term=comments_config['issue_term'],
-                                                comments_label=comments_config['label'],
-                                                comments_theme=comments_config['theme'],
-                                                is_serve_mode=serve_mode,
-                                                serve_port=serve_port if serve_mode else None,
-                                                is_manga_chapter=is_manga_chapter,
-                                                manga_data=manga_data,
-                                                ))
-                else:
-                    # Generate chapter page showing "not translated" message in primary language
-                    chapter_content_md, chapter_metadata = load_chapter_content(novel_slug, chapter_id, primary_lang)
-                    
-                    # Skip draft/scheduled chapters unless flags are set (same check as above)
-                    if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                        # Safe printing that handles Unicode issues
-                        safe_title = chapter_title.encode('ascii', errors='replace').decode('ascii')
-                        if is_chapter_draft(chapter_metadata):
-                            print(f"      Skipping draft chapter: {chapter_id} - {safe_title}")
-                        elif is_chapter_scheduled_future(chapter_metadata):
-                            publish_date = chapter_metadata.get('published', 'Unknown')
-                            print(f"      Skipping scheduled chapter: {chapter_id} - {safe_title} (publish: {publish_date})")
-                        else:
-                            print(f"      Skipping chapter: {chapter_id} - {safe_title}")
-                        continue
-                    
-                    # Determine if this is a manga chapter
-                    story_chapter_type = novel_config.get('chapter_type')
-                    chapter_type = chapter_metadata.get('type', story_chapter_type)
-                    is_manga_chapter = chapter_type == 'manga'
-                    
-                    # Initialize manga data
-                    manga_data = None
-                    
-                    if is_manga_chapter:
-                        # Process manga pages instead of regular content (using primary language)
-                        print(f"      Processing manga chapter (untranslated): {chapter_id}")
-                        manga_data = process_manga_pages(novel_slug, chapter_id, primary_lang, chapter_metadata, novel_config)
-                        
-                        if not manga_data:
-                            print(f"      Error: No manga pages found for {chapter_id}, skipping...")
-                            continue
-                        
-                        # For manga chapters, still process the markdown content for display below images
-                        chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    else:
-                        # Process regular chapter images and update markdown (using primary language)
-                        chapter_content_md = process_chapter_images(novel_slug, chapter_id, primary_lang, chapter_content_md)
-                    
-                    # Handle password protection (same as above)
-                    is_password_protected = 'password' in chapter_metadata and chapter_metadata['password']
-                    encrypted_content = None
-                    password_hash = None
-                    password_hint = None
-                    
-                    if is_password_protected:
-                        if not is_manga_chapter:
-                            # Convert markdown to HTML first for regular chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                        else:
-                            # For manga chapters, we'll handle this in the template
-                            chapter_content_html = ""
-                        
-                        # Build the complete content to be encrypted including comments
-                        complete_content = f'<div class="chapter-content">\n{chapter_content_html}\n</div>'
-                        
-                        # Add translator commentary if present
-                        if chapter_metadata.get('translator_commentary'):
-                            complete_content += f'''
-                        <div class="translator-commentary">
-                            <h3>Translator's Commentary</h3>
-                            <div class="commentary-content">
-                                {chapter_metadata['translator_commentary']}
-                            </div>
-                        </div>'''
-                        
-                        # Add comments section if enabled
-                        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                        if comments_enabled:
-                            comments_config = build_comments_config(site_config)
-                            complete_content += f'''
-                        <div class="comments-section">
-                            <h3>Comments</h3>
-                            <script src="https://utteranc.es/client.js"
-                                    repo="{comments_config['repo']}"
-                                    issue-term="{comments_config['issue_term']}"
-                                    label="{comments_config['label']}"
-                                    theme="{comments_config['theme']}"
-                                    crossorigin="anonymous"
-                                    async>
-                            </script>
-                        </div>'''
-                        
-                        # Encrypt the complete content
-                        encrypted_content = encrypt_content_with_password(complete_content, chapter_metadata['password'])
-                        password_hash = create_password_verification_hash(chapter_metadata['password'])
-                        password_hint = chapter_metadata.get('password_hint', 'This chapter is password protected.')
-                        # Set content to placeholder for password-protected chapters
-                        chapter_content_html = '<div id="password-protected-content" style="text-align: center; padding: 2rem;"><p>This chapter is password protected.</p></div>'
-                    else:
-                        if not is_manga_chapter:
-                            # Only convert markdown for non-manga chapters
-                            chapter_content_html = convert_markdown_to_html(chapter_content_md)
-                    
-                    # Use navigation function to skip hidden chapters
-                    prev_chapter, next_chapter = get_navigation_chapters(novel_slug, all_chapters, chapter_id, lang)
-
-                    # Use front matter title if available, otherwise use chapter title from config
-                    display_title = chapter_metadata.get('title', chapter_title)
-                    
-                    # Determine what to display based on config and front matter
-                    show_tags = should_show_tags(novel_config, chapter_metadata, translation_missing=True)
-                    show_metadata = should_show_metadata(novel_config, chapter_metadata)
-                    show_translation_notes = should_show_translation_notes(novel_config, chapter_metadata)
-                    
-                    # Build social metadata for chapter (using primary language metadata)
-                    chapter_url = f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{lang}/{chapter_id}/"
-                    chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', display_title, chapter_url)
-                    chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
-                    
-                    # Build footer data for chapter (missing translation case)
-                    footer_data = build_footer_content(site_config, novel_config, 'chapter')
-                    
-                    # Build comments configuration (missing translation case)
-                    comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-                    comments_config = build_comments_config(site_config)
-                    
-                    chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
-                    os.makedirs(chapter_dir, exist_ok=True)
-                    with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
-                        # Filter out hidden chapters for chapter dropdown
-                        filtered_novel = filter_hidden_chapters_from_novel(novel, novel_slug, lang)
-                        f.write(render_template("chapter.html", 
-                                                novel_slug=novel_slug,
-                                                site_config=site_config,
-                                                novel_config=novel_config,
-                                                novel=filtered_novel,
-                                                novel_title=novel['title'],
-                                                arcs=novel['arcs'],
-                                                chapter=chapter,
-                                                chapter_id=chapter_id,
-                                                chapter_title=display_title,
-                                                chapter_content=chapter_content_html,
-                                                chapter_metadata=chapter_metadata,
-                                                prev_chapter=prev_chapter,
-                                                next_chapter=next_chapter,
-                                                language=lang,
-                                                current_language=lang,
-                                                primary_language=primary_lang,
-                                                requested_language=lang,
-                                                translation_missing=True,
-                                                available_languages=available_languages,
-                                                show_tags=show_tags,
-                                                show_metadata=show_metadata,
-                                                show_translation_notes=show_translation_notes,
-                                                password_protected=is_password_protected,
-                                                is_password_protected=is_password_protected,
-                                                encrypted_content=encrypted_content,
-                                                password_hash=password_hash,
-                                                password_hint=password_hint,
-                                                authors_config=authors_config,
-                                                site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                                social_title=chapter_social_meta['title'],
-                                                social_description=chapter_social_meta['description'],
-                                                social_image=chapter_social_meta['image'],
-                                                social_url=chapter_social_meta['url'],
-                                                seo_meta_description=chapter_seo_meta.get('meta_description'),
-                                                seo_keywords=chapter_social_meta.get('keywords'),
-                                                allow_indexing=chapter_seo_meta.get('allow_indexing', True),
-                                                twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                                footer_copyright=footer_data['copyright'],
-                                                footer_links=footer_data['links'],
-                                                footer_data=footer_data,
-                                                comments_enabled=comments_enabled,
-                                                comments_repo=comments_config['repo'],
-                                                comments_issue_term=comments_config['issue_term'],
-                                                comments_label=comments_config['label'],
-                                                comments_theme=comments_config['theme'],
-                                                is_serve_mode=serve_mode,
-                                                serve_port=serve_port if serve_mode else None,
-                                                is_manga_chapter=is_manga_chapter,
-                                                manga_data=manga_data,
-                                                ))
-
-        # Generate tag pages for this language (after all chapters are processed)
-        for lang in available_languages:
-            lang_dir = os.path.join(novel_dir, lang)
-            tags_data = collect_tags_for_novel(novel_slug, lang)
-            if tags_data:
-                # Create tags directory
-                tags_dir = os.path.normpath(os.path.join(lang_dir, "tags"))
-                os.makedirs(tags_dir, exist_ok=True)
-                
-                # Create tag slug mapping for templates
-                tag_slug_map = {tag: slugify_tag(tag) for tag in tags_data.keys()}
-                
-                # Generate main tags index page
-                with open(os.path.join(tags_dir, "index.html"), "w", encoding='utf-8') as f:
-                    f.write(render_template("tags_index.html",
-                                            novel_slug=novel_slug,
-                                            novel=novel,
-                                            tags_data=tags_data,
-                                            tag_slug_map=tag_slug_map,
-                                            current_language=lang,
-                                            available_languages=available_languages))
-                
-                # Generate individual tag pages
-                for tag, chapters in tags_data.items():
-                    tag_slug = slugify_tag(tag)
-                    tag_page_dir = os.path.normpath(os.path.join(tags_dir, tag_slug))
-                    os.makedirs(tag_page_dir, exist_ok=True)
-                    
-                    # Build cross-language tag mapping for this tag
-                    cross_lang_tags = {}
-                    for other_lang in available_languages:
-                        if other_lang != lang:
-                            other_tags_data = collect_tags_for_novel(novel_slug, other_lang)
-                            # For now, just check if any tags exist in other language
-                            # (proper cross-language tag mapping would require more complex logic)
-                            if other_tags_data:
-                                cross_lang_tags[other_lang] = None  # Don't show cross-language links for now
-                    
-                    with open(os.path.join(tag_page_dir, "index.html"), "w", encoding='utf-8') as f:
-                        f.write(render_template("tag_page.html",
-                                                novel_slug=novel_slug,
-                                                novel=novel,
-                                                tag_name=tag,
-                                                tag_slug=tag_slug,
-                                                chapters=chapters,
-                                                current_language=lang,
-                                                available_languages=available_languages,
-                                                cross_lang_tags=cross_lang_tags))
+            # Generate tag pages for each language (after all chapters are processed)
+            start_build_phase("tags")
+            for lang in available_languages:
+                run_build_task(f"tags:{novel_slug}/{lang}",
+                               hash_build_signature(novel, available_languages, novel_visibility_signatures[novel_slug], ASSET_MAP),
+                               novel_inputs, generate_tag_pages, novel, novel_slug, lang, available_languages)
+    finally:
+        if chapter_pool is not None:
+            chapter_pool.shutdown(cancel_futures=True)
 
     # Generate EPUB downloads after all HTML is built (unless --no-epub)
+    start_build_phase("epub")
     if not no_epub:
         print("Generating EPUB downloads...")
+        epub_jobs = []
         for novel in all_novels_data:
             novel_slug = novel['slug']
             novel_config = load_novel_config(novel_slug)
             available_languages = novel_config.get('languages', {}).get('available', ['en'])
+            novel_inputs = ["site_config.yaml", os.path.join(CONTENT_DIR, novel_slug, "config.yaml")]
+            epub_signature = hash_build_signature(site_config, novel_config, novel, novel_visibility_signatures[novel_slug])
             
             print(f"  Generating downloads for {novel_slug}...")
             
             # Generate EPUBs for each available language
             for language in available_languages:
-                # Check if this language has translated chapters
-                if has_translated_chapters(novel_slug, language):
-                    language_suffix = f"-{language}" if language != novel_config.get('languages', {}).get('default', 'en') else ""
-                    
-                    # Generate full story EPUB
-                    if generate_story_epub(novel_slug, novel_config, site_config, novel, language):
-                        print(f"    Generated EPUB for {novel_slug}{language_suffix}")
-                    
-                    # Generate arc-specific EPUBs if enabled
-                    if novel_config.get('downloads', {}).get('include_arcs', True):
-                        all_chapters = get_non_hidden_chapters(novel_config, novel_slug, language, INCLUDE_DRAFTS, INCLUDE_SCHEDULED)
-                        for arc_index, arc in enumerate(all_chapters):
-                            if arc['chapters']:  # Only generate if arc has chapters
-                                if generate_arc_epub(novel_slug, novel_config, site_config, arc_index, novel, language):
-                                    print(f"    Generated EPUB for {novel_slug} - {arc['title']}{language_suffix}")
+                task_id = f"epub:{novel_slug}/{language}"
+                if jobs > 1:
+                    # Queue for the process pool, with the chapter content rendered in this build
+                    if not reuse_build_task(task_id, epub_signature):
+                        fragments = {key: html for key, html in _chapter_html_fragments.items()
+                                     if key[0] == novel_slug and key[1] == language}
+                        epub_jobs.append((novel, novel_config, language, task_id, epub_signature, novel_inputs, fragments))
+                else:
+                    run_build_task(task_id, epub_signature, novel_inputs,
+                                   generate_novel_epubs, novel, novel_slug, novel_config, site_config, language)
+        
+        generate_epubs_parallel(epub_jobs, {
+            'site_config': site_config,
+            'include_drafts': INCLUDE_DRAFTS,
+            'include_scheduled': INCLUDE_SCHEDULED
+        }, jobs)
     else:
         print("Skipping EPUB generation (--no-epub flag)")
     
-    # Update TOC pages with download links after downloads are generated (if EPUBs were generated)
+    # Render TOC pages after downloads are generated so they can link to them
+    start_build_phase("toc")
     if not no_epub:
-        print("Updating TOC pages with download links...")
+        print("Generating TOC pages with download links...")
     else:
-        print("Updating TOC pages...")
+        print("Generating TOC pages...")
+    # (NEW!) chapter tags on the TOC depend on the current date
+    today = datetime.date.today().isoformat()
+    # EPUBs from earlier builds that this one did not write or reuse are about to be pruned; don't link them
+    built_outputs = current_build_outputs()
     for novel in all_novels_data:
         novel_slug = novel['slug']
         novel_config = load_novel_config(novel_slug)
-        available_languages = novel_config.get('languages', {}).get('available', ['en'])
+        toc_languages = novel_config.get('languages', {}).get('available', ['en'])
+        novel_inputs = ["site_config.yaml", os.path.join(CONTENT_DIR, novel_slug, "config.yaml")]
         
-        # Update TOC for each language
-        for lang in available_languages:
-            update_toc_with_downloads(novel, novel_slug, novel_config, site_config, lang)
+        for lang in novel['languages']:
+            # Configured languages use the configured language switcher
+            available_languages = toc_languages if lang in toc_languages else novel['languages']
+            download_links = generate_download_links(novel_slug, novel_config, site_config, lang, built_outputs)
+            
+            toc_signature = hash_build_signature(site_config, novel_config, novel, chapter_indexes[(novel_slug, lang)]['novel'],
+                                                 available_languages, download_links, ASSET_MAP, today)
+            run_build_task(f"toc:{novel_slug}/{lang}", toc_signature, novel_inputs, generate_toc_page,
+                           novel, novel_slug, novel_config, site_config, lang, available_languages, download_links)
 
     # Optimize images if enabled or forced
-    optimize_all_images(site_config, optimize_images)
-
+    start_build_phase("image optimisation")
+    optimize_all_images(site_config, optimize_images, jobs)
+
+    start_build_phase("manifest and caches")
+    save_build_manifest(build_signature)
+    if previous_manifest:
+        print_build_manifest_stats()
+    print_output_write_stats()
+    prune_markdown_cache()
+    prune_render_cache()
+    prune_responsive_image_cache()
+    prune_manga_page_cache()
+    print_chapter_cache_stats()
+    print_markdown_cache_stats()
+    print_render_cache_stats()
+    finish_build_profile()
     print("Site built.")
 
-def check_broken_links():
-    """Check for broken internal links in the generated site"""
-    print("\n" + "="*50)
-    print("BROKEN LINK CHECK")
-    print("="*50)
+# Post-build validation: every built HTML file is parsed once and each requested check visits the parse
+try:
+    import lxml  # noqa: F401
+    VALIDATION_HTML_PARSER = 'lxml'
+except ImportError:
+    VALIDATION_HTML_PARSER = 'html.parser'
+
+def index_build_paths(build_dir):
+    """List every file and directory in the build (relative POSIX paths) so links resolve without stat calls"""
+    build_paths = set()
+    for root, dirs, files in os.walk(build_dir):
+        rel_root = os.path.relpath(root, build_dir).replace(os.sep, '/')
+        prefix = '' if rel_root == '.' else rel_root + '/'
+        build_paths.update(prefix + name for name in dirs)
+        build_paths.update(prefix + name for name in files)
+    return build_paths
+
+def resolve_build_link(page_dir, url, build_paths):
+    """Resolve a link from a page in page_dir against the build index; returns (target, exists).
+    
+    Query strings and fragments are dropped and directory links may resolve to their index.html.
+    target is relative to the build directory unless the link leaves it.
+    """
+    path = url.split('?')[0].split('#')[0]
+    if path.startswith('/'):
+        target = posixpath.normpath(path.lstrip('/') or '.')
+    else:
+        target = posixpath.normpath(posixpath.join(page_dir, path))
+    
+    index_target = posixpath.normpath(posixpath.join(target, 'index.html'))
+    if target == '.' or target in build_paths or index_target in build_paths:
+        return target, True
+    if target == '..' or target.startswith('../'):
+        # Outside the build directory, so not in the index
+        outside_path = os.path.normpath(os.path.join(BUILD_DIR, target))
+        return outside_path, os.path.exists(outside_path)
+    return target, False
+
+def visit_broken_links(page, soup):
+    """Validation check: internal links, images, social embed images, stylesheets and scripts pointing at missing files"""
+    broken_links = []
     
-    build_dir = Path(BUILD_DIR)
-    if not build_dir.exists():
-        print("[ERROR] Build directory not found. Please generate the site first.")
-        return
+    def check_target(link_type, url, path=None):
+        target, exists = resolve_build_link(page['dir'], path or url, page['build_paths'])
+        if not exists:
+            broken_links.append({
+                'type': link_type,
+                'url': url,
+                'source_file': page['path'],
+                'target_path': target
+            })
     
-    # Load site config for URL validation
-    site_config = load_site_config()
+    # Check internal links (<a href="">)
+    for link in soup.find_all('a', href=True):
+        if is_internal_link(link['href']):
+            check_target('Internal Link', link['href'])
+    
+    # Check images (<img src="">)
+    for img in soup.find_all('img', src=True):
+        if is_internal_link(img['src']):
+            check_target('Image', img['src'])
+    
+    # Check social embed images (og:image, twitter:image)
+    site_url = page['site_config'].get('site_url', '').rstrip('/')
+    for meta in soup.find_all('meta'):
+        if meta.get('property') == 'og:image' or meta.get('name') == 'twitter:image':
+            content_attr = meta.get('content', '')
+            if content_attr and is_internal_link(content_attr):
+                check_target('Social Embed Image', content_attr)
+            elif content_attr and is_local_site_url(content_attr, page['site_config']):
+                # Site URLs (https://site.com/path/to/file.jpg) point into the build root
+                check_target('Social Embed Image', content_attr, '/' + content_attr[len(site_url) + 1:])
+    
+    # Check CSS files
+    for link_tag in soup.find_all('link', href=True):
+        if 'stylesheet' in link_tag.get('rel', []) and is_internal_link(link_tag['href']):
+            check_target('CSS File', link_tag['href'])
+    
+    # Check JavaScript files
+    for script in soup.find_all('script', src=True):
+        if is_internal_link(script['src']):
+            check_target('JavaScript File', script['src'])
+    
+    return broken_links
+
+def visit_missing_alt_text(page, soup):
+    """Validation check: images with a src but missing or empty alt text"""
+    missing_alt_issues = []
+    for img in soup.find_all('img'):
+        src = img.get('src', '')
+        alt = img.get('alt', '').strip()
+        
+        # Check if alt text is missing or empty (images without src are skipped)
+        if src and not alt:
+            missing_alt_issues.append({
+                'file': page['path'],
+                'image_src': src,
+                'issue': 'Missing alt text',
+                'severity': 'warning'
+            })
+    return missing_alt_issues
+
+# Checks available to validate_build, by name
+VALIDATION_CHECKS = {
+    'links': visit_broken_links,
+    'alt_text': visit_missing_alt_text
+}
+
+# Shared read-only state for validation workers, set once per process by the pool initializer
+_validation_worker_state = {}
+
+def _init_validation_worker(state):
+    """Initialize a validation worker process with the build index and requested checks"""
+    global _validation_worker_state
+    _validation_worker_state = state
+
+def validate_html_file(html_path, state):
+    """Parse one built HTML file and run the requested checks over it; returns (issues by check, error)"""
+    try:
+        with open(os.path.join(BUILD_DIR, html_path), 'r', encoding='utf-8') as f:
+            soup = BeautifulSoup(f.read(), VALIDATION_HTML_PARSER)
+    except Exception as e:
+        return {}, f"Error parsing {html_path}: {e}"
     
-    broken_links = []
-    total_files_checked = 0
+    page = {
+        'path': html_path,
+        'dir': posixpath.dirname(html_path) or '.',
+        'build_paths': state['build_paths'],
+        'site_config': state['site_config']
+    }
+    return {check: VALIDATION_CHECKS[check](page, soup) for check in state['checks']}, None
+
+def _validate_html_file_job(html_path):
+    """Validate one HTML file in a worker process"""
+    return validate_html_file(html_path, _validation_worker_state)
+
+def validate_build(checks, jobs=1):
+    """Run the given checks over every built HTML file, parsing each file once.
     
-    # Find all HTML files in build directory
-    html_files = list(build_dir.rglob("*.html"))
+    Returns {'files': count, 'issues': {check: [...]}}, or None if there is no build directory.
+    """
+    if not os.path.isdir(BUILD_DIR):
+        return None
     
-    print(f"[INFO] Checking {len(html_files)} HTML files for broken links...")
+    build_paths = index_build_paths(BUILD_DIR)
+    html_paths = sorted(path for path in build_paths if path.endswith('.html') and os.path.isfile(os.path.join(BUILD_DIR, path)))
+    state = {
+        'checks': list(checks),
+        'build_paths': build_paths,
+        'site_config': load_site_config()
+    }
     
-    for html_file in html_files:
-        total_files_checked += 1
-        relative_path = html_file.relative_to(build_dir)
-        
-        try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            soup = BeautifulSoup(content, 'html.parser')
-            file_dir = html_file.parent
-            
-            # Check internal links (<a href="">)
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if is_internal_link(href):
-                    target_path = resolve_link_path(file_dir, href, build_dir)
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'Internal Link',
-                            'url': href,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-            
-            # Check images (<img src="">)
-            for img in soup.find_all('img', src=True):
-                src = img['src']
-                if is_internal_link(src):
-                    target_path = resolve_link_path(file_dir, src, build_dir)
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'Image',
-                            'url': src,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-            
-            # Check social embed images (og:image, twitter:image)
-            for meta in soup.find_all('meta'):
-                if meta.get('property') == 'og:image' or meta.get('name') == 'twitter:image':
-                    content_attr = meta.get('content', '')
-                    target_path = None
-                    
-                    if content_attr and is_internal_link(content_attr):
-                        # Handle relative/absolute internal links
-                        target_path = resolve_link_path(file_dir, content_attr, build_dir)
-                    elif content_attr and is_local_site_url(content_attr, site_config):
-                        # Handle site URLs (https://site.com/path/to/file.jpg)
-                        target_path = convert_site_url_to_local_path(content_attr, site_config, build_dir)
-                    
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'Social Embed Image',
-                            'url': content_attr,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-            
-            # Check CSS files
-            for link_tag in soup.find_all('link', href=True):
-                if 'stylesheet' in link_tag.get('rel', []):
-                    href = link_tag['href']
-                    if is_internal_link(href):
-                        target_path = resolve_link_path(file_dir, href, build_dir)
-                        if target_path and not target_path.exists():
-                            try:
-                                target_rel = str(target_path.relative_to(build_dir))
-                            except ValueError:
-                                target_rel = str(target_path)
-                            broken_links.append({
-                                'type': 'CSS File',
-                                'url': href,
-                                'source_file': str(relative_path),
-                                'target_path': target_rel
-                            })
-            
-            # Check JavaScript files
-            for script in soup.find_all('script', src=True):
-                src = script['src']
-                if is_internal_link(src):
-                    target_path = resolve_link_path(file_dir, src, build_dir)
-                    if target_path and not target_path.exists():
-                        try:
-                            target_rel = str(target_path.relative_to(build_dir))
-                        except ValueError:
-                            target_rel = str(target_path)
-                        broken_links.append({
-                            'type': 'JavaScript File',
-                            'url': src,
-                            'source_file': str(relative_path),
-                            'target_path': target_rel
-                        })
-                        
-        except Exception as e:
+    # 0 means one worker per CPU core
+    if jobs is None or jobs < 1:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(html_paths) > 1:
+        workers = min(jobs, len(html_paths))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers,
+                                                    initializer=_init_validation_worker,
+                                                    initargs=(state,)) as executor:
+            file_results = list(executor.map(_validate_html_file_job, html_paths,
+                                             chunksize=max(1, len(html_paths) // (workers * 4))))
+    else:
+        file_results = [validate_html_file(html_path, state) for html_path in html_paths]
+    
+    issues = {check: [] for check in checks}
+    for file_issues, error in file_results:
+        if error:
             try:
-                print(f"[WARNING] Error parsing {relative_path}: {e}")
+                print(f"[WARNING] {error}")
             except UnicodeEncodeError:
-                print(f"[WARNING] Error parsing {relative_path}: <encoding error>")
+                print("[WARNING] Error parsing HTML file: <encoding error>")
+        for check, check_issues in file_issues.items():
+            issues[check].extend(check_issues)
+    
+    return {'files': len(html_paths), 'issues': issues}
+
+def check_broken_links(jobs=1, validation=None):
+    """Check for broken internal links in the generated site (validation: results of validate_build to reuse)"""
+    print("\n" + "="*50)
+    print("BROKEN LINK CHECK")
+    print("="*50)
+    
+    if validation is None:
+        validation = validate_build(['links'], jobs)
+    if validation is None:
+        print("[ERROR] Build directory not found. Please generate the site first.")
+        return
+    
+    total_files_checked = validation['files']
+    broken_links = validation['issues']['links']
+    print(f"[INFO] Checked {total_files_checked} HTML files for broken links")
     
     # Report results
     print(f"\n[RESULTS]")
@@ -4233,7 +5650,7 @@ def check_broken_links():
         
         return True
 
-def check_accessibility_issues(site_config):
+def check_accessibility_issues(site_config, jobs=1, validation=None):
     """Check for accessibility issues in the generated site"""
     if not site_config.get('accessibility', {}).get('enabled', True):
         return True
@@ -4255,7 +5672,7 @@ def check_accessibility_issues(site_config):
     accessibility_issues = []
     
     if enforce_alt_text:
-        alt_text_issues = check_missing_alt_text()
+        alt_text_issues = check_missing_alt_text(jobs, validation)
         accessibility_issues.extend(alt_text_issues)
     
     # Future: Add more accessibility checks here
@@ -4283,51 +5700,18 @@ def check_accessibility_issues(site_config):
         
         return True
 
-def check_missing_alt_text():
-    """Check for images missing alt text in the generated site"""
-    missing_alt_issues = []
-    build_dir = Path(BUILD_DIR)
-    
-    if not build_dir.exists():
+def check_missing_alt_text(jobs=1, validation=None):
+    """Check for images missing alt text in the generated site (validation: results of validate_build to reuse)"""
+    if validation is None:
+        validation = validate_build(['alt_text'], jobs)
+    if validation is None:
         print("[ERROR] Build directory not found. Run a build first.")
-        return missing_alt_issues
-    
-    # Find all HTML files
-    html_files = list(build_dir.glob("**/*.html"))
-    print(f"[INFO] Checking {len(html_files)} HTML files for images missing alt text...")
+        return []
     
-    for html_file in html_files:
-        try:
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            soup = BeautifulSoup(content, 'html.parser')
-            images = soup.find_all('img')
-            
-            for img in images:
-                src = img.get('src', '')
-                alt = img.get('alt', '').strip()
-                
-                # Skip if no src
-                if not src:
-                    continue
-                
-                # Check if alt text is missing or empty
-                if not alt:
-                    # Get relative path from build directory
-                    relative_html_path = html_file.relative_to(build_dir)
-                    
-                    missing_alt_issues.append({
-                        'file': str(relative_html_path),
-                        'image_src': src,
-                        'issue': 'Missing alt text',
-                        'severity': 'warning'
-                    })
-                    
-                    print(f"[WARNING] Missing alt text: {src} in {relative_html_path}")
-        
-        except Exception as e:
-            print(f"[ERROR] Could not parse {html_file}: {e}")
+    missing_alt_issues = validation['issues']['alt_text']
+    print(f"[INFO] Checked {validation['files']} HTML files for images missing alt text")
+    for issue in missing_alt_issues:
+        print(f"[WARNING] Missing alt text: {issue['image_src']} in {issue['file']}")
     
     return missing_alt_issues
 
@@ -4413,53 +5797,6 @@ def is_local_site_url(url, site_config):
     
     return url.startswith(site_url + '/')
 
-def convert_site_url_to_local_path(url, site_config, build_dir):
-    """Convert a site URL to a local file path"""
-    site_url = site_config.get('site_url', '').rstrip('/')
-    if not url.startswith(site_url + '/'):
-        return None
-    
-    # Remove site URL prefix to get relative path
-    relative_path = url[len(site_url) + 1:]
-    return Path(build_dir) / relative_path
-
-def resolve_link_path(current_file_dir, link_url, build_dir):
-    """Resolve a relative or absolute link to a file path in the build directory"""
-    try:
-        # Handle absolute paths from site root
-        if link_url.startswith('/'):
-            target_path = build_dir / link_url.lstrip('/')
-        else:
-            # Handle relative paths
-            target_path = (current_file_dir / link_url).resolve()
-        
-        # Remove query strings and fragments
-        url_parts = str(target_path).split('?')[0].split('#')[0]
-        target_path = Path(url_parts)
-        
-        # If path doesn't exist but ends with /, try with index.html first
-        if str(link_url).endswith('/'):
-            index_path = target_path / 'index.html'
-            if index_path.exists():
-                return index_path
-        
-        # If path doesn't exist as-is, try with index.html appended (for directory links)
-        if not target_path.exists():
-            if target_path.is_dir():
-                index_path = target_path / 'index.html'
-                if index_path.exists():
-                    return index_path
-            else:
-                # Try treating as directory and adding index.html
-                index_path = target_path / 'index.html'
-                if index_path.exists():
-                    return index_path
-        
-        return target_path
-        
-    except Exception:
-        return None
-
 def clean_build_directory():
     """Delete the build directory to ensure a fresh build"""
     build_dir = Path(BUILD_DIR)
@@ -4499,9 +5836,8 @@ def validate_all_configs():
         # Check development server dependencies (informational only)
         try:
             import watchdog
-            import websockets
         except ImportError:
-            warnings.append("Development server dependencies not found. Install with: pip install watchdog websockets")
+            warnings.append("Development server dependencies not found. Install with: pip install watchdog")
             
     except Exception as e:
         errors.append(f"Error loading site_config.yaml: {e}")
@@ -4585,75 +5921,123 @@ def print_validation_results(errors, warnings):
             print(f"Note: {len(warnings)} warnings found (non-critical)")
         print("[PASSED] All configs and content are valid")
 
-def optimize_images_to_webp(source_dir, target_dir, quality=None):
-    """Convert images to WebP format with optional compression"""
+# WebP conversions keyed on the source image content and encoder settings, shared across builds
+WEBP_CACHE_DIR = os.path.join(CACHE_DIR, "webp")
+WEBP_CACHE_VERSION = 1
+WEBP_CACHE_MAX_AGE_DAYS = 30
+# Build directories that receive images: static images and cover art, chapter images and manga pages
+IMAGE_OPTIMIZATION_DIRS = [os.path.join("static", "images"), "images"]
+WEBP_SOURCE_FORMATS = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
+
+def webp_cache_path(source_digest, quality):
+    """Get the cached WebP file for an image's content hash and quality"""
+    key = hashlib.sha256(json.dumps([WEBP_CACHE_VERSION, source_digest, quality]).encode('utf-8')).hexdigest()
+    return os.path.join(WEBP_CACHE_DIR, key[:2], f"{key}.webp")
+
+def convert_image_to_webp(source_file, webp_file, quality):
+    """Encode one image as WebP (also used by worker processes); returns an error message or None"""
     try:
         from PIL import Image
-        import os
-        from pathlib import Path
-        
-        if quality is None:
-            quality = 100  # No compression by default
-        
-        source_path = Path(source_dir)
-        target_path = Path(target_dir)
         
-        if not source_path.exists():
-            return []
-        
-        # Supported image formats
-        supported_formats = {'.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.tif'}
-        converted_images = []
-        
-        # Find all image files
-        for image_file in source_path.rglob('*'):
-            if image_file.suffix.lower() in supported_formats:
-                try:
-                    # Calculate relative path and target WebP path
-                    rel_path = image_file.relative_to(source_path)
-                    webp_path = target_path / rel_path.with_suffix('.webp')
-                    
-                    # Create target directory if it doesn't exist
-                    webp_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    # Convert to WebP
-                    with Image.open(image_file) as img:
-                        # Convert to RGB if necessary (for PNG with transparency)
-                        if img.mode in ('RGBA', 'LA', 'P'):
-                            # Create white background for transparent images
-                            background = Image.new('RGB', img.size, (255, 255, 255))
-                            if img.mode == 'P':
-                                img = img.convert('RGBA')
-                            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                            img = background
-                        elif img.mode != 'RGB':
-                            img = img.convert('RGB')
-                        
-                        # Save as WebP
-                        img.save(webp_path, 'WebP', quality=quality, optimize=True)
-                        
-                        # Also copy original file
-                        original_target = target_path / rel_path
-                        original_target.parent.mkdir(parents=True, exist_ok=True)
-                        if not original_target.exists():
-                            import shutil
-                            shutil.copy2(image_file, original_target)
-                        
-                        converted_images.append({
-                            'original': str(rel_path),
-                            'webp': str(rel_path.with_suffix('.webp')),
-                            'original_size': image_file.stat().st_size,
-                            'webp_size': webp_path.stat().st_size
-                        })
-                        
-                except Exception as e:
-                    print(f"[WARNING] Failed to convert {image_file}: {e}")
-                    
-        return converted_images
-        
-    except ImportError:
+        temp_file = f"{webp_file}.{os.getpid()}.tmp"
+        with Image.open(source_file) as img:
+            # Convert to RGB if necessary (for PNG with transparency)
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # Create white background for transparent images
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+                img = background
+            elif img.mode != 'RGB':
+                img = img.convert('RGB')
+            
+            # Save as WebP
+            img.save(temp_file, 'WebP', quality=quality, optimize=True)
+        os.replace(temp_file, webp_file)
+        return None
+    except Exception as e:
+        return str(e)
+
+def find_build_images():
+    """List the images the build emitted that can be converted to WebP"""
+    image_files = []
+    for image_dir in IMAGE_OPTIMIZATION_DIRS:
+        for root, dirs, files in os.walk(os.path.join(BUILD_DIR, image_dir)):
+            # Responsive image variants come in their own formats already
+            dirs[:] = [name for name in dirs if name != RESPONSIVE_VARIANT_DIR]
+            for file in files:
+                if os.path.splitext(file)[1].lower() in WEBP_SOURCE_FORMATS:
+                    image_files.append(os.path.join(root, file))
+    return sorted(image_files)
+
+def optimize_images_to_webp(image_files, quality=None, jobs=1):
+    """Write a WebP copy next to each image, encoding only images missing from the WebP cache"""
+    # convert_image_to_webp imports Pillow itself (possibly in worker processes); only check it is installed
+    if importlib.util.find_spec('PIL') is None:
         print("[ERROR] Pillow library not found. Install with: pip install Pillow")
-        return []
+        return [], 0
+    
+    if quality is None:
+        quality = 100  # No compression by default
+    
+    # Identical images (e.g. the same page in two languages) share one cache entry
+    cache_files = {image_file: webp_cache_path(hash_build_input(image_file), quality) for image_file in image_files}
+    to_encode = {}
+    for image_file, cache_file in cache_files.items():
+        if not os.path.exists(cache_file) and cache_file not in to_encode:
+            to_encode[cache_file] = image_file
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    
+    sources = list(to_encode.values())
+    targets = list(to_encode.keys())
+    if jobs > 1 and len(sources) > 1:
+        workers = min(jobs, len(sources))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            errors = list(executor.map(convert_image_to_webp, sources, targets, [quality] * len(sources),
+                                       chunksize=max(1, len(sources) // (workers * 4))))
+    else:
+        errors = [convert_image_to_webp(source, target, quality) for source, target in zip(sources, targets)]
+    
+    for source, error in zip(sources, errors):
+        if error:
+            print(f"[WARNING] Failed to convert {source}: {error}")
+    
+    converted_images = []
+    for image_file, cache_file in cache_files.items():
+        if not os.path.exists(cache_file):
+            continue
+        webp_path = os.path.splitext(image_file)[0] + '.webp'
+        emit_file(cache_file, webp_path)
+        record_build_output(webp_path)
+        if cache_file not in to_encode:
+            # Mark the cache entry as used so pruning keeps it
+            os.utime(cache_file)
+        
+        converted_images.append({
+            'original': os.path.relpath(image_file, BUILD_DIR),
+            'webp': os.path.relpath(webp_path, BUILD_DIR),
+            'original_size': os.path.getsize(image_file),
+            'webp_size': os.path.getsize(webp_path)
+        })
+    
+    return converted_images, len(sources) - sum(1 for error in errors if error)
+
+def prune_image_cache(cache_dir, max_age_days):
+    """Delete cached image files in cache_dir that have not been used for max_age_days"""
+    if not os.path.exists(cache_dir):
+        return
+    cutoff = datetime.datetime.now().timestamp() - max_age_days * 86400
+    for cache_file in glob.glob(os.path.join(cache_dir, "*", "*")):
+        try:
+            if os.path.getmtime(cache_file) < cutoff:
+                os.remove(cache_file)
+        except OSError:
+            pass
+
+def prune_webp_cache():
+    """Delete cached WebP files that have not been used for WEBP_CACHE_MAX_AGE_DAYS"""
+    prune_image_cache(WEBP_CACHE_DIR, WEBP_CACHE_MAX_AGE_DAYS)
 
 def should_optimize_images(site_config, force_optimize=False):
     """Determine if images should be optimized based on config and flags"""
@@ -4666,8 +6050,23 @@ def should_optimize_images(site_config, force_optimize=False):
     
     return enabled, quality
 
-def optimize_all_images(site_config, force_optimize=False):
-    """Optimize all images in the static directory"""
+def report_webp_conversion(image_files, quality, jobs):
+    """Convert the build's images to WebP and print compression statistics"""
+    converted, encoded = optimize_images_to_webp(image_files, quality, jobs)
+    if converted:
+        total_original = sum(img['original_size'] for img in converted)
+        total_webp = sum(img['webp_size'] for img in converted)
+        savings = ((total_original - total_webp) / total_original * 100) if total_original > 0 else 0
+        
+        print(f"  Converted {len(converted)} images to WebP ({encoded} encoded, {len(converted) - encoded} from cache)")
+        print(f"  Original size: {total_original / 1024:.1f} KB")
+        print(f"  WebP size: {total_webp / 1024:.1f} KB")
+        print(f"  Space saved: {savings:.1f}%")
+    else:
+        print("  No images found to convert")
+
+def optimize_all_images(site_config, force_optimize=False, jobs=1):
+    """Optimize every image the build emitted (static images, covers, chapter images, manga pages)"""
     should_optimize, quality = should_optimize_images(site_config, force_optimize)
     
     if not should_optimize:
@@ -4675,23 +6074,12 @@ def optimize_all_images(site_config, force_optimize=False):
     
     print(f"Optimizing images to WebP (quality: {quality}%)...")
     
-    # Optimize static images
-    static_source = Path("static/images")
-    static_target = Path(BUILD_DIR) / "static/images"
-    
-    if static_source.exists():
-        converted = optimize_images_to_webp(static_source, static_target, quality)
-        if converted:
-            total_original = sum(img['original_size'] for img in converted)
-            total_webp = sum(img['webp_size'] for img in converted)
-            savings = ((total_original - total_webp) / total_original * 100) if total_original > 0 else 0
-            
-            print(f"  Converted {len(converted)} images to WebP")
-            print(f"  Original size: {total_original / 1024:.1f} KB")
-            print(f"  WebP size: {total_webp / 1024:.1f} KB")
-            print(f"  Space saved: {savings:.1f}%")
-        else:
-            print("  No images found to convert")
+    image_files = find_build_images()
+    signature = hash_build_signature(WEBP_CACHE_VERSION, quality,
+                                     [os.path.relpath(image_file, BUILD_DIR) for image_file in image_files])
+    if not run_build_task("images:webp", signature, image_files, report_webp_conversion, image_files, quality, jobs):
+        print(f"  WebP images unchanged ({len(image_files)} images)")
+    prune_webp_cache()
 
 def generate_stats_report():
     """Generate detailed statistics report and save to stats_report.md"""
@@ -4951,520 +6339,306 @@ def print_stats_summary(stats):
         for novel in stats['novels']:
             print(f"   {novel['title']}: {novel['total_chapters']} chapters, {novel['total_words']:,} words")
 
-def determine_rebuild_scope(changed_file_path):
-    """Determine what needs to be rebuilt based on the changed file"""
-    changed_file_path = os.path.normpath(changed_file_path).replace('\\', '/')
-    
-    # Site config changes require full rebuild
-    if changed_file_path.endswith('site_config.yaml') or changed_file_path.endswith('site_config.yml'):
-        return {'type': 'full', 'reason': 'Site config changed'}
-    
-    # Template changes require full rebuild
-    if 'templates/' in changed_file_path and changed_file_path.endswith('.html'):
-        return {'type': 'full', 'reason': 'Global template changed'}
-    
-    # Novel-specific template changes
-    if 'content/' in changed_file_path and 'templates/' in changed_file_path and changed_file_path.endswith('.html'):
-        # Extract novel slug from path (e.g., content/novel-slug/templates/chapter.html)
-        parts = changed_file_path.split('/')
-        if len(parts) >= 4 and parts[0] == 'content' and parts[2] == 'templates':
-            novel_slug = parts[1]
-            template_name = parts[3]
-            return {'type': 'novel_template', 'novel': novel_slug, 'template': template_name, 'reason': f'Novel template {template_name} changed'}
-    
-    # Static file changes (CSS, JS, images)
-    if 'static/' in changed_file_path:
-        return {'type': 'static', 'file': changed_file_path, 'reason': 'Static asset changed'}
-    
-    # Novel config changes
-    if 'content/' in changed_file_path and changed_file_path.endswith('config.yaml'):
-        # Extract novel slug from path
-        parts = changed_file_path.split('/')
-        if len(parts) >= 2 and parts[0] == 'content':
-            novel_slug = parts[1]
-            return {'type': 'novel_config', 'novel': novel_slug, 'reason': 'Novel config changed'}
-    
-    # Chapter markdown changes
-    if 'content/' in changed_file_path and changed_file_path.endswith('.md'):
-        # Extract novel slug and chapter info
-        parts = changed_file_path.split('/')
-        if len(parts) >= 4 and parts[0] == 'content' and parts[2] == 'chapters':
-            novel_slug = parts[1]
-            
-            # Check if it's a translation (e.g., content/novel/chapters/jp/chapter-1.md)
-            if len(parts) == 5:
-                language = parts[3]
-                chapter_file = parts[4]
-            else:
-                language = 'en'
-                chapter_file = parts[3]
-            
-            chapter_id = chapter_file[:-3] if chapter_file.endswith('.md') else chapter_file
-            return {
-                'type': 'chapter', 
-                'novel': novel_slug, 
-                'chapter': chapter_id, 
-                'language': language,
-                'reason': f'Chapter {chapter_id} changed'
-            }
+def determine_rebuild_scope(changed_file_paths):
+    """Look the changed files up in the build graph and report which tasks and outputs depend on them.
     
-    # Static page changes
-    if 'pages/' in changed_file_path and changed_file_path.endswith('.md'):
-        # Extract page info
-        parts = changed_file_path.split('/')
-        if len(parts) >= 2 and parts[0] == 'pages':
-            
-            # Check if it's a translation (e.g., pages/jp/about.md)
-            if len(parts) == 3 and len(parts[1]) == 2:  # Language code
-                language = parts[1]
-                page_file = parts[2]
-            else:
-                language = 'en'
-                page_file = parts[1] if len(parts) == 2 else '/'.join(parts[1:])
-            
-            page_slug = page_file[:-3] if page_file.endswith('.md') else page_file
-            return {
-                'type': 'page',
-                'page': page_slug,
-                'language': language,
-                'reason': f'Static page {page_slug} changed'
-            }
+    The scope is diagnostic: it is logged before the rebuild, but does not select what gets rebuilt.
+    The rebuild itself is a build_site call in which the manifest reuses every task whose signature and
+    input hashes are unchanged.
+    """
+    tasks = read_build_graph()
+    if tasks is None:
+        return {'type': 'full', 'reason': 'No build manifest found'}
     
-    # Default to full rebuild for unknown changes
-    return {'type': 'full', 'reason': 'Unknown file type changed'}
+    changed_files = sorted({os.path.relpath(os.path.abspath(path)).replace('\\', '/') for path in changed_file_paths})
+    dependents = sorted({task_id for path in changed_files for task_id in find_dependent_tasks(tasks, path)})
+    outputs = sorted({output for task_id in dependents for output in tasks[task_id]['outputs']})
+    
+    if len(changed_files) == 1:
+        changed, pronoun = changed_files[0], 'it'
+    else:
+        changed, pronoun = f"{len(changed_files)} files", 'them'
+    if dependents:
+        reason = f"{changed} changed ({len(dependents)} tasks depend on {pronoun})"
+    else:
+        reason = f"{changed} changed (not tracked; task signatures will decide)"
+    return {
+        'type': 'incremental',
+        'files': changed_files,
+        'tasks': dependents,
+        'outputs': outputs,
+        'reason': reason
+    }
 
-def incremental_rebuild_static(file_path):
-    """Copy a single static file to build directory"""
-    try:
-        # Normalize the path
-        rel_path = os.path.relpath(file_path, STATIC_DIR)
-        target_path = os.path.normpath(os.path.join(BUILD_DIR, "static", rel_path))
-        
-        # Ensure target directory exists
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        
-        # Copy the file
-        import shutil
-        shutil.copy2(file_path, target_path)
-        print(f"    Updated static file: {rel_path}")
-        return True
-    except Exception as e:
-        print(f"    Error updating static file {file_path}: {e}")
+def perform_incremental_rebuild(rebuild_info, include_drafts=False, include_scheduled=False):
+    """Log the rebuild scope and rebuild the site, reusing unchanged tasks from the build manifest.
+    
+    Errors propagate to the caller; there is no separate full-rebuild fallback, since the build manifest
+    already falls back to re-rendering any task it cannot reuse.
+    """
+    if rebuild_info['type'] == 'full':
+        print(f"Full rebuild needed: {rebuild_info['reason']}")
+    else:
+        print(f"Incremental rebuild: {rebuild_info['reason']}")
+        if rebuild_info['outputs']:
+            print(f"  {len(rebuild_info['outputs'])} tracked outputs affected")
+    
+    # Novel templates are cached per novel; drop them so edited templates are reloaded
+    _novel_template_envs.clear()
+    
+    # The build manifest reuses every task whose inputs and signature are unchanged
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    build_site(include_drafts=include_drafts, include_scheduled=include_scheduled, no_epub=True, optimize_images=False, serve_mode=True, no_minify=True)
+
+# Source changes that trigger a rebuild in --serve and --watch mode
+WATCH_DIRS = ['content', 'templates', 'static', 'pages']
+WATCH_EXTENSIONS = ('.md', '.yaml', '.yml', '.css', '.js', '.html', '.jpg', '.jpeg', '.png', '.webp')
+WATCH_IGNORED_DIRS = {'.git', '__pycache__', '.vscode', 'build'}
+# Quiet period after the last change before a rebuild starts, so bursts of saves build once
+WATCH_DEBOUNCE_SECONDS = 0.3
+
+def is_watched_source_file(file_path):
+    """Check if a file change should trigger a rebuild"""
+    file_path = str(file_path).lower()
+    
+    # Ignore .git, caches and the build directory (handle both / and \ separators)
+    normalized_path = file_path.replace('/', os.sep).replace('\\', os.sep)
+    path_parts = normalized_path.split(os.sep)
+    if WATCH_IGNORED_DIRS.intersection(path_parts):
         return False
-
-def incremental_rebuild_page(page_slug, language='en'):
-    """Rebuild a single static page"""
-    try:
-        site_config = load_site_config()
-        
-        # Load page content
-        if '/' in page_slug:
-            page_content, page_metadata = load_nested_page_content(page_slug, language)
-        else:
-            page_content, page_metadata = load_page_content(page_slug, language)
-        
-        if not page_content:
-            print(f"    Could not load page content for {page_slug}")
-            return False
-        
-        # Skip if page should be skipped
-        if should_skip_page(page_metadata, INCLUDE_DRAFTS):
-            print(f"    Skipping draft/hidden page: {page_slug} ({language})")
-            return True
-        
-        # Create page directory
-        page_dir = os.path.normpath(os.path.join(BUILD_DIR, page_slug, language))
-        os.makedirs(page_dir, exist_ok=True)
-        
-        # Calculate breadcrumb depth
-        breadcrumb_depth = page_slug.count('/') + 2
-        
-        # Build breadcrumbs
-        breadcrumbs = [{'title': 'Home', 'url': '../' * breadcrumb_depth}]
-        if '/' in page_slug:
-            parts = page_slug.split('/')
-            url_parts = []
-            for i, part in enumerate(parts[:-1]):
-                url_parts.append(part)
-                parent_url = '../' * breadcrumb_depth + '/'.join(url_parts) + f'/{language}/'
-                breadcrumbs.append({
-                    'title': part.replace('-', ' ').title(),
-                    'url': parent_url
-                })
-        
-        breadcrumbs.append({'title': page_metadata.get('title', page_slug.split('/')[-1].replace('-', ' ').title()), 'url': ''})
-        
-        # Get available languages for this page
-        available_languages = get_available_page_languages(page_slug)
-        
-        # Render page
-        page_html = render_template("page.html",
-                                   title=page_metadata.get('title', page_slug.replace('-', ' ').title()),
-                                   content=convert_markdown_to_html(page_content),
-                                   metadata=page_metadata,
-                                   current_language=language,
-                                   available_languages=available_languages,
-                                   page_slug=page_slug,
-                                   breadcrumbs=breadcrumbs,
-                                   site_config=site_config)
-        
-        # Write page file
-        with open(os.path.join(page_dir, "index.html"), "w", encoding='utf-8') as f:
-            f.write(page_html)
-        
-        print(f"    Rebuilt page: {page_slug} ({language})")
-        return True
-        
-    except Exception as e:
-        print(f"    Error rebuilding page {page_slug}: {e}")
+    
+    if not file_path.endswith(WATCH_EXTENSIONS):
         return False
-
-def incremental_rebuild_chapter(novel_slug, chapter_id, language='en'):
-    """Rebuild a single chapter and update related pages"""
-    try:
-        site_config = load_site_config()
-        
-        # Load novel config
-        novel_config = load_novel_config(novel_slug)
-        if not novel_config:
-            print(f"    Could not load novel config for {novel_slug}")
-            return False
-        
-        # Find the chapter in the novel structure
-        chapter_info = None
-        arc_info = None
-        
-        for arc in novel_config.get('arcs', []):
-            for chapter in arc.get('chapters', []):
-                if chapter['id'] == chapter_id:
-                    chapter_info = chapter
-                    arc_info = arc
-                    break
-            if chapter_info:
-                break
-        
-        if not chapter_info:
-            print(f"    Chapter {chapter_id} not found in novel config")
-            return False
-        
-        # Load chapter content
-        chapter_content, chapter_metadata = load_chapter_content(novel_slug, chapter_id, language)
-        if not chapter_content:
-            print(f"    Could not load chapter content for {chapter_id}")
-            return False
-        
-        # Skip if chapter should be skipped
-        if should_skip_chapter(chapter_metadata, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-            print(f"    Skipping draft/hidden chapter: {chapter_id}")
+    
+    # Check if in a watched directory
+    for dir_name in WATCH_DIRS:
+        if f'{os.sep}{dir_name}{os.sep}' in normalized_path or normalized_path.startswith(dir_name + os.sep):
             return True
-        
-        # Create chapter directory
-        novel_dir = os.path.normpath(os.path.join(BUILD_DIR, novel_slug))
-        lang_dir = os.path.normpath(os.path.join(novel_dir, language))
-        chapter_dir = os.path.normpath(os.path.join(lang_dir, chapter_id))
-        os.makedirs(chapter_dir, exist_ok=True)
-        
-        # Process images for this chapter
-        updated_content = process_chapter_images(novel_slug, chapter_id, language, chapter_content)
-        
-        # Build navigation
-        languages_config = novel_config.get('languages', {'available': ['en']})
-        if isinstance(languages_config, dict):
-            available_languages = languages_config.get('available', ['en'])
-        else:
-            available_languages = languages_config if isinstance(languages_config, list) else ['en']
-        
-        if 'en' not in available_languages:
-            available_languages.append('en')
-        
-        # Get chapter index for navigation
-        all_chapters = []
-        for arc in novel_config.get('arcs', []):
-            for chapter in arc.get('chapters', []):
-                chapter_content_check, chapter_metadata_check = load_chapter_content(novel_slug, chapter['id'], language)
-                if chapter_content_check and not should_skip_chapter(chapter_metadata_check, INCLUDE_DRAFTS, INCLUDE_SCHEDULED):
-                    all_chapters.append(chapter)
-        
-        current_index = next((i for i, ch in enumerate(all_chapters) if ch['id'] == chapter_id), -1)
-        prev_chapter = all_chapters[current_index - 1] if current_index > 0 else None
-        next_chapter = all_chapters[current_index + 1] if current_index < len(all_chapters) - 1 else None
-        
-        # Build comments config
-        comments_config = build_comments_config(site_config)
-        
-        # Load authors config for template
-        authors_config = load_authors_config()
-        
-        # Create novel structure for template (filtered to remove hidden chapters)
-        novel_for_template = {
-            'title': novel_config.get('title', novel_slug),
-            'slug': novel_slug,
-            'arcs': []
-        }
-        
-        # Add only visible arcs and chapters
-        for arc in novel_config.get('arcs', []):
-            visible_chapters = []
-            for chapter in arc.get('chapters', []):
-                chapter_content_check, chapter_metadata_check = load_chapter_content(novel_slug, chapter['id'], language)
-                if (chapter_content_check and 
-                    not should_skip_chapter(chapter_metadata_check, INCLUDE_DRAFTS, INCLUDE_SCHEDULED) and 
-                    not chapter_metadata_check.get('hidden', False)):
-                    visible_chapters.append(chapter)
+    return False
+
+class RebuildScheduler:
+    """Coalesce file change events and run one rebuild per quiet period on a dedicated worker thread.
+    
+    Changed paths are deduplicated until no event has arrived for the debounce window, then handed to
+    rebuild(paths) together. Events that arrive while a rebuild is running are queued for a follow-up pass.
+    """
+    
+    def __init__(self, rebuild, debounce=WATCH_DEBOUNCE_SECONDS):
+        self.rebuild = rebuild
+        self.debounce = debounce
+        self.pending = set()
+        self.last_event = 0
+        self.stopped = False
+        self.condition = threading.Condition()
+        self.worker = threading.Thread(target=self.run, name='rebuild-worker', daemon=True)
+    
+    def start(self):
+        self.worker.start()
+    
+    def schedule(self, file_path):
+        """Queue a changed file for the next rebuild"""
+        if not is_watched_source_file(file_path):
+            return
+        with self.condition:
+            self.pending.add(os.path.abspath(file_path))
+            self.last_event = time.monotonic()
+            self.condition.notify()
+    
+    def stop(self, timeout=None):
+        """Stop the worker after the rebuild in progress, dropping queued changes"""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.worker.is_alive():
+            self.worker.join(timeout)
+    
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.stopped:
+                    self.condition.wait()
+                # Keep collecting until the changes have been quiet for a full window
+                while not self.stopped:
+                    remaining = self.last_event + self.debounce - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                if self.stopped:
+                    return
+                changed_files = sorted(self.pending)
+                self.pending.clear()
             
-            if visible_chapters:  # Only include arc if it has visible chapters
-                arc_for_template = {
-                    'title': arc.get('title', ''),
-                    'chapters': visible_chapters
-                }
-                novel_for_template['arcs'].append(arc_for_template)
-        
-        # Build social meta and other template variables
-        chapter_social_meta = build_social_meta(site_config, novel_config, chapter_metadata, 'chapter', 
-                                               chapter_metadata.get('title', chapter_info['title']), 
-                                               f"{site_config.get('site_url', '').rstrip('/')}/{novel_slug}/{language}/{chapter_id}/")
-        chapter_seo_meta = build_seo_meta(site_config, novel_config, chapter_metadata, 'chapter')
-        footer_data = build_footer_content(site_config, novel_config, 'chapter')
-        
-        # Determine what to show
-        show_tags = bool(chapter_metadata.get('tags'))
-        show_metadata = bool(chapter_metadata.get('author') or chapter_metadata.get('translator') or chapter_metadata.get('published'))
-        show_translation_notes = bool(chapter_metadata.get('translation_notes') or chapter_metadata.get('translator_commentary'))
-        
-        # Handle password protection
-        is_password_protected = bool(chapter_metadata.get('password'))
-        encrypted_content = None
-        password_hash = None
-        if is_password_protected:
-            from hashlib import sha256
-            password = chapter_metadata['password']
-            password_hash = sha256(password.encode()).hexdigest()
-            # Simple XOR encryption for demo (not secure)
-            encrypted_content = ''.join(chr(ord(c) ^ 42) for c in updated_content)
-        
-        # Check comments
-        comments_enabled = should_enable_comments(site_config, novel_config, chapter_metadata, 'chapter')
-        
-        # Render chapter  
-        chapter_html = render_template("chapter.html",
-                                     novel_slug=novel_slug,
-                                     site_config=site_config,
-                                     novel_config=novel_config,
-                                     novel=novel_for_template,
-                                     chapter=chapter_info,
-                                     chapter_title=chapter_metadata.get('title', chapter_info['title']),
-                                     chapter_content=convert_markdown_to_html(updated_content),
-                                     chapter_metadata=chapter_metadata,
-                                     prev_chapter=prev_chapter,
-                                     next_chapter=next_chapter,
-                                     current_language=language,
-                                     available_languages=available_languages,
-                                     show_tags=show_tags,
-                                     show_metadata=show_metadata,
-                                     show_translation_notes=show_translation_notes,
-                                     is_password_protected=is_password_protected,
-                                     encrypted_content=encrypted_content,
-                                     password_hash=password_hash,
-                                     password_hint=chapter_metadata.get('password_hint', ''),
-                                     site_name=site_config.get('site_name', 'Web Novel Collection'),
-                                     social_title=chapter_social_meta['title'],
-                                     social_description=chapter_social_meta['description'],
-                                     social_image=chapter_social_meta['image'],
-                                     social_url=chapter_social_meta['url'],
-                                     seo_meta_description=chapter_seo_meta.get('meta_description'),
-                                     seo_keywords=chapter_social_meta.get('keywords'),
-                                     allow_indexing=chapter_seo_meta.get('allow_indexing', True),
-                                     twitter_handle=site_config.get('social_embeds', {}).get('twitter_handle'),
-                                     footer_data=footer_data,
-                                     comments_enabled=comments_enabled,
-                                     comments_repo=comments_config['repo'],
-                                     comments_issue_term=comments_config['issue_term'],
-                                     comments_label=comments_config['label'],
-                                     comments_theme=comments_config['theme'],
-                                     authors_config=authors_config)
-        
-        # Write chapter file
-        with open(os.path.join(chapter_dir, "index.html"), "w", encoding='utf-8') as f:
-            f.write(chapter_html)
-        
-        print(f"    Rebuilt chapter: {novel_slug}/{chapter_id} ({language})")
-        
-        # Check if we need to update tag pages (if chapter tags changed)
-        if chapter_metadata.get('tags'):
-            print(f"    Chapter has tags, may need to rebuild tag pages")
-            # For now, we'll leave tag rebuilding as a future enhancement
-        
-        return True
-        
-    except Exception as e:
-        print(f"    Error rebuilding chapter {novel_slug}/{chapter_id}: {e}")
-        return False
+            try:
+                self.rebuild(changed_files)
+            except Exception as e:
+                print(f"Error rebuilding site: {e}")
 
-def perform_incremental_rebuild(rebuild_info, include_drafts=False, include_scheduled=False):
-    """Perform incremental rebuild based on the rebuild scope"""
-    global INCLUDE_DRAFTS, INCLUDE_SCHEDULED
-    INCLUDE_DRAFTS = include_drafts
-    INCLUDE_SCHEDULED = include_scheduled
+def watch_source_changes(observer, scheduler):
+    """Feed created, modified, moved and deleted source files from a watchdog observer to the scheduler"""
+    from watchdog.events import FileSystemEventHandler
     
-    rebuild_type = rebuild_info['type']
+    class ChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ('created', 'modified', 'moved', 'deleted'):
+                return
+            scheduler.schedule(event.src_path)
+            if event.event_type == 'moved':
+                scheduler.schedule(event.dest_path)
+    
+    event_handler = ChangeHandler()
+    for watch_dir in WATCH_DIRS:
+        if os.path.exists(watch_dir):
+            observer.schedule(event_handler, watch_dir, recursive=True)
+            print(f"Watching {watch_dir}/ for changes...")
+
+# Live-reload event stream and client script, served by the development server on the same port as the site
+LIVE_RELOAD_PATH = '/__livereload'
+LIVE_RELOAD_SCRIPT_PATH = '/__livereload.js'
+LIVE_RELOAD_KEEPALIVE_SECONDS = 15
+# Above this many changed outputs, browsers are simply told to reload
+LIVE_RELOAD_MAX_PATHS = 1000
+DEV_SERVER_IDLE_TIMEOUT = 30
+
+# Browser side of live reload. Events are either "reload" or {"paths": [...], "body_only": [...]} listing the
+# build outputs that changed, and the pages whose change is confined to #chapter-content-wrapper. Stylesheets
+# are swapped in place, a changed script the page uses reloads it, and a changed chapter page only replaces
+# #chapter-content-wrapper (keeping the scroll position) when it is listed in body_only; otherwise the page
+# reloads. Other pages ignore the event.
+LIVE_RELOAD_CLIENT_JS = '''(function () {
+    const events = new EventSource('%(events_path)s');
+    let opened = false;
+    
+    // EventSource reconnects by itself; a reconnect means the server restarted
+    events.onopen = function () {
+        if (opened) window.location.reload();
+        opened = true;
+    };
+    
+    function assetName(path) {
+        return path.split('?')[0].split('/').pop().replace(/-[0-9a-f]{8}(?=\\.(css|js)$)/, '');
+    }
     
-    if rebuild_type == 'full':
-        print(f"Full rebuild needed: {rebuild_info['reason']}")
-        # Ensure build directory exists
-        os.makedirs(BUILD_DIR, exist_ok=True)
-        # Perform full rebuild
-        build_site(include_drafts=include_drafts, include_scheduled=include_scheduled, no_epub=True, optimize_images=False, serve_mode=True, no_minify=True)
-        return True
-        
-    elif rebuild_type == 'static':
-        print(f"Incremental rebuild: {rebuild_info['reason']}")
-        return incremental_rebuild_static(rebuild_info['file'])
-        
-    elif rebuild_type == 'page':
-        print(f"Incremental rebuild: {rebuild_info['reason']}")
-        return incremental_rebuild_page(rebuild_info['page'], rebuild_info['language'])
-        
-    elif rebuild_type == 'chapter':
-        print(f"Incremental rebuild: {rebuild_info['reason']}")
-        return incremental_rebuild_chapter(rebuild_info['novel'], rebuild_info['chapter'], rebuild_info['language'])
-        
-    elif rebuild_type == 'novel_config':
-        print(f"Novel rebuild needed: {rebuild_info['reason']}")
-        # For novel config changes, we need to rebuild the entire novel
-        # This is complex, so for now fall back to full rebuild
-        os.makedirs(BUILD_DIR, exist_ok=True)
-        build_site(include_drafts=include_drafts, include_scheduled=include_scheduled, no_epub=True, optimize_images=False, serve_mode=True, no_minify=True)
-        return True
-        
-    elif rebuild_type == 'novel_template':
-        print(f"Novel template rebuild needed: {rebuild_info['reason']}")
-        # Clear the template cache for this novel to force reload
-        novel_slug = rebuild_info['novel']
-        if novel_slug in _novel_template_envs:
-            del _novel_template_envs[novel_slug]
-        
-        # For template changes, we need to rebuild the entire novel since 
-        # we don't know which pages use this template
-        os.makedirs(BUILD_DIR, exist_ok=True)
-        build_site(include_drafts=include_drafts, include_scheduled=include_scheduled, no_epub=True, optimize_images=False, serve_mode=True, no_minify=True)
-        return True
+    function currentPagePath() {
+        let path = decodeURIComponent(window.location.pathname).replace(/^\\/+/, '');
+        if (path === '' || path.endsWith('/')) path += 'index.html';
+        return path;
+    }
+    
+    async function swapChapterContent() {
+        const response = await fetch(window.location.href, { cache: 'no-store' });
+        const page = new DOMParser().parseFromString(await response.text(), 'text/html');
+        const next = page.getElementById('chapter-content-wrapper');
+        const current = document.getElementById('chapter-content-wrapper');
+        if (!next || !current) {
+            window.location.reload();
+            return;
+        }
+        const scrollY = window.scrollY;
+        current.replaceWith(document.importNode(next, true));
+        window.scrollTo(0, scrollY);
+    }
+    
+    events.onmessage = function (event) {
+        if (event.data === 'reload') {
+            window.location.reload();
+            return;
+        }
+        const change = JSON.parse(event.data);
+        const paths = change.paths;
+        const changedAssets = (ext) => paths.filter((path) => path.endsWith(ext));
+        
+        const scripts = changedAssets('.js').map(assetName);
+        const pageScripts = Array.from(document.querySelectorAll('script[src]'), (script) => assetName(script.getAttribute('src')));
+        if (pageScripts.some((name) => scripts.includes(name))) {
+            window.location.reload();
+            return;
+        }
         
-    else:
-        print(f"Unknown rebuild type: {rebuild_type}")
-        return False
+        // A cache-busted stylesheet shows up twice: the old name (removed) and the new one
+        const styles = changedAssets('.css');
+        document.querySelectorAll('link[rel="stylesheet"][href]').forEach((link) => {
+            const currentPath = new URL(link.href).pathname.replace(/^\\/+/, '');
+            const renamed = styles.find((path) => path !== currentPath && assetName(path) === assetName(currentPath));
+            if (renamed) {
+                link.href = '/' + renamed;
+            } else if (styles.includes(currentPath)) {
+                link.href = '/' + currentPath + '?livereload=' + Date.now();
+            }
+        });
+        
+        const pagePath = currentPagePath();
+        if (paths.includes(pagePath)) {
+            if (change.body_only.includes(pagePath) && document.getElementById('chapter-content-wrapper')) {
+                swapChapterContent().catch(() => window.location.reload());
+            } else {
+                window.location.reload();
+            }
+        }
+    };
+})();
+''' % {'events_path': LIVE_RELOAD_PATH}
 
 def start_development_server(port=8000, include_drafts=False, include_scheduled=False):
-    """Start development server with live reload"""
+    """Start development server with live reload.
+    
+    A single asyncio server on one port answers page requests from the in-memory output store, streams
+    other build files with sendfile, and pushes reload events to browsers over Server-Sent Events.
+    """
     try:
         import asyncio
-        import websockets
-        import threading
-        import time
+        import mimetypes
         import signal
-        import sys
-        from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+        from email.utils import formatdate, parsedate_to_datetime
+        from http import HTTPStatus
         from watchdog.observers import Observer
-        from watchdog.events import FileSystemEventHandler
-        import os
-        from pathlib import Path
         
         print(f"Starting development server with live reload...")
         
-        # WebSocket clients for live reload
-        connected_clients = set()
-        websocket_loop = None
-        
-        # File change handler
-        class ChangeHandler(FileSystemEventHandler):
-            def __init__(self):
-                self.last_rebuild = 0
-                self.rebuild_delay = 1  # Wait 1 second between rebuilds
-                self.include_drafts = include_drafts
-                self.include_scheduled = include_scheduled
-            
-            def on_modified(self, event):
-                if event.is_directory:
-                    return
-                
-                # Only rebuild for relevant file changes
-                if self.should_rebuild(event.src_path):
-                    current_time = time.time()
-                    if current_time - self.last_rebuild > self.rebuild_delay:
-                        self.last_rebuild = current_time
-                        self.rebuild_site(event.src_path)
-            
-            def should_rebuild(self, file_path):
-                """Check if file change should trigger rebuild"""
-                file_path = str(file_path).lower()
-                rebuild_extensions = {'.md', '.yaml', '.yml', '.css', '.js', '.html', '.jpg', '.jpeg', '.png', '.webp'}
-                rebuild_dirs = {'content', 'templates', 'static', 'pages'}
-                
-                # Ignore .git folder and its contents (handle both / and \ separators)
-                normalized_path = file_path.replace('/', os.sep).replace('\\', os.sep)
-                path_parts = normalized_path.split(os.sep)
-                if '.git' in path_parts or normalized_path.startswith('.git' + os.sep):
-                    return False
+        # Serve rendered pages from memory; rebuilds publish into the store as they write
+        live_reload_script = f'<script src="{LIVE_RELOAD_SCRIPT_PATH}"></script>'
+        enable_served_outputs(live_reload_script)
+        live_reload_client = LIVE_RELOAD_CLIENT_JS.encode('utf-8')
+        
+        # Event queues of connected browsers and open connections (task -> writer), owned by the event loop
+        reload_clients = set()
+        connections = {}
+        loop = None
+        
+        def broadcast_reload(message):
+            """Queue a live-reload event for every connected browser (called from the rebuild worker)"""
+            def publish():
+                for queue in reload_clients:
+                    queue.put_nowait(message)
+            loop.call_soon_threadsafe(publish)
+        
+        # File change handling: events are coalesced by a RebuildScheduler and rebuilt on its worker
+        def rebuild_site(changed_files):
+            """Rebuild site and notify clients using incremental rebuilds (runs on the scheduler's worker)"""
+            try:
+                print(f"{len(changed_files)} file change(s) detected, analyzing...")
                 
-                # Ignore other system/build directories
-                ignore_patterns = ['__pycache__', '.vscode', 'build']
-                for pattern in ignore_patterns:
-                    if pattern in path_parts:
-                        return False
+                # Log which tasks depend on the changed files, then rebuild reusing unchanged tasks
+                rebuild_info = determine_rebuild_scope(changed_files)
+                perform_incremental_rebuild(rebuild_info, include_drafts=include_drafts, include_scheduled=include_scheduled)
                 
-                # Check file extension
-                for ext in rebuild_extensions:
-                    if file_path.endswith(ext):
-                        break
+                # Rebuilt pages are already in the in-memory store, so clients can update right away
+                changed_outputs = take_served_changes()
+                if not reload_clients:
+                    print("Rebuild complete")
+                elif changed_outputs is None or len(changed_outputs['paths']) > LIVE_RELOAD_MAX_PATHS:
+                    broadcast_reload('reload')
+                    print("Browser refresh triggered")
+                elif changed_outputs['paths']:
+                    broadcast_reload(json.dumps(changed_outputs))
+                    print(f"Browser update triggered ({len(changed_outputs['paths'])} changed outputs)")
                 else:
-                    return False
-                
-                # Check if in relevant directory
-                for dir_name in rebuild_dirs:
-                    if f'{os.sep}{dir_name}{os.sep}' in file_path or file_path.startswith(dir_name):
-                        return True
-                
-                return False
-            
-            def rebuild_site(self, changed_file_path):
-                """Rebuild site and notify clients using incremental rebuilds"""
-                try:
-                    print("File change detected, analyzing...")
+                    print("Rebuild complete (no output changes)")
                     
-                    # Determine what needs to be rebuilt
-                    rebuild_info = determine_rebuild_scope(changed_file_path)
-                    
-                    # Perform incremental rebuild
-                    success = perform_incremental_rebuild(rebuild_info, include_drafts=self.include_drafts, include_scheduled=self.include_scheduled)
-                    
-                    if success:
-                        print("Rebuild completed, waiting for filesystem sync...")
-                        
-                        # Trigger browser reload after a delay to ensure files are fully written
-                        if connected_clients:
-                            # Run broadcast in a thread-safe way with delay
-                            def trigger_reload():
-                                try:
-                                    import time
-                                    time.sleep(1.5)  # Wait for filesystem operations to complete
-                                    loop = websocket_loop
-                                    asyncio.run_coroutine_threadsafe(broadcast_reload(), loop)
-                                    print("Browser refresh triggered")
-                                except:
-                                    pass
-                            threading.Thread(target=trigger_reload, daemon=True).start()
-                        else:
-                            print("Rebuild complete")
-                    else:
-                        print("Rebuild failed, falling back to full rebuild...")
-                        # Fallback to full rebuild if incremental failed
-                        os.makedirs(BUILD_DIR, exist_ok=True)
-                        build_site(include_drafts=self.include_drafts, include_scheduled=self.include_scheduled, no_epub=True, optimize_images=False)
-                        
-                except Exception as e:
-                    print(f"Error rebuilding site: {e}")
-                    # Create a minimal error page if rebuild fails
-                    try:
-                        error_html = f"""
+            except Exception as e:
+                print(f"Error rebuilding site: {e}")
+                # Create a minimal error page if rebuild fails
+                try:
+                    error_html = f"""
 <!DOCTYPE html>
 <html>
 <head><title>Build Error</title></head>
@@ -5474,232 +6648,213 @@ def start_development_server(port=8000, include_drafts=False, include_scheduled=
     <p>Check console for details.</p>
 </body>
 </html>"""
-                        os.makedirs(BUILD_DIR, exist_ok=True)
-                        with open(os.path.join(BUILD_DIR, 'index.html'), 'w') as f:
-                            f.write(error_html)
-                    except:
-                        pass
+                    os.makedirs(BUILD_DIR, exist_ok=True)
+                    write_text_output(os.path.join(BUILD_DIR, 'index.html'), error_html)
+                except:
+                    pass
         
-        async def broadcast_reload():
-            """Broadcast reload message to all connected clients"""
-            if connected_clients:
-                await asyncio.gather(
-                    *[client.send("reload") for client in connected_clients.copy()],
-                    return_exceptions=True
-                )
-        
-        # WebSocket server for live reload
-        async def websocket_handler(websocket, path):
-            """Handle WebSocket connections for live reload"""
-            connected_clients.add(websocket)
-            print(f"Client connected for live reload (total: {len(connected_clients)})")
+        async def send_response(writer, status, headers, body=b'', head_only=False, keep_alive=True):
+            """Write a status line, headers and optional body"""
+            lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+            lines.extend(f"{name}: {value}" for name, value in headers.items())
+            if not keep_alive:
+                lines.append("Connection: close")
+            writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+            if body and not head_only:
+                writer.write(body)
+            await writer.drain()
+        
+        async def send_error(writer, status, keep_alive=True, head_only=False):
+            body = f"{status} {HTTPStatus(status).phrase}\n".encode('utf-8')
+            await send_response(writer, status, {
+                'Content-Type': 'text/plain; charset=utf-8',
+                'Content-Length': str(len(body))
+            }, body, head_only, keep_alive)
+        
+        async def serve_reload_events(writer):
+            """Hold a Server-Sent Events stream open and forward reload events to it"""
+            queue = asyncio.Queue()
+            reload_clients.add(queue)
+            print(f"Client connected for live reload (total: {len(reload_clients)})")
             try:
-                await websocket.wait_closed()
-            except:
-                pass
+                await send_response(writer, 200, {
+                    'Content-Type': 'text/event-stream',
+                    'Cache-Control': 'no-cache'
+                }, keep_alive=False)
+                writer.write(b'retry: 1000\n\n')
+                await writer.drain()
+                while True:
+                    try:
+                        message = await asyncio.wait_for(queue.get(), LIVE_RELOAD_KEEPALIVE_SECONDS)
+                        if message is None:
+                            # Server is shutting down
+                            break
+                        writer.write(f"data: {message}\n\n".encode('utf-8'))
+                    except asyncio.TimeoutError:
+                        # Comment lines keep proxies from closing the idle stream and detect closed tabs
+                        writer.write(b': keepalive\n\n')
+                    await writer.drain()
             finally:
-                connected_clients.discard(websocket)
-                print(f"Client disconnected (total: {len(connected_clients)})")
-        
-        # Custom HTTP handler that injects live reload script
-        class LiveReloadHandler(SimpleHTTPRequestHandler):
-            # Class-level cache for injected scripts
-            _cache = {}
-            _cache_lock = threading.Lock()
+                reload_clients.discard(queue)
+                print(f"Client disconnected (total: {len(reload_clients)})")
+        
+        async def serve_build_file(writer, url, headers, head_only, keep_alive):
+            """Answer a GET/HEAD for a build file: pages from memory, everything else with sendfile"""
+            url_path = unquote(url.path)
+            relative = posixpath.normpath(url_path.lstrip('/') or '.')
+            if relative == '..' or relative.startswith('../'):
+                await send_error(writer, 404, keep_alive, head_only)
+                return
+            file_path = os.path.join(BUILD_DIR, *relative.split('/'))
             
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, directory=BUILD_DIR, **kwargs)
+            if os.path.isdir(file_path):
+                if not url_path.endswith('/'):
+                    location = url.path + '/' + (f"?{url.query}" if url.query else '')
+                    await send_response(writer, 301, {'Location': location, 'Content-Length': '0'}, keep_alive=keep_alive)
+                    return
+                file_path = os.path.join(file_path, 'index.html')
+            
+            if file_path.endswith('.html'):
+                entry = get_served_output(file_path)
+                if entry is None:
+                    await send_error(writer, 404, keep_alive, head_only)
+                elif headers.get('if-none-match') == entry['etag']:
+                    await send_response(writer, 304, {'ETag': entry['etag']}, keep_alive=keep_alive)
+                else:
+                    await send_response(writer, 200, {
+                        'Content-Type': 'text/html; charset=utf-8',
+                        'Content-Length': str(len(entry['body'])),
+                        'ETag': entry['etag'],
+                        'Cache-Control': 'no-cache'
+                    }, entry['body'], head_only, keep_alive)
+                return
             
-            def do_GET(self):
+            try:
+                file = open(file_path, 'rb')
+            except OSError:
+                await send_error(writer, 404, keep_alive, head_only)
+                return
+            with file:
+                stat = os.fstat(file.fileno())
                 try:
-                    # For non-HTML files, use the fast default handler
-                    if not (self.path.endswith('.html') or self.path.endswith('/')):
-                        super().do_GET()
-                        return
-                    
-                    # Only inject script for HTML files
-                    # Get the actual file path
-                    if self.path == '/':
-                        file_path = os.path.join(BUILD_DIR, 'index.html')
-                    elif self.path.endswith('/'):
-                        file_path = os.path.join(BUILD_DIR, self.path.strip('/'), 'index.html')
-                    else:
-                        file_path = os.path.join(BUILD_DIR, self.path.strip('/'))
-                    
-                    # Check if file exists
-                    if not os.path.exists(file_path):
-                        self.send_error(404)
-                        return
-                    
-                    # Read file in binary mode for better performance
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
+                    since = parsedate_to_datetime(headers['if-modified-since']).timestamp()
+                except (KeyError, TypeError, ValueError):
+                    since = None
+                if since is not None and int(stat.st_mtime) <= since:
+                    await send_response(writer, 304, {}, keep_alive=keep_alive)
+                    return
+                
+                await send_response(writer, 200, {
+                    'Content-Type': mimetypes.guess_type(file_path)[0] or 'application/octet-stream',
+                    'Content-Length': str(stat.st_size),
+                    'Last-Modified': formatdate(stat.st_mtime, usegmt=True),
+                    'Cache-Control': 'no-cache'
+                }, keep_alive=keep_alive)
+                if not head_only and stat.st_size:
+                    # Zero-copy where the platform supports it; asyncio falls back to buffered reads otherwise
+                    await loop.sendfile(writer.transport, file)
+        
+        async def handle_connection(reader, writer):
+            """Serve HTTP/1.1 requests on one connection until it closes or goes idle"""
+            connections[asyncio.current_task()] = writer
+            try:
+                while True:
+                    try:
+                        request = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), DEV_SERVER_IDLE_TIMEOUT)
+                    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                        break
                     
-                    # Only inject if we find </body>
-                    if b'</body>' in content:
-                        # Inject live reload script
-                        live_reload_script = f'''<script>(function(){{const ws=new WebSocket('ws://localhost:{port + 1}');ws.onmessage=function(e){{if(e.data==='reload')window.location.reload();}};ws.onclose=function(){{setTimeout(()=>window.location.reload(),2000);}};}})();</script>'''.encode('utf-8')
-                        content = content.replace(b'</body>', live_reload_script + b'</body>')
+                    request_line, *header_lines = request.decode('latin-1').split('\r\n')
+                    headers = {}
+                    for line in header_lines:
+                        name, sep, value = line.partition(':')
+                        if sep:
+                            headers[name.strip().lower()] = value.strip()
                     
-                    # Send response
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/html; charset=utf-8')
-                    self.send_header('Content-Length', str(len(content)))
-                    self.end_headers()
-                    self.wfile.write(content)
+                    parts = request_line.split()
+                    if len(parts) != 3:
+                        await send_error(writer, 400, keep_alive=False)
+                        break
+                    method, target, version = parts
+                    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                    if method not in ('GET', 'HEAD'):
+                        await send_error(writer, 405, keep_alive=False)
+                        break
                     
-                except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
-                    # Silently handle connection errors
-                    pass
-                except Exception as e:
-                    # Fall back to default handler on error
-                    try:
-                        super().do_GET()
-                    except:
-                        pass
-            
-            def log_message(self, format, *args):
-                # Suppress HTTP server logs for cleaner output
+                    url = urlparse(target)
+                    if url.path == LIVE_RELOAD_PATH:
+                        await serve_reload_events(writer)
+                        break
+                    if url.path == LIVE_RELOAD_SCRIPT_PATH:
+                        await send_response(writer, 200, {
+                            'Content-Type': 'text/javascript; charset=utf-8',
+                            'Content-Length': str(len(live_reload_client)),
+                            'Cache-Control': 'no-cache'
+                        }, live_reload_client, method == 'HEAD', keep_alive)
+                        continue
+                    await serve_build_file(writer, url, headers, method == 'HEAD', keep_alive)
+                    if not keep_alive:
+                        break
+            except ConnectionError:
+                # Browsers drop connections freely (navigation, closed tabs)
                 pass
-            
-            def handle_one_request(self):
-                # Override to add better error handling
-                try:
-                    super().handle_one_request()
-                except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
-                    # Silently ignore connection errors
-                    self.close_connection = True
-                except Exception:
-                    self.close_connection = True
-        
-        # Start file watcher
-        event_handler = ChangeHandler()
-        observer = Observer()
-        
-        # Watch content, templates, static, and pages directories
-        watch_dirs = ['content', 'templates', 'static', 'pages']
-        for watch_dir in watch_dirs:
-            if os.path.exists(watch_dir):
-                observer.schedule(event_handler, watch_dir, recursive=True)
-                print(f"Watching {watch_dir}/ for changes...")
-        
-        observer.start()
+            except Exception as e:
+                print(f"Server error: {e}")
+            finally:
+                connections.pop(asyncio.current_task(), None)
+                writer.close()
         
-        # Start WebSocket server
-        async def start_websocket_server():
-            await websockets.serve(websocket_handler, "localhost", port + 1)
-            print(f"WebSocket server started on ws://localhost:{port + 1}")
-        
-        # Start WebSocket server in background
-        def run_websocket_server():
-            nonlocal websocket_loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            websocket_loop = loop
-            loop.run_until_complete(start_websocket_server())
-            loop.run_forever()
-        
-        websocket_thread = threading.Thread(target=run_websocket_server, daemon=True)
-        websocket_thread.start()
-        
-        # Store thread reference for cleanup
-        cleanup_threads = [websocket_thread]
-        
-        # Start HTTP server with threading for better performance
-        httpd = ThreadingHTTPServer(("localhost", port), LiveReloadHandler)
-        
-        # Global shutdown flag to prevent multiple shutdown attempts
-        shutdown_in_progress = False
-        
-        # Set up proper signal handling for graceful shutdown
-        def signal_handler(signum, frame):
-            nonlocal shutdown_in_progress
-            if shutdown_in_progress:
-                print("Force terminating...")
-                os._exit(1)
-                return
-                
-            shutdown_in_progress = True
-            print("\nShutting down server...")
-            
-            # Force exit after 1 second regardless
-            def force_exit():
-                time.sleep(1)
-                print("Force exiting...")
-                os._exit(1)
+        async def serve():
+            nonlocal loop
+            loop = asyncio.get_running_loop()
             
-            timeout_thread = threading.Thread(target=force_exit, daemon=True)
-            timeout_thread.start()
+            # Stop on Ctrl+C/SIGTERM; where signal handlers are unsupported (Windows), asyncio.run
+            # turns Ctrl+C into KeyboardInterrupt after cancelling this task
+            stop = asyncio.Event()
+            for signum in (signal.SIGINT, getattr(signal, 'SIGTERM', None)):
+                if signum is not None:
+                    try:
+                        loop.add_signal_handler(signum, stop.set)
+                    except (NotImplementedError, RuntimeError):
+                        pass
             
+            server = await asyncio.start_server(handle_connection, 'localhost', port)
+            print(f"Development server running at http://localhost:{port}/")
+            print("Press Ctrl+C to stop the server")
             try:
-                # Stop everything immediately
-                observer.stop()
-                httpd.shutdown()
-                httpd.server_close()
-                
-                # Don't wait for websocket cleanup
-                print("Server shutdown complete.")
-                
-            except Exception as e:
-                print(f"Error during shutdown: {e}")
+                await stop.wait()
             finally:
-                os._exit(0)
-        
-        # Register signal handlers for Ctrl+C (and re-register periodically)
-        def register_handlers():
-            signal.signal(signal.SIGINT, signal_handler)
-            if hasattr(signal, 'SIGTERM'):
-                signal.signal(signal.SIGTERM, signal_handler)
-        
-        register_handlers()
-        
-        # Simplified signal re-registration (less aggressive)
-        def reregister_signals():
-            while not shutdown_in_progress:
-                time.sleep(10)  # Re-register every 10 seconds
-                try:
-                    register_handlers()
-                except:
-                    pass
+                print("\nShutting down server...")
+                server.close()
+                # End event streams and close idle connections so every handler returns on its own
+                for queue in reload_clients:
+                    queue.put_nowait(None)
+                for writer in connections.values():
+                    writer.close()
+                await asyncio.gather(*connections, return_exceptions=True)
+                await server.wait_closed()
         
-        signal_thread = threading.Thread(target=reregister_signals, daemon=True)
-        signal_thread.start()
-        
-        print(f"Development server running at http://localhost:{port}/")
-        print("Press Ctrl+C to stop the server")
-        
-        # Run HTTP server in a separate thread to keep main thread free for signals
-        def run_server():
-            try:
-                httpd.serve_forever()
-            except Exception as e:
-                if not shutdown_in_progress:
-                    print(f"Server error: {e}")
-        
-        server_thread = threading.Thread(target=run_server, daemon=True)
-        server_thread.start()
+        # Start file watcher
+        scheduler = RebuildScheduler(rebuild_site)
+        scheduler.start()
+        observer = Observer()
+        watch_source_changes(observer, scheduler)
+        observer.start()
         
-        # Keep main thread alive and responsive to signals
         try:
-            while not shutdown_in_progress:
-                time.sleep(0.5)  # Check every 500ms
+            asyncio.run(serve())
         except KeyboardInterrupt:
-            print("\nKeyboardInterrupt caught in main thread")
-            signal_handler(signal.SIGINT, None)
-        
-        # Final cleanup
-        print("\nServer stopped.")
-        try:
-            observer.stop()
-            httpd.shutdown()
-            httpd.server_close()
-        except:
             pass
-        os._exit(0)
+        finally:
+            observer.stop()
+            observer.join()
+            # Let a rebuild in progress finish so the build manifest is not left half-written
+            scheduler.stop()
+            print("Server stopped.")
             
     except ImportError as e:
         print(f"[ERROR] Missing dependencies for development server: {e}")
-        print("Install with: pip install watchdog websockets")
+        print("Install with: pip install watchdog")
     except Exception as e:
         print(f"[ERROR] Failed to start development server: {e}")
 
@@ -5708,95 +6863,28 @@ def watch_and_rebuild(include_drafts=False, include_scheduled=False):
     try:
         import time
         from watchdog.observers import Observer
-        from watchdog.events import FileSystemEventHandler
         import os
         
         print("Starting file watcher...")
         
-        class ChangeHandler(FileSystemEventHandler):
-            def __init__(self):
-                self.last_rebuild = 0
-                self.rebuild_delay = 1  # Wait 1 second between rebuilds
-                self.include_drafts = include_drafts
-                self.include_scheduled = include_scheduled
-            
-            def on_modified(self, event):
-                if event.is_directory:
-                    return
-                
-                # Only rebuild for relevant file changes
-                if self.should_rebuild(event.src_path):
-                    current_time = time.time()
-                    if current_time - self.last_rebuild > self.rebuild_delay:
-                        self.last_rebuild = current_time
-                        self.rebuild_site(event.src_path)
-            
-            def should_rebuild(self, file_path):
-                """Check if file change should trigger rebuild"""
-                file_path = str(file_path).lower()
-                rebuild_extensions = {'.md', '.yaml', '.yml', '.css', '.js', '.html', '.jpg', '.jpeg', '.png', '.webp'}
-                rebuild_dirs = {'content', 'templates', 'static', 'pages'}
-                
-                # Ignore .git folder and its contents (handle both / and \ separators)
-                normalized_path = file_path.replace('/', os.sep).replace('\\', os.sep)
-                path_parts = normalized_path.split(os.sep)
-                if '.git' in path_parts or normalized_path.startswith('.git' + os.sep):
-                    return False
-                
-                # Ignore other system/build directories
-                ignore_patterns = ['__pycache__', '.vscode', 'build']
-                for pattern in ignore_patterns:
-                    if pattern in path_parts:
-                        return False
-                
-                # Check file extension
-                for ext in rebuild_extensions:
-                    if file_path.endswith(ext):
-                        break
-                else:
-                    return False
-                
-                # Check if in relevant directory
-                for dir_name in rebuild_dirs:
-                    if f'{os.sep}{dir_name}{os.sep}' in file_path or file_path.startswith(dir_name):
-                        return True
+        def rebuild_site(changed_files):
+            """Rebuild site using incremental rebuilds (runs on the scheduler's worker)"""
+            try:
+                print(f"{len(changed_files)} file change(s) detected, analyzing...")
                 
-                return False
-            
-            def rebuild_site(self, changed_file_path):
-                """Rebuild site using incremental rebuilds"""
-                try:
-                    print("File change detected, analyzing...")
-                    
-                    # Determine what needs to be rebuilt
-                    rebuild_info = determine_rebuild_scope(changed_file_path)
+                # Log which tasks depend on the changed files, then rebuild reusing unchanged tasks
+                rebuild_info = determine_rebuild_scope(changed_files)
+                perform_incremental_rebuild(rebuild_info, include_drafts=include_drafts, include_scheduled=include_scheduled)
+                print("Rebuild complete")
                     
-                    # Perform incremental rebuild
-                    success = perform_incremental_rebuild(rebuild_info, include_drafts=self.include_drafts, include_scheduled=self.include_scheduled)
-                    
-                    if success:
-                        print("Rebuild complete")
-                    else:
-                        print("Rebuild failed, falling back to full rebuild...")
-                        # Fallback to full rebuild if incremental failed
-                        os.makedirs(BUILD_DIR, exist_ok=True)
-                        build_site(include_drafts=self.include_drafts, include_scheduled=self.include_scheduled, no_epub=True, optimize_images=False)
-                        print("Full rebuild complete")
-                        
-                except Exception as e:
-                    print(f"Error rebuilding site: {e}")
+            except Exception as e:
+                print(f"Error rebuilding site: {e}")
         
-        # Start file watcher
-        event_handler = ChangeHandler()
+        # Start file watcher; a RebuildScheduler coalesces bursts of changes into one rebuild
+        scheduler = RebuildScheduler(rebuild_site)
+        scheduler.start()
         observer = Observer()
-        
-        # Watch content, templates, static, and pages directories
-        watch_dirs = ['content', 'templates', 'static', 'pages']
-        for watch_dir in watch_dirs:
-            if os.path.exists(watch_dir):
-                observer.schedule(event_handler, watch_dir, recursive=True)
-                print(f"Watching {watch_dir}/ for changes...")
-        
+        watch_source_changes(observer, scheduler)
         observer.start()
         
         print("File watcher started. Press Ctrl+C to stop.")
@@ -5808,6 +6896,7 @@ def watch_and_rebuild(include_drafts=False, include_scheduled=False):
             print("\nStopping file watcher...")
             observer.stop()
             observer.join()
+            scheduler.stop()
             
     except ImportError as e:
         print(f"[ERROR] Missing dependencies for file watching: {e}")
@@ -5841,12 +6930,32 @@ if __name__ == "__main__":
                         help='Convert images to WebP format during build')
     parser.add_argument('--no-minify', action='store_true',
                         help='Disable asset minification (HTML/CSS/JS) for debugging')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Render chapter pages and EPUBs, and run --check-links/--check-accessibility, with N worker processes (0 = one per CPU core)')
+    parser.add_argument('--precompile-templates', action='store_true',
+                        help='Compile all global and per-novel templates into the bytecode cache and exit')
+    parser.add_argument('--explain', metavar='PATH',
+                        help='Show which build tasks produce or depend on PATH and exit')
+    parser.add_argument('--profile', action='store_true',
+                        help='Write build phase and slowest task timings (build_profile.json, build_profile.md)')
+    parser.add_argument('--profile-pstats', action='store_true',
+                        help='Like --profile, and also dump cProfile statistics of the main process (build_profile.pstats)')
     args = parser.parse_args()
     
     # Handle --clean flag
     if args.clean:
         clean_build_directory()
     
+    # Handle --precompile-templates flag
+    if args.precompile_templates:
+        precompile_templates()
+        exit(0)
+    
+    # Handle --explain flag
+    if args.explain:
+        explain_build_path(args.explain)
+        exit(0)
+    
     # Handle --validate flag  
     if args.validate:
         validate_all_configs()
@@ -5854,43 +6963,68 @@ if __name__ == "__main__":
     
     # Handle --watch flag (watch and rebuild without server)
     if args.watch:
-        # Build site once first
+        # Build site once first, with the same settings as the rebuilds so the first change is incremental
         build_site(include_drafts=args.include_drafts, 
+                   include_scheduled=args.include_scheduled,
                    no_epub=True,  # Skip EPUB for faster rebuilds
-                   optimize_images=False)  # Skip optimization for speed
+                   optimize_images=False,  # Skip optimization for speed
+                   serve_mode=True,
+                   no_minify=True,
+                   jobs=args.jobs)
         # Start watching for changes
         watch_and_rebuild(include_drafts=args.include_drafts, include_scheduled=args.include_scheduled)
         exit(0)
     
     # Handle --serve flag (build, serve, and watch with live reload)
     if args.serve:
-        # Build site once first
+        # Build site once first, with the same settings as the rebuilds so the first change is incremental
         build_site(include_drafts=args.include_drafts, 
+                   include_scheduled=args.include_scheduled,
                    no_epub=True,  # Skip EPUB for faster rebuilds
-                   optimize_images=False)  # Skip optimization for speed
+                   optimize_images=False,  # Skip optimization for speed
+                   serve_mode=True,
+                   no_minify=True,
+                   jobs=args.jobs)
         # Start development server
         start_development_server(args.serve, include_drafts=args.include_drafts, include_scheduled=args.include_scheduled)
         exit(0)
     
     # Normal build mode
+    profiler = None
+    if args.profile_pstats:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    
     build_site(include_drafts=args.include_drafts,
                include_scheduled=args.include_scheduled,
                no_epub=args.no_epub,
                optimize_images=args.optimize_images,
-               no_minify=args.no_minify)
+               no_minify=args.no_minify,
+               jobs=args.jobs)
+    
+    # Write build timing report if requested
+    if profiler:
+        profiler.disable()
+    if args.profile or args.profile_pstats:
+        write_build_profile(profiler)
     
     # Generate statistics report if requested
     if args.stats:
         generate_stats_report()
     
+    # Parse the built pages once for all requested checks
+    checks = (['links'] if args.check_links else []) + (['alt_text'] if args.check_accessibility else [])
+    validation = validate_build(checks, args.jobs) if checks else None
+    
     # Check for broken links if requested
     if args.check_links:
-        check_broken_links()
+        check_broken_links(args.jobs, validation)
     
     # Check for accessibility issues if requested
     if args.check_accessibility:
         # Load site config for accessibility check
         site_config = load_site_config()
-        check_accessibility_issues(site_config)
+        check_accessibility_issues(site_config, args.jobs, validation)
 
 
@@ -0,0 +1,452 @@
+// Chapter page behaviour: reading settings, progress tracking and keyboard navigation.
+// Per-page values come from the inline #chapter-config JSON block.
+const chapterConfig = JSON.parse(document.getElementById('chapter-config').textContent);
+
+function jumpToChapter() {
+    const select = document.getElementById('chapter-select');
+    if (select.value) {
+        window.location.href = select.value;
+    }
+}
+
+// Reading settings functionality
+let currentTextSize = 100;
+let currentLineSpacing = 1.6;
+let autoScrollToContent = false;
+
+function loadReadingSettings() {
+    const savedTextSize = localStorage.getItem('readingTextSize');
+    const savedLineSpacing = localStorage.getItem('readingLineSpacing');
+    const savedAutoScroll = localStorage.getItem('autoScrollToContent');
+    
+    if (savedTextSize) {
+        currentTextSize = parseInt(savedTextSize);
+        applyTextSize();
+    }
+    
+    if (savedLineSpacing) {
+        currentLineSpacing = parseFloat(savedLineSpacing);
+        applyLineSpacing();
+    }
+    
+    if (savedAutoScroll !== null) {
+        autoScrollToContent = savedAutoScroll === 'true';
+        const checkbox = document.getElementById('auto-scroll-content');
+        if (checkbox) {
+            checkbox.checked = autoScrollToContent;
+        }
+    }
+    
+    updateDisplays();
+}
+
+function adjustTextSize(delta) {
+    currentTextSize = Math.max(70, Math.min(200, currentTextSize + (delta * 10)));
+    applyTextSize();
+    localStorage.setItem('readingTextSize', currentTextSize);
+    updateDisplays();
+}
+
+function adjustLineSpacing(delta) {
+    currentLineSpacing = Math.max(1.0, Math.min(3.0, currentLineSpacing + delta));
+    applyLineSpacing();
+    localStorage.setItem('readingLineSpacing', currentLineSpacing);
+    updateDisplays();
+}
+
+function applyTextSize() {
+    // Set CSS custom property on the root document for text size
+    document.documentElement.style.setProperty('--reading-font-size', (currentTextSize / 100) + 'rem');
+}
+
+function applyLineSpacing() {
+    // Set CSS custom property on the root document for line spacing
+    document.documentElement.style.setProperty('--reading-line-height', currentLineSpacing);
+}
+
+function updateDisplays() {
+    document.getElementById('text-size-display').textContent = currentTextSize + '%';
+    document.getElementById('line-spacing-display').textContent = currentLineSpacing.toFixed(1);
+}
+
+function toggleAutoScrollContent() {
+    const checkbox = document.getElementById('auto-scroll-content');
+    autoScrollToContent = checkbox.checked;
+    localStorage.setItem('autoScrollToContent', autoScrollToContent);
+}
+
+function resetReadingSettings() {
+    currentTextSize = 100;
+    currentLineSpacing = 1.6;
+    autoScrollToContent = false;
+    applyTextSize();
+    applyLineSpacing();
+    localStorage.removeItem('readingTextSize');
+    localStorage.removeItem('readingLineSpacing');
+    localStorage.removeItem('autoScrollToContent');
+    const checkbox = document.getElementById('auto-scroll-content');
+    if (checkbox) {
+        checkbox.checked = false;
+    }
+    updateDisplays();
+}
+
+// Handle scroll parameter on page load
+function handleScrollParameter() {
+    const urlParams = new URLSearchParams(window.location.search);
+    if (urlParams.get('scroll') === 'content') {
+        // Find the chapter content element and scroll to it
+        setTimeout(() => {
+            const contentElement = document.getElementById('chapter-content-wrapper');
+            if (contentElement) {
+                const offset = contentElement.offsetTop - 20; // 20px padding from top
+                window.scrollTo({
+                    top: offset,
+                    behavior: 'smooth'
+                });
+            }
+        }, 100); // Small delay to ensure page is loaded
+    }
+}
+
+// Load settings when page loads
+document.addEventListener('DOMContentLoaded', () => {
+    loadReadingSettings();
+    if (!chapterConfig.isMangaChapter) {
+        handleScrollParameter();
+    }
+});
+
+// Reading progress tracking
+function initReadingProgress() {
+    const novelSlug = chapterConfig.novelSlug;
+    const chapterId = chapterConfig.chapterId;
+    const chapterTitle = chapterConfig.chapterTitle;
+    
+    // Mark this chapter as visited
+    markChapterVisited(novelSlug, chapterId, chapterTitle);
+    
+    // Only set up scroll tracking for non-manga chapters
+    // Manga chapters use page-based completion tracking
+    if (!chapterConfig.isMangaChapter) {
+        setupScrollTracking(novelSlug, chapterId);
+    }
+}
+
+function markChapterVisited(novelSlug, chapterId, chapterTitle) {
+    const visitedKey = `visited_${novelSlug}`;
+    let visitedChapters = JSON.parse(localStorage.getItem(visitedKey) || '{}');
+    
+    visitedChapters[chapterId] = {
+        title: chapterTitle,
+        visitedAt: new Date().toISOString(),
+        completed: visitedChapters[chapterId]?.completed || false
+    };
+    
+    localStorage.setItem(visitedKey, JSON.stringify(visitedChapters));
+}
+
+function markChapterCompleted(novelSlug, chapterId) {
+    const visitedKey = `visited_${novelSlug}`;
+    let visitedChapters = JSON.parse(localStorage.getItem(visitedKey) || '{}');
+    
+    if (visitedChapters[chapterId]) {
+        visitedChapters[chapterId].completed = true;
+        visitedChapters[chapterId].completedAt = new Date().toISOString();
+        localStorage.setItem(visitedKey, JSON.stringify(visitedChapters));
+        
+        // Update latest chapter read
+        const latestKey = `latest_${novelSlug}`;
+        localStorage.setItem(latestKey, JSON.stringify({
+            chapterId: chapterId,
+            title: visitedChapters[chapterId].title,
+            completedAt: visitedChapters[chapterId].completedAt
+        }));
+    }
+}
+
+function setupScrollTracking(novelSlug, chapterId) {
+    let hasScrolledToEnd = false;
+    
+    function checkScrollProgress() {
+        if (hasScrolledToEnd) return;
+        
+        const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
+        const windowHeight = window.innerHeight;
+        const documentHeight = document.documentElement.scrollHeight;
+        
+        // Try to find meaningful completion points
+        let completionPoint = documentHeight - 200; // Default fallback
+        
+        // Check if comments section exists - completion point is when comments are visible
+        const commentsSection = document.querySelector('.comments-section, #utterances-container, [data-repo]');
+        if (commentsSection) {
+            const commentsTop = commentsSection.getBoundingClientRect().top + scrollTop;
+            completionPoint = Math.min(commentsTop - windowHeight * 0.3, completionPoint);
+        }
+        
+        // Check if footer exists - completion point is when footer is visible  
+        const footer = document.querySelector('footer');
+        if (footer) {
+            const footerTop = footer.getBoundingClientRect().top + scrollTop;
+            completionPoint = Math.min(footerTop - windowHeight * 0.5, completionPoint);
+        }
+        
+        // Check if chapter content wrapper exists - completion point is shortly after content ends
+        const contentWrapper = document.querySelector('#chapter-content-wrapper, .chapter-content');
+        if (contentWrapper) {
+            const contentBottom = contentWrapper.getBoundingClientRect().bottom + scrollTop;
+            completionPoint = Math.min(contentBottom + 100, completionPoint);
+        }
+        
+        // Consider chapter "completed" when user scrolls past the main content
+        const scrolledToEnd = (scrollTop + windowHeight) >= completionPoint;
+        
+        if (scrolledToEnd) {
+            hasScrolledToEnd = true;
+            console.log('Chapter marked as completed - reached content end');
+            markChapterCompleted(novelSlug, chapterId);
+        }
+    }
+    
+    window.addEventListener('scroll', checkScrollProgress);
+    window.addEventListener('resize', checkScrollProgress);
+    
+    // Also check on load in case content is short
+    setTimeout(checkScrollProgress, 1000);
+    
+    // Handle chapter navigation links
+    const chapterLinks = document.querySelectorAll('nav a[href*="../"]:not([href*="toc"]), .chapter-nav a[href*="../"]:not([href*="toc"])');
+    chapterLinks.forEach(link => {
+        const linkText = link.textContent.toLowerCase();
+        const isNextChapter = linkText.includes('next') || (linkText.includes('chapter') && !linkText.includes('previous') && !linkText.includes('prev'));
+        const isPrevChapter = linkText.includes('prev') || linkText.includes('previous');
+        
+        if (isNextChapter || isPrevChapter) {
+            link.addEventListener('click', (e) => {
+                // Mark as completed if clicking next chapter
+                if (isNextChapter) {
+                    console.log('Chapter marked as completed - clicked next chapter');
+                    markChapterCompleted(novelSlug, chapterId);
+                }
+                
+                // Add scroll parameter if auto-scroll is enabled
+                const autoScroll = localStorage.getItem('autoScrollToContent');
+                if (autoScroll === 'true') {
+                    e.preventDefault();
+                    const url = new URL(link.href, window.location.href);
+                    url.searchParams.set('scroll', 'content');
+                    window.location.href = url.toString();
+                }
+            });
+        }
+    });
+}
+
+// Initialize reading progress tracking
+document.addEventListener('DOMContentLoaded', initReadingProgress);
+
+// Keyboard navigation support
+function initKeyboardNavigation() {
+    document.addEventListener('keydown', function(e) {
+        // Skip keyboard navigation for manga chapters - they have their own handlers
+        if (chapterConfig.manga) {
+            return; // This is a manga chapter, don't use text navigation
+        }
+        
+        // Skip if user is typing in an input field
+        if (e.target.tagName === 'INPUT' || e.target.tagName === 'TEXTAREA' || e.target.tagName === 'SELECT') {
+            return;
+        }
+        
+        // Skip if any modifier keys are pressed (except Shift for some cases)
+        if (e.ctrlKey || e.metaKey || e.altKey) {
+            return;
+        }
+        
+        switch(e.key) {
+            case 'ArrowLeft':
+            case 'h':
+                // Previous chapter
+                if (chapterConfig.prevChapterId) {
+                    const prevLink = document.querySelector(`nav.chapter-nav a[href*="${chapterConfig.prevChapterId}"]`);
+                    if (prevLink) {
+                        let url = prevLink.href;
+                        // Add scroll parameter if auto-scroll is enabled
+                        const autoScroll = localStorage.getItem('autoScrollToContent');
+                        if (autoScroll === 'true') {
+                            const urlObj = new URL(url, window.location.href);
+                            urlObj.searchParams.set('scroll', 'content');
+                            url = urlObj.toString();
+                        }
+                        window.location.href = url;
+                    }
+                }
+                e.preventDefault();
+                break;
+                
+            case 'ArrowRight':
+            case 'l':
+                // Next chapter
+                if (chapterConfig.nextChapterId) {
+                    const nextLink = document.querySelector(`nav.chapter-nav a[href*="${chapterConfig.nextChapterId}"]`);
+                    if (nextLink) {
+                        let url = nextLink.href;
+                        // Add scroll parameter if auto-scroll is enabled
+                        const autoScroll = localStorage.getItem('autoScrollToContent');
+                        if (autoScroll === 'true') {
+                            const urlObj = new URL(url, window.location.href);
+                            urlObj.searchParams.set('scroll', 'content');
+                            url = urlObj.toString();
+                        }
+                        window.location.href = url;
+                    }
+                }
+                e.preventDefault();
+                break;
+                
+            case 'ArrowUp':
+            case 'k':
+                // Scroll up
+                window.scrollBy(0, -100);
+                e.preventDefault();
+                break;
+                
+            case 'ArrowDown':
+            case 'j':
+                // Scroll down
+                window.scrollBy(0, 100);
+                e.preventDefault();
+                break;
+                
+            case 'Home':
+            case 'g':
+                // Go to top
+                window.scrollTo(0, 0);
+                e.preventDefault();
+                break;
+                
+            case 'End':
+            case 'G':
+                // Go to bottom
+                window.scrollTo(0, document.body.scrollHeight);
+                e.preventDefault();
+                break;
+                
+            case 't':
+                // Go to table of contents
+                const tocLink = document.querySelector('nav.chapter-nav a[href*="toc"]');
+                if (tocLink) {
+                    window.location.href = tocLink.href;
+                }
+                e.preventDefault();
+                break;
+                
+            case '=':
+            case '+':
+                // Increase text size
+                adjustTextSize(1);
+                e.preventDefault();
+                break;
+                
+            case '-':
+                // Decrease text size
+                adjustTextSize(-1);
+                e.preventDefault();
+                break;
+                
+            case '0':
+                // Reset reading settings
+                resetReadingSettings();
+                e.preventDefault();
+                break;
+                
+            case '?':
+                // Show help modal
+                showKeyboardHelp();
+                e.preventDefault();
+                break;
+        }
+    });
+}
+
+function showKeyboardHelp() {
+    const existingModal = document.getElementById('keyboard-help-modal');
+    if (existingModal) {
+        existingModal.style.display = 'block';
+        existingModal.querySelector('.help-close').focus();
+        return;
+    }
+    
+    const modal = document.createElement('div');
+    modal.id = 'keyboard-help-modal';
+    modal.className = 'keyboard-help-modal';
+    modal.innerHTML = `
+        <div class="help-content">
+            <div class="help-header">
+                <h3>Keyboard Shortcuts</h3>
+                <button class="help-close" aria-label="Close help">&times;</button>
+            </div>
+            <div class="help-body">
+                <div class="help-section">
+                    <h4>Navigation</h4>
+                    <ul>
+                        <li><kbd>←</kbd> or <kbd>h</kbd> - Previous chapter</li>
+                        <li><kbd>→</kbd> or <kbd>l</kbd> - Next chapter</li>
+                        <li><kbd>t</kbd> - Table of contents</li>
+                    </ul>
+                </div>
+                <div class="help-section">
+                    <h4>Scrolling</h4>
+                    <ul>
+                        <li><kbd>↑</kbd> or <kbd>k</kbd> - Scroll up</li>
+                        <li><kbd>↓</kbd> or <kbd>j</kbd> - Scroll down</li>
+                        <li><kbd>Home</kbd> or <kbd>g</kbd> - Go to top</li>
+                        <li><kbd>End</kbd> or <kbd>G</kbd> - Go to bottom</li>
+                    </ul>
+                </div>
+                <div class="help-section">
+                    <h4>Reading Settings</h4>
+                    <ul>
+                        <li><kbd>+</kbd> or <kbd>=</kbd> - Increase text size</li>
+                        <li><kbd>-</kbd> - Decrease text size</li>
+                        <li><kbd>0</kbd> - Reset all settings</li>
+                    </ul>
+                </div>
+                <div class="help-section">
+                    <h4>Help</h4>
+                    <ul>
+                        <li><kbd>?</kbd> - Show this help</li>
+                        <li><kbd>Esc</kbd> - Close help/modals</li>
+                    </ul>
+                </div>
+            </div>
+        </div>
+        <div class="help-overlay"></div>
+    `;
+    
+    document.body.appendChild(modal);
+    
+    // Focus the close button
+    const closeBtn = modal.querySelector('.help-close');
+    closeBtn.focus();
+    
+    // Close handlers
+    closeBtn.addEventListener('click', () => {
+        document.body.removeChild(modal);
+    });
+    
+    modal.querySelector('.help-overlay').addEventListener('click', () => {
+        document.body.removeChild(modal);
+    });
+    
+    document.addEventListener('keydown', function escHandler(e) {
+        if (e.key === 'Escape') {
+            document.body.removeChild(modal);
+            document.removeEventListener('keydown', escHandler);
+        }
+    });
+}
+
+// Initialize keyboard navigation
+document.addEventListener('DOMContentLoaded', initKeyboardNavigation);
@@ -0,0 +1,75 @@
+"""Placing source files into the build directory with emit_file"""
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import generate
+
+SOURCE_BYTES = b'\x89PNG page image' * 512
+
+
+class EmitFileTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.original_build_dir = generate.BUILD_DIR
+        self.original_mode = generate._asset_emission_settings['mode']
+        generate.BUILD_DIR = os.path.join(self.root.name, 'build')
+        os.makedirs(generate.BUILD_DIR)
+        self.source = os.path.join(self.root.name, 'page01.png')
+        with open(self.source, 'wb') as f:
+            f.write(SOURCE_BYTES)
+        self.dest = os.path.join(generate.BUILD_DIR, 'page01.png')
+        generate.reset_output_writes()
+
+    def tearDown(self):
+        generate.BUILD_DIR = self.original_build_dir
+        generate._asset_emission_settings['mode'] = self.original_mode
+        self.root.cleanup()
+
+    def read(self, path):
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_links_new_destination(self):
+        generate.emit_file(self.source, self.dest)
+        self.assertTrue(os.path.samefile(self.source, self.dest))
+        generate.emit_file(self.source, self.dest)
+        self.assertEqual(generate._output_write_stats['unchanged'], 1)
+
+    def test_replacing_a_hardlink_leaves_its_source_alone(self):
+        other = os.path.join(self.root.name, 'other.png')
+        with open(other, 'wb') as f:
+            f.write(b'another image')
+        os.link(other, self.dest)
+        for mode in generate.ASSET_EMISSION_MODES:
+            generate._asset_emission_settings['mode'] = mode
+            generate.emit_file(self.source, self.dest)
+            self.assertEqual(self.read(self.dest), SOURCE_BYTES)
+            self.assertEqual(self.read(other), b'another image')
+            os.remove(self.dest)
+            os.link(other, self.dest)
+
+    def test_concurrent_emitters_never_truncate_the_source(self):
+        # en and jp renders of an untranslated chapter emit the same images at the same time
+        def emit(barrier):
+            barrier.wait()
+            generate.emit_file(self.source, self.dest)
+
+        for _ in range(100):
+            barrier = threading.Barrier(4)
+            threads = [threading.Thread(target=emit, args=(barrier,)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(self.read(self.source), SOURCE_BYTES)
+            self.assertEqual(self.read(self.dest), SOURCE_BYTES)
+            os.remove(self.dest)
+        self.assertEqual([name for name in os.listdir(generate.BUILD_DIR) if name.endswith('.tmp')], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
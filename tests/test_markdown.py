@@ -0,0 +1,51 @@
+"""Markdown conversion with the pooled converter and HTML cache"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import generate
+
+
+class ConvertMarkdownTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.original_cache_dir = generate.MARKDOWN_CACHE_DIR
+        generate.MARKDOWN_CACHE_DIR = self.cache_dir.name
+
+    def tearDown(self):
+        generate.MARKDOWN_CACHE_DIR = self.original_cache_dir
+        self.cache_dir.cleanup()
+
+    def test_abbreviations_do_not_leak_into_later_documents(self):
+        first = generate.convert_markdown_to_html("*[HTML]: Hyper Text\n\nSome HTML here")
+        self.assertIn('<abbr title="Hyper Text">HTML</abbr>', first)
+        second = generate.convert_markdown_to_html("More HTML later")
+        self.assertNotIn('<abbr', second)
+
+    def test_footnotes_do_not_leak_into_later_documents(self):
+        generate.convert_markdown_to_html("Note[^1]\n\n[^1]: A footnote")
+        self.assertNotIn('footnote', generate.convert_markdown_to_html("Plain text"))
+
+    def test_cached_html_matches_conversion(self):
+        source = "A *chapter*\nwith a line break"
+        converted = generate.convert_markdown_to_html(source)
+        hits = generate._markdown_cache_stats['hits']
+        self.assertEqual(generate.convert_markdown_to_html(source), converted)
+        self.assertEqual(generate._markdown_cache_stats['hits'], hits + 1)
+
+    def test_cache_hit_keeps_entry_from_being_pruned(self):
+        source = "An old but popular chapter"
+        generate.convert_markdown_to_html(source)
+        cache_file = generate.markdown_cache_path(source)
+        stale = time.time() - (generate.MARKDOWN_CACHE_MAX_AGE_DAYS + 1) * 86400
+        os.utime(cache_file, (stale, stale))
+        generate.convert_markdown_to_html(source)
+        generate.prune_markdown_cache()
+        self.assertTrue(os.path.exists(cache_file))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+"""Development server output store and the changes it reports for live reload"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import generate
+
+PAGE = b"""<html><head><title>%(title)s</title><link rel="stylesheet" href="/static/style-%(hash)s.css"></head><body>
+<nav><a href="../chapter-2/">Next Chapter</a></nav>
+<div id="chapter-content-wrapper" class="chapter-content">
+<div class="note">%(text)s</div>
+</div>
+<nav class="chapter-nav-after-content">%(nav)s</nav>
+</body></html>"""
+
+
+def page(text=b'Chapter text', title=b'Chapter 1', nav=b'Table of Contents', asset_hash=b'0123abcd'):
+    return PAGE % {b'title': title, b'text': text, b'nav': nav, b'hash': asset_hash}
+
+
+class ServedOutputChangesTest(unittest.TestCase):
+    def setUp(self):
+        generate.enable_served_outputs()
+        generate.take_served_changes()
+        self.path = os.path.join(generate.BUILD_DIR, 'novel', 'en', 'chapter-1', 'index.html')
+        generate.publish_served_output(self.path, page(), track_change=False)
+
+    def tearDown(self):
+        generate._served_outputs = None
+        generate.take_served_changes()
+
+    def test_chapter_text_change_is_body_only(self):
+        generate.publish_served_output(self.path, page(text=b'Edited text'))
+        key = 'novel/en/chapter-1/index.html'
+        self.assertEqual(generate.take_served_changes(), {'paths': [key], 'body_only': [key]})
+
+    def test_change_outside_wrapper_needs_reload(self):
+        for changed in (page(title=b'Renamed'), page(nav=b'Previous Chapter')):
+            generate.publish_served_output(self.path, changed)
+            self.assertEqual(generate.take_served_changes()['body_only'], [])
+
+    def test_frame_change_earlier_in_the_batch_is_kept(self):
+        generate.publish_served_output(self.path, page(title=b'Renamed'))
+        generate.publish_served_output(self.path, page(title=b'Renamed', text=b'Edited text'))
+        changes = generate.take_served_changes()
+        self.assertEqual((len(changes['paths']), changes['body_only']), (1, []))
+
+    def test_asset_hash_change_is_not_a_page_change(self):
+        generate.publish_served_output(self.path, page(asset_hash=b'deadbeef'))
+        self.assertEqual(generate.take_served_changes(), {'paths': [], 'body_only': []})
+
+    def test_page_without_wrapper_has_no_frame_digest(self):
+        self.assertIsNone(generate.page_frame_digest(b'<html><body><p>Table of contents</p></body></html>'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Webring fetching against a local http.server stand-in for remote RSS feeds"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import generate
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Chapter 1</title><link>https://example.com/1</link><pubDate>Mon, 01 Jan 2024 00:00:00 +0000</pubDate></item>
+</channel></rss>"""
+FEED_ETAG = '"feed-v1"'
+SLOW_SECONDS = 3
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """/feed.xml answers with ETag/304, /slow.xml hangs, /broken.xml fails"""
+    requests = []
+    broken = False
+
+    def do_GET(self):
+        FeedHandler.requests.append((self.path, self.headers.get('If-None-Match')))
+        if self.path.startswith('/slow.xml'):
+            time.sleep(SLOW_SECONDS)
+        if self.path == '/broken.xml' or (self.path == '/feed.xml' and FeedHandler.broken):
+            self.send_response(500)
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == FEED_ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('ETag', FEED_ETAG)
+        self.send_header('Content-Length', str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FeedServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Slow feeds answer after the client gave up at the deadline
+        pass
+
+
+class WebringFetchTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = FeedServer(('localhost', 0), FeedHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://localhost:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.original_cache_dir = generate.WEBRING_CACHE_DIR
+        generate.WEBRING_CACHE_DIR = self.cache_dir.name
+        FeedHandler.requests = []
+        FeedHandler.broken = False
+
+    def tearDown(self):
+        generate.WEBRING_CACHE_DIR = self.original_cache_dir
+        self.cache_dir.cleanup()
+
+    def site(self, path, name='Site'):
+        return {'name': name, 'url': self.base_url, 'rss': self.base_url + path}
+
+    def test_not_modified_reuses_cached_items(self):
+        site = self.site('/feed.xml')
+        items, lines, status = generate.fetch_webring_site(site, 0, 5)
+        self.assertEqual(status, 'fetched')
+        self.assertEqual(len(items), 1)
+
+        items, lines, status = generate.fetch_webring_site(site, 0, 5)
+        self.assertEqual(status, 'fetched')
+        self.assertEqual([item['title'] for item in items], ['Chapter 1'])
+        self.assertTrue(any('Not modified' in line for line in lines))
+        self.assertEqual(FeedHandler.requests[-1], ('/feed.xml', FEED_ETAG))
+
+    def test_fresh_cache_skips_request(self):
+        site = self.site('/feed.xml')
+        generate.fetch_webring_site(site, 3600, 5)
+        items, lines, status = generate.fetch_webring_site(site, 3600, 5)
+        self.assertEqual(status, 'cached')
+        self.assertEqual(len(FeedHandler.requests), 1)
+
+    def test_failed_fetch_falls_back_to_stale_items(self):
+        site = self.site('/feed.xml')
+        generate.fetch_webring_site(site, 0, 5)
+        FeedHandler.broken = True
+        items, lines, status = generate.fetch_webring_site(site, 0, 5)
+        self.assertEqual(status, 'stale')
+        self.assertEqual(len(items), 1)
+
+    def test_failed_fetch_without_cache(self):
+        items, lines, status = generate.fetch_webring_site(self.site('/broken.xml'), 0, 5)
+        self.assertEqual((items, status), ([], 'failed'))
+
+    def test_deadline_stops_waiting_for_slow_feed(self):
+        config = {'enabled': True, 'fetch_timeout': 1, 'cache_duration': 0,
+                  'sites': [self.site('/feed.xml', 'Fast'), self.site('/slow.xml', 'Slow')]}
+        start = time.monotonic()
+        items = generate.generate_webring_data(config, {})
+        self.assertLess(time.monotonic() - start, SLOW_SECONDS)
+        self.assertEqual([item['site_name'] for item in items], ['Fast'])
+
+    def test_deadline_uses_stale_items_for_slow_feed(self):
+        site = self.site('/slow.xml', 'Slow')
+        generate.save_webring_cache_entry(site['rss'], {}, generate.parse_rss_items(
+            generate.BeautifulSoup(FEED, 'xml'), 'Slow', site['url']), 0)
+        config = {'enabled': True, 'fetch_timeout': 1, 'cache_duration': 0, 'sites': [site]}
+        items = generate.generate_webring_data(config, {})
+        self.assertEqual([item['title'] for item in items], ['Chapter 1'])
+
+    def test_more_feeds_than_workers_past_deadline(self):
+        # The second feed is still queued (and cancelled) when the deadline passes
+        config = {'enabled': True, 'fetch_timeout': 1, 'cache_duration': 0, 'max_concurrent_fetches': 1,
+                  'sites': [self.site('/slow.xml', 'Slow 1'), self.site('/slow.xml?2', 'Slow 2')]}
+        items = generate.generate_webring_data(config, {})
+        self.assertEqual(items, [])
+
+
+if __name__ == '__main__':
+    unittest.main()